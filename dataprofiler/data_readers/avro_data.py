@@ -1,3 +1,5 @@
+from itertools import islice
+
 import fastavro
 
 from . import data_utils
@@ -55,6 +57,23 @@ class AVROData(JSONData, BaseData):
             self._original_df_dtypes = original_df_dtypes
             return df
 
+    def _iter_chunks_from_file(self, input_file_path, chunk_size):
+        """Yields the data from the file in chunks of at most chunk_size."""
+        with open(input_file_path, "rb") as input_file:
+            # the records are decoded block by block by the reader, hence only
+            # the records of the current chunk are held in memory
+            df_reader = fastavro.reader(input_file)
+            while True:
+                lines = list(islice(df_reader, chunk_size))
+                if not lines:
+                    break
+                df, _ = data_utils.json_to_dataframe(
+                    json_lines=lines,
+                    selected_columns=self.selected_keys,
+                    read_in_string=True
+                )
+                yield df
+
     @classmethod
     def is_match(cls, file_path, options=None):
         """
@@ -333,8 +333,8 @@ class CSVData(SpreadSheetDataMixin, BaseData):
             read_in_string=True
         )
 
-    def _load_data_from_file(self, input_file_path):
-        """Loads the data into memory from the file."""
+    def _detect_file_options(self, input_file_path):
+        """Detects the encoding, delimiter and header of the file."""
         self._file_encoding = data_utils.detect_file_encoding(input_file_path)        
         if not self._delimiter or not self._checked_header:
             with open(input_file_path, encoding=self.file_encoding) as csvfile:
@@ -361,6 +361,9 @@ class CSVData(SpreadSheetDataMixin, BaseData):
                 if count_delimiter_last == num_lines_read:
                     self._delimiter = None
 
+    def _load_data_from_file(self, input_file_path):
+        """Loads the data into memory from the file."""
+        self._detect_file_options(input_file_path)
         return data_utils.read_csv_df(
             input_file_path,
             self.delimiter, self.header, self.selected_columns,
@@ -368,6 +371,16 @@ class CSVData(SpreadSheetDataMixin, BaseData):
             encoding=self.file_encoding
         )
 
+    def _iter_chunks_from_file(self, input_file_path, chunk_size):
+        """Yields the data from the file in chunks of at most chunk_size."""
+        self._detect_file_options(input_file_path)
+        return data_utils.read_csv_df_chunks(
+            input_file_path,
+            self.delimiter, self.header, chunk_size, self.selected_columns,
+            read_in_string=True,
+            encoding=self.file_encoding
+        )
+
     def _get_data_as_records(self, data):
         sep = self.delimiter if self.delimiter else self._default_delimiter
         data = data.to_csv(sep=sep, index=False)
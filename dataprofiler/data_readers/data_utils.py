@@ -178,13 +178,11 @@ def read_json_df(data_generator, selected_columns=None, read_in_string=False):
     return json_to_dataframe(lines, selected_columns, read_in_string)
 
 
-def read_csv_df(file_path, delimiter, header, selected_columns=[],
-                read_in_string=False, encoding='utf-8'):
+def _get_read_csv_args(delimiter, header, selected_columns=None,
+                       read_in_string=False, encoding='utf-8'):
     """
-    Reads a CSV file in chunks and returns a dataframe in the form of iterator.
-    
-    :param file_path: path to the CSV file.
-    :type file_path: str
+    Creates the arguments sent to `pd.read_csv` when reading a CSV file.
+
     :param delimiter: character used to separate csv values.
     :type delimiter: str
     :param header: the header row in the csv file.
@@ -194,13 +192,14 @@ def read_csv_df(file_path, delimiter, header, selected_columns=[],
     :param read_in_string: if True, all the values in dataframe will be
         converted to string
     :type read_in_string: bool
-    :return: Iterator
-    :rtype: pd.DataFrame
+    :param encoding: encoding of the CSV file.
+    :type encoding: str
+    :return: arguments for `pd.read_csv`
+    :rtype: dict
     """
     args = {
         'delimiter': delimiter,
         'header': header,
-        'iterator': True,
         'dtype': 'object',
         'keep_default_na': False,
         'encoding': encoding
@@ -209,14 +208,98 @@ def read_csv_df(file_path, delimiter, header, selected_columns=[],
     if read_in_string:
         args['dtype'] = str
 
-    if len(selected_columns) > 0:
+    if selected_columns:
         args['usecols'] = selected_columns
+    return args
+
+
+def read_csv_df(file_path, delimiter, header, selected_columns=[],
+                read_in_string=False, encoding='utf-8'):
+    """
+    Reads a CSV file in chunks and returns a dataframe in the form of iterator.
+    
+    :param file_path: path to the CSV file.
+    :type file_path: str
+    :param delimiter: character used to separate csv values.
+    :type delimiter: str
+    :param header: the header row in the csv file.
+    :type header: int
+    :param selected_columns: a list of columns to be processed
+    :type selected_columns: list(str)
+    :param read_in_string: if True, all the values in dataframe will be
+        converted to string
+    :type read_in_string: bool
+    :return: Iterator
+    :rtype: pd.DataFrame
+    """
+    args = _get_read_csv_args(delimiter, header, selected_columns,
+                              read_in_string, encoding)
+    args['iterator'] = True
     fo = pd.read_csv(file_path, **args)
     data = fo.read()
     fo.close()
     return data
 
 
+def read_csv_df_chunks(file_path, delimiter, header, chunk_size,
+                       selected_columns=None, read_in_string=False,
+                       encoding='utf-8'):
+    """
+    Reads a CSV file and yields it as dataframes of at most `chunk_size` rows,
+    such that only one chunk of the file is held in memory at a time.
+
+    :param file_path: path to the CSV file.
+    :type file_path: str
+    :param delimiter: character used to separate csv values.
+    :type delimiter: str
+    :param header: the header row in the csv file.
+    :type header: int
+    :param chunk_size: max number of rows in each chunk
+    :type chunk_size: int
+    :param selected_columns: a list of columns to be processed
+    :type selected_columns: list(str)
+    :param read_in_string: if True, all the values in dataframe will be
+        converted to string
+    :type read_in_string: bool
+    :param encoding: encoding of the CSV file.
+    :type encoding: str
+    :return: chunks of the CSV file
+    :rtype: Iterator(pd.DataFrame)
+    """
+    args = _get_read_csv_args(delimiter, header, selected_columns,
+                              read_in_string, encoding)
+    args['chunksize'] = chunk_size
+    reader = pd.read_csv(file_path, **args)
+    try:
+        for data in reader:
+            yield data
+    finally:
+        reader.close()
+
+
+def _clean_parquet_unicode_columns(data_row_df):
+    """
+    Converts all the unicode and mixed columns of a parquet row group to utf-8.
+
+    :param data_row_df: data read from a parquet file
+    :type data_row_df: pd.DataFrame
+    :return: the cleaned data
+    :rtype: pd.DataFrame
+    """
+    types = data_row_df.apply(lambda x: pd.api.types.infer_dtype(
+                                            x.values, skipna=True))
+
+    mixed_and_unicode_cols = types[types == 'unicode'] \
+        .index.union(types[types == 'mixed'].index)
+
+    for col in mixed_and_unicode_cols:
+        data_row_df[col] = data_row_df[col].apply(
+            lambda x: x.encode('utf-8').strip() if isinstance(x, str) else x)
+        data_row_df[col] = data_row_df[col].apply(
+            lambda x: x.decode('utf-8').strip() if isinstance(x, bytes) else x)
+    return data_row_df
+
+
 def read_parquet_df(file_path, selected_columns=None, read_in_string=False):
     """
     Returns an iterator that returns one row group each time.
@@ -232,19 +315,7 @@ def read_parquet_df(file_path, selected_columns=None, read_in_string=False):
     for i in range(parquet_file.num_row_groups):
 
         data_row_df = parquet_file.read_row_group(i).to_pandas()
-
-        # Convert all the unicode columns to utf-8
-        types = data_row_df.apply(lambda x: pd.api.types.infer_dtype(
-                                                x.values, skipna=True))
-
-        mixed_and_unicode_cols = types[types == 'unicode'] \
-            .index.union(types[types == 'mixed'].index)
-
-        for col in mixed_and_unicode_cols:
-            data_row_df[col] = data_row_df[col].apply(
-                lambda x: x.encode('utf-8').strip() if isinstance(x, str) else x)
-            data_row_df[col] = data_row_df[col].apply(
-                lambda x: x.decode('utf-8').strip() if isinstance(x, bytes) else x)
+        data_row_df = _clean_parquet_unicode_columns(data_row_df)
 
         if selected_columns:
             data_row_df = data_row_df[selected_columns]
@@ -258,6 +329,39 @@ def read_parquet_df(file_path, selected_columns=None, read_in_string=False):
     return data, original_df_dtypes
 
 
+def read_parquet_df_chunks(file_path, chunk_size, selected_columns=None,
+                           read_in_string=False):
+    """
+    Reads a Parquet file row group by row group and yields it as dataframes of
+    at most `chunk_size` rows, such that only one row group of the file is
+    held in memory at a time.
+
+    :param file_path: path to the Parquet file.
+    :type file_path: str
+    :param chunk_size: max number of rows in each chunk
+    :type chunk_size: int
+    :param selected_columns: a list of columns to be processed
+    :type selected_columns: list(str)
+    :param read_in_string: if True, all the values in dataframe will be
+        converted to string
+    :type read_in_string: bool
+    :return: chunks of the Parquet file
+    :rtype: Iterator(pd.DataFrame)
+    """
+    parquet_file = pq.ParquetFile(file_path)
+    for i in range(parquet_file.num_row_groups):
+        row_group = parquet_file.read_row_group(
+            i, columns=selected_columns or None)
+        # the row group is sliced without copying, hence only each chunk is
+        # converted to a dataframe
+        for offset in range(0, row_group.num_rows, chunk_size):
+            data = row_group.slice(offset, chunk_size).to_pandas()
+            data = _clean_parquet_unicode_columns(data)
+            if read_in_string:
+                data = data.astype(str)
+            yield data
+
+
 def read_text_as_list_of_strs(file_path):
     """
     Returns a list of strings relative to the chunk size. Each line is 1 chunk.
@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from itertools import islice
 import json
 
 import numpy as np
@@ -127,6 +128,48 @@ class JSONData(SpreadSheetDataMixin, BaseData):
             self._original_df_dtypes = original_df_dtypes
             return data
 
+    def _iter_chunks_from_file(self, input_file_path, chunk_size):
+        """
+        Yields the data from the file in chunks of at most chunk_size. Only
+        JSON lines files are read one chunk at a time, any other JSON file is
+        loaded into memory before being split into chunks.
+
+        :param input_file_path: file path to file being loaded.
+        :type input_file_path: str
+        :param chunk_size: max number of rows in each chunk
+        :type chunk_size: int
+        :return: chunks of the data
+        :rtype: Iterator(pd.DataFrame)
+        """
+        self._file_encoding = data_utils.detect_file_encoding(input_file_path)
+        with open(input_file_path, encoding=self.file_encoding) as input_file:
+            first_line = ''
+            for first_line in input_file:
+                if first_line.strip():
+                    break
+            try:
+                is_json_lines = isinstance(json.loads(first_line), dict)
+            except ValueError:
+                is_json_lines = False
+
+            if not is_json_lines:
+                data = self._load_data_from_file(input_file_path)
+                for i in range(0, len(data), chunk_size):
+                    yield data.iloc[i:i + chunk_size]
+                return
+
+            input_file.seek(0)
+            while True:
+                lines = list(islice(input_file, chunk_size))
+                if not lines:
+                    break
+                data, _ = data_utils.read_json_df(
+                    data_generator=data_utils.data_generator(lines),
+                    selected_columns=self.selected_keys,
+                    read_in_string=False
+                )
+                yield data
+
     def _get_data_as_records(self, data):
         data = data.to_dict(orient="records", into=OrderedDict)
         for i, sample in enumerate(data):
@@ -78,6 +78,15 @@ class ParquetData(SpreadSheetDataMixin, BaseData):
         self._original_df_dtypes = original_df_dtypes
         return data
 
+    def _iter_chunks_from_file(self, input_file_path, chunk_size):
+        """Yields the data from the file in chunks of at most chunk_size."""
+        return data_utils.read_parquet_df_chunks(
+            input_file_path,
+            chunk_size,
+            self.selected_columns,
+            read_in_string=True
+        )
+
     def _get_data_as_records(self, data):
         # split into row samples separate by `\n`
         data = data.to_json(orient="records", lines=True)
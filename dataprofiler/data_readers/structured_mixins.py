@@ -34,6 +34,42 @@ class SpreadSheetDataMixin(object):
         """Loads the data into memory from the file."""
         raise NotImplementedError()
 
+    def _iter_chunks_from_file(self, input_file_path, chunk_size):
+        """Yields the data from the file in chunks of at most chunk_size."""
+        raise NotImplementedError()
+
+    def iter_chunks(self, chunk_size):
+        """
+        Yields the data as dataframes of at most `chunk_size` rows. If the data
+        has not been loaded into memory, it is read from the file one chunk at
+        a time, such that the memory used is proportional to the chunk size
+        rather than the file size.
+
+        :param chunk_size: max number of rows in each chunk
+        :type chunk_size: int
+        :return: chunks of the data
+        :rtype: Iterator(pd.DataFrame)
+        """
+        if not isinstance(chunk_size, int) or isinstance(chunk_size, bool) \
+                or chunk_size < 1:
+            raise ValueError("`chunk_size` must be a positive integer.")
+
+        if self._data is not None or not self.input_file_path:
+            if self._data is None:
+                self._load_data()
+            data = self._get_data_as_df(self._data)
+            for i in range(0, len(data), chunk_size):
+                yield data.iloc[i:i + chunk_size]
+            return
+
+        # keep the row index of the data consistent across the chunks
+        row_count = 0
+        for data in self._iter_chunks_from_file(self.input_file_path,
+                                                chunk_size):
+            data.index = pd.RangeIndex(row_count, row_count + len(data))
+            row_count += len(data)
+            yield data
+
     def _load_data(self, data=None):
         """Loads either the specified data or the input_file into memory."""
         if data is not None:
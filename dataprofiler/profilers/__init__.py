@@ -7,6 +7,7 @@ from .text_column_profile import TextColumn
 
 from .categorical_column_profile import CategoricalColumn
 from .order_column_profile import OrderColumn
+from .heavy_hitters_column_profile import HeavyHittersColumn
 
 from .data_labeler_column_profile import DataLabelerColumn
 
@@ -1,4 +1,8 @@
+import pandas as pd
+
 from . import BaseColumnProfiler
+from .column_view import ColumnView
+from .sketches import HyperLogLog
 
 
 class CategoricalColumn(BaseColumnProfiler):
@@ -16,6 +20,10 @@ class CategoricalColumn(BaseColumnProfiler):
     # Default value that determines if a given col is categorical or not.
     _CATEGORICAL_THRESHOLD_DEFAULT = 0.2
 
+    # max relative standard error of the unique count of a column which
+    # exceeded the max number of categories
+    _UNIQUE_COUNT_ERROR_RATE = 0.01
+
     def __init__(self, name, options=None):
         """
         Initialization of column base properties and itself.
@@ -26,7 +34,14 @@ class CategoricalColumn(BaseColumnProfiler):
 
         self.options = options
         super(CategoricalColumn, self).__init__(name)
-        self._categories = list()
+        # counts of the categories in the order they were first seen
+        self._categories = dict()
+        # approximate counter of the unique values, which replaces the
+        # categories once their number exceeds the max number of categories
+        self._unique_counter = None
+        self._max_categories = None
+        if options:
+            self._max_categories = options.max_categories
         self.__calculations = {
             "is_enabled": CategoricalColumn._update_categories
         }
@@ -47,9 +62,11 @@ class CategoricalColumn(BaseColumnProfiler):
                             "'CategoricalColumn' and '{}'".format(
                                 other.__class__.__name__))
 
-        merged_profile = CategoricalColumn(None)
+        merged_profile = CategoricalColumn(None, options=self.options)
         merged_profile._categories = self._categories.copy()
-        merged_profile._update_categories(other._categories)
+        merged_profile._unique_counter = self._unique_counter
+        merged_profile._add_categories(other._categories,
+                                       other._unique_counter)
         BaseColumnProfiler._add_helper(merged_profile, self, other)
         return merged_profile
 
@@ -62,13 +79,15 @@ class CategoricalColumn(BaseColumnProfiler):
         profile = dict(
             categorical=self.is_match,
             statistics=dict([
-                ('unique_count', len(self.categories)),
+                ('unique_count', self.unique_count),
                 ('unique_ratio', self.unique_ratio),
             ]),
             times=self.times
         )
         if self.is_match:
-            profile["statistics"].update(dict(categories=self.categories))
+            profile["statistics"].update(dict(
+                categories=self.categories,
+                categorical_count=self.categorical_count))
         return profile
 
     @property
@@ -76,7 +95,25 @@ class CategoricalColumn(BaseColumnProfiler):
         """
         Property for categories.
         """
-        return self._categories
+        return list(self._categories)
+
+    @property
+    def categorical_count(self):
+        """
+        Property for categorical_count. Returns the number of occurrences of
+        each category.
+        """
+        return self._categories.copy()
+
+    @property
+    def unique_count(self):
+        """
+        Property for unique_count. Returns the number of unique values, which
+        is approximate once the max number of categories was exceeded.
+        """
+        if self._unique_counter is not None:
+            return self._unique_counter.count
+        return len(self._categories)
 
     @property
     def unique_ratio(self):
@@ -86,7 +123,7 @@ class CategoricalColumn(BaseColumnProfiler):
         """
         unique_ratio = 1.0
         if self.sample_size:
-            unique_ratio = len(self.categories) / self.sample_size
+            unique_ratio = self.unique_count / self.sample_size
         return unique_ratio
 
     @property
@@ -94,12 +131,28 @@ class CategoricalColumn(BaseColumnProfiler):
         """
         Property for is_match. Returns true if column is categorical.
         """
+        if self._unique_counter is not None:
+            return False
+        return self._is_categorical(len(self._categories), self.sample_size)
+
+    @classmethod
+    def _is_categorical(cls, unique, sample_size):
+        """
+        Determines whether a column with the number of unique values out of
+        the number of values is categorical.
+
+        :param unique: number of unique values of the column
+        :type unique: int
+        :param sample_size: number of values of the column
+        :type sample_size: int
+        :return: whether the column is categorical
+        :rtype: bool
+        """
         is_match = False
-        unique = len(self._categories)
-        if unique <= self._MAXIMUM_UNIQUE_VALUES_TO_CLASSIFY_AS_CATEGORICAL:
+        if unique <= cls._MAXIMUM_UNIQUE_VALUES_TO_CLASSIFY_AS_CATEGORICAL:
             is_match = True
-        elif self.sample_size \
-                and self.unique_ratio <= self._CATEGORICAL_THRESHOLD_DEFAULT:
+        elif sample_size \
+                and unique / sample_size <= cls._CATEGORICAL_THRESHOLD_DEFAULT:
             is_match = True
         return is_match
 
@@ -120,11 +173,61 @@ class CategoricalColumn(BaseColumnProfiler):
         :type df_series: pandas.DataFrame
         :return: None
         """
-        if hasattr(df_series, 'tolist'):
-            df_series = df_series.tolist()
+        self._add_categories(df_series.value_counts(dropna=False, sort=False))
+
+    def _create_unique_counter(self, categories):
+        """
+        Creates an approximate counter of the unique categories.
+
+        :param categories: categories to count
+        :type categories: Union[dict, pandas.Series]
+        :return: counter of the unique categories
+        :rtype: HyperLogLog
+        """
+        unique_counter = HyperLogLog(self._UNIQUE_COUNT_ERROR_RATE)
+        unique_counter.update(pd.util.hash_array(
+            pd.Index(list(categories.keys()), dtype=object).values))
+        return unique_counter
+
+    def _add_categories(self, categories, unique_counter=None):
+        """
+        Adds the counts of the categories, and the approximate counter of the
+        unique categories if they exceeded the max number of categories, to
+        the profile. The categories are only dropped for the approximate
+        counter once they exceed the max number of categories and the column
+        is not categorical on the values counted so far, such that the max
+        number of categories never makes a categorical column non-categorical.
+
+        :param categories: counts of the categories
+        :type categories: Union[dict, pandas.Series]
+        :param unique_counter: approximate counter of the unique categories
+        :type unique_counter: Union[None, HyperLogLog]
+        :return: None
+        """
+        if self._unique_counter is None and unique_counter is None:
+            for category, count in categories.items():
+                self._categories[category] = \
+                    self._categories.get(category, 0) + int(count)
+            # the counts of the categories add up to the number of values
+            if self._max_categories is None \
+                    or len(self._categories) <= self._max_categories \
+                    or self._is_categorical(len(self._categories),
+                                            sum(self._categories.values())):
+                return
+            # the column can no longer be categorical, hence the categories
+            # are only counted approximately from here on
+            self._unique_counter = self._create_unique_counter(
+                self._categories)
+            self._categories = dict()
+            return
+        elif unique_counter is None:
+            unique_counter = self._create_unique_counter(categories)
 
-        self._categories = self._combine_unique_sets(
-            self._categories, df_series)
+        if self._unique_counter is None:
+            self._unique_counter = self._create_unique_counter(
+                self._categories)
+            self._categories = dict()
+        self._unique_counter = self._unique_counter + unique_counter
 
     def _update_helper(self, df_series_clean, profile):
         """
@@ -144,9 +247,10 @@ class CategoricalColumn(BaseColumnProfiler):
         Updates the column profile.
 
         :param df_series: Data to profile.
-        :type df_series: pandas.core.series.Series
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: None
         """
+        df_series = ColumnView.create(df_series).series
         profile = dict(
             sample_size=len(df_series)
         )
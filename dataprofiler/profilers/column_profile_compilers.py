@@ -5,8 +5,9 @@ from collections import OrderedDict
 import pandas as pd
 
 from . import DateTimeColumn, IntColumn, FloatColumn, TextColumn
-from . import OrderColumn, CategoricalColumn
+from . import OrderColumn, CategoricalColumn, HeavyHittersColumn
 from . import DataLabelerColumn
+from .column_view import ColumnView
 from .profiler_options import StructuredOptions
 
 
@@ -15,13 +16,16 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
     # NOTE: these profilers are ordered. Test functionality if changed.
     _profilers = list()
 
-    def __init__(self, df_series, options=None):
+    def __init__(self, df_series=None, options=None):
         if not self._profilers:
             raise NotImplementedError("Must add profilers.")
 
-        self.name = df_series.name
+        self.name = None
         self._profiles = OrderedDict()
-        self._create_profile(df_series, options)
+        if df_series is not None:
+            df_series = ColumnView.create(df_series, convert_to_str=True)
+            self.name = df_series.name
+            self._create_profile(df_series, options)
 
     @property
     @abc.abstractmethod
@@ -32,17 +36,18 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
         """
         Initializes and evaluates all profilers for the given dataframe.
         
-        :param df_series: a given column
-        :type df_series: pandas.core.series.Series
+        :param df_series: a given column or its view
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :param options: Options for the structured profiler
         :type options: StructuredOptions
         :return: None
         :rtype: None
         """
 
-        # convert all the values to string
-        df_series = df_series.apply(str)
-        
+        # convert all the values to string once and share the view of the
+        # column across the profilers
+        df_series = ColumnView.create(df_series, convert_to_str=True)
+
         selected_col_profiles = None
         if options and isinstance(options, StructuredOptions):
             selected_col_profiles = options.enabled_columns
@@ -96,7 +101,7 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
             raise ValueError('Column profilers were not setup with the same '
                              'options, hence they do not calculate the same '
                              'profiles and cannot be added together.')
-        merged_profile_compiler = self.__class__(pd.Series([]))
+        merged_profile_compiler = self.__class__()
         merged_profile_compiler.name = self.name
         for profile_name in self._profiles:
             merged_profile_compiler._profiles[profile_name] = (
@@ -108,12 +113,12 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
         """
         Initializes the profiles the column dataframe.
         
-        :param df_series: a given column
-        :type df_series: pandas.core.series.Series
+        :param df_series: a given column or its view
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: None
         :rtype: None
         """
-        df_series = df_series.apply(str)
+        df_series = ColumnView.create(df_series, convert_to_str=True)
         for column_profile in self._profiles:
             self._profiles[column_profile].update(df_series)
 
@@ -128,6 +133,20 @@ class ColumnPrimitiveTypeProfileCompiler(BaseColumnProfileCompiler):
         TextColumn,
     ]
 
+    @property
+    def _selected_profiler(self):
+        """
+        The first profiler of the data types which match all the values of the
+        column, i.e. the data type of the column, if any.
+
+        :return: profiler of the data type of the column or None
+        :rtype: Union[None, BaseColumnPrimitiveTypeProfiler]
+        """
+        for _, profiler in self._profiles.items():
+            if profiler.data_type_ratio == 1.0:
+                return profiler
+        return None
+
     @property
     def profile(self):
         profile = {
@@ -135,19 +154,24 @@ class ColumnPrimitiveTypeProfileCompiler(BaseColumnProfileCompiler):
             "data_type": None,
             "statistics": dict()
         }
-        has_found_match = False
+        selected_profiler = self._selected_profiler
+        if selected_profiler is not None:
+            profile.update(
+                {
+                    "data_type": selected_profiler.col_type,
+                    "statistics": selected_profiler.profile,
+                }
+            )
         for _, profiler in self._profiles.items():
-            if not has_found_match and profiler.data_type_ratio == 1.0:
-                profile.update(
-                    {
-                        "data_type": profiler.col_type,
-                        "statistics": profiler.profile,
-                    }
-                )
-                has_found_match = True
             profile["data_type_representation"].update(
                 dict([(profiler.col_type, profiler.data_type_ratio)])
             )
+        skipped_stats = dict()
+        for _, profiler in self._profiles.items():
+            if getattr(profiler, '_skipped_stats', None):
+                skipped_stats[profiler.col_type] = profiler._skipped_stats
+        if skipped_stats:
+            profile["statistics"]["skipped_stats"] = skipped_stats
         return profile
 
 
@@ -157,13 +181,20 @@ class ColumnStatsProfileCompiler(BaseColumnProfileCompiler):
     _profilers = [
         OrderColumn,
         CategoricalColumn,
+        HeavyHittersColumn,
     ]
 
     @property
     def profile(self):
         profile = dict()
+        statistics = dict()
         for _, profiler in self._profiles.items():
-            profile.update(profiler.profile)
+            profiler_profile = profiler.profile
+            # the statistics of the profilers are combined
+            statistics.update(profiler_profile.get("statistics", dict()))
+            profile.update(profiler_profile)
+        if statistics:
+            profile["statistics"] = statistics
         return profile
 
 
@@ -0,0 +1,181 @@
+"""
+View of a chunk of a column which is shared by all the column profilers, such
+that the column is converted to strings once and the forms derived from the
+strings are calculated at most once. Columns with a native numeric or datetime
+dtype are kept as is and only converted to strings when the strings are needed.
+"""
+import numpy as np
+import pandas as pd
+
+
+class ColumnView(object):
+
+    def __init__(self, df_series):
+        """
+        View of a cleaned chunk of a column, i.e. its values with the nulls
+        removed, and the lazily calculated forms derived from them. The values
+        are either strings or native values of a numeric or datetime dtype
+        (see `get_native_kind`).
+
+        :param df_series: string or native values of the column
+        :type df_series: pandas.core.series.Series
+        """
+        self.native_kind = self.get_native_kind(
+            getattr(df_series, 'dtype', None))
+        self.native_series = None
+        self._series = df_series
+        if self.native_kind is not None:
+            self.native_series = df_series
+            self._series = None
+        self._float_values = None
+        self._is_float = None
+        self._is_int = None
+        self._str_lengths = None
+
+    @staticmethod
+    def get_native_kind(dtype):
+        """
+        Gets the kind of the values of a native dtype, i.e. a dtype whose
+        values are profiled without being converted to strings and parsed.
+        Integers and 64-bit floats are parsed from their strings exactly as
+        they are cast, and naive datetimes are formatted alike as strings.
+
+        :param dtype: dtype of a column
+        :type dtype: Union[None, numpy.dtype,
+            pandas.api.extensions.ExtensionDtype]
+        :return: 'int', 'float' or 'datetime' for a native dtype, otherwise
+            None
+        :rtype: Union[None, str]
+        """
+        if not isinstance(dtype, np.dtype):
+            return None
+        if dtype.kind in 'iu':
+            return 'int'
+        elif dtype == np.float64:
+            return 'float'
+        elif dtype.kind == 'M':
+            return 'datetime'
+        return None
+
+    @classmethod
+    def create(cls, df_series, convert_to_str=False):
+        """
+        Creates the view of the column unless it already is a view.
+
+        :param df_series: a given column or its view
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
+        :param convert_to_str: whether the values of the column are converted
+            to strings when a view is created, which native values are only
+            when the strings are needed
+        :type convert_to_str: bool
+        :return: view of the column
+        :rtype: ColumnView
+        """
+        if isinstance(df_series, cls):
+            return df_series
+        if convert_to_str and cls.get_native_kind(
+                getattr(df_series, 'dtype', None)) is None:
+            df_series = df_series.apply(str)
+        return cls(df_series)
+
+    @property
+    def series(self):
+        """String values of the column."""
+        if self._series is None:
+            self._series = self.native_series.apply(str)
+        return self._series
+
+    @property
+    def name(self):
+        if self.native_series is not None:
+            return self.native_series.name
+        return self._series.name
+
+    def __len__(self):
+        if self.native_series is not None:
+            return len(self.native_series)
+        return len(self._series)
+
+    def _parse_floats(self):
+        """
+        Parses each value as a float, such that the value is a float if and
+        only if `float(value)` succeeds. Pandas finds the numeric values at
+        once, which are then cast with `float` by numpy, since pandas parses
+        the strings less precisely. Only the values which pandas can't parse,
+        e.g. 'nan' or '1_000', are parsed one value at a time. Native numeric
+        values are cast at once and native datetimes are not floats.
+
+        :return: None
+        """
+        if self.native_kind in ('int', 'float'):
+            self._float_values = self.native_series.values.astype(float)
+            self._is_float = np.ones(len(self), dtype=bool)
+            return
+        elif self.native_kind == 'datetime':
+            self._float_values = np.full(len(self), np.nan)
+            self._is_float = np.zeros(len(self), dtype=bool)
+            return
+
+        values = self.series.values
+        float_values = np.full(len(values), np.nan)
+        try:
+            is_numeric = ~np.isnan(np.asarray(
+                pd.to_numeric(values, errors='coerce'), dtype=float))
+            float_values[is_numeric] = values[is_numeric].astype(float)
+        except (ValueError, TypeError, OverflowError):
+            is_numeric = np.zeros(len(values), dtype=bool)
+        is_float = is_numeric.copy()
+        for i in np.flatnonzero(~is_numeric):
+            try:
+                float_values[i] = float(values[i])
+            except (ValueError, TypeError, OverflowError):
+                continue
+            is_float[i] = True
+        self._float_values = float_values
+        self._is_float = is_float
+
+    @property
+    def float_values(self):
+        """Values parsed as floats, NaN where a value is not a float."""
+        if self._float_values is None:
+            self._parse_floats()
+        return self._float_values
+
+    @property
+    def is_float(self):
+        """Whether each value is a float, which includes integers and NaNs."""
+        if self._is_float is None:
+            self._parse_floats()
+        return self._is_float
+
+    @property
+    def is_int(self):
+        """Whether each value is a float which equals an integer."""
+        if self._is_int is None:
+            float_values = self.float_values
+            is_int = self.is_float & np.isfinite(float_values)
+            is_int[is_int] = \
+                float_values[is_int] == np.trunc(float_values[is_int])
+            self._is_int = is_int
+        return self._is_int
+
+    @property
+    def str_lengths(self):
+        """Number of characters of each value."""
+        if self._str_lengths is None:
+            self._str_lengths = self.series.str.len()
+        return self._str_lengths
+
+    def get_float_series(self, mask=None):
+        """
+        Gets the values parsed as floats as a series.
+
+        :param mask: mask of the values to get, by default all of them
+        :type mask: numpy.ndarray[bool]
+        :return: values parsed as floats
+        :rtype: pandas.core.series.Series
+        """
+        float_values = self.float_values
+        if mask is not None:
+            float_values = float_values[mask]
+        return pd.Series(float_values, name=self.name)
@@ -3,6 +3,7 @@ import operator
 import numpy as np
 
 from . import BaseColumnProfiler
+from .column_view import ColumnView
 from ..labelers.data_labelers import DataLabeler
 from .profiler_options import DataLabelerOptions
 
@@ -11,7 +12,8 @@ class DataLabelerColumn(BaseColumnProfiler):
     
     col_type = "data_labeler"
     
-    def __init__(self, name, data_labeler_dirpath=None, options=None):
+    def __init__(self, name, data_labeler_dirpath=None, options=None,
+                 data_labeler=None):
         """
         Initialization of Data Label profiling for structured datasets.
 
@@ -19,6 +21,9 @@ class DataLabelerColumn(BaseColumnProfiler):
         :type data_labeler_dirpath: String
         :param options: Options for the data labeler column
         :type options: DataLabelerOptions
+        :param data_labeler: already loaded data labeler to use instead of
+            loading the data labeler from `data_labeler_dirpath`
+        :type data_labeler: DataLabeler
         """
         BaseColumnProfiler.__init__(self, name)
 
@@ -31,10 +36,13 @@ class DataLabelerColumn(BaseColumnProfiler):
             if options.max_sample_size:
                 self._max_sample_size = options.max_sample_size
 
-        self.data_labeler = DataLabeler(
-            labeler_type='structured',
-            dirpath=data_labeler_dirpath,
-            load_options=None)
+        self._data_labeler_dirpath = data_labeler_dirpath
+        self.data_labeler = data_labeler
+        if self.data_labeler is None:
+            self.data_labeler = DataLabeler(
+                labeler_type='structured',
+                dirpath=data_labeler_dirpath,
+                load_options=None)
 
         reverse_label_mapping = self.data_labeler.reverse_label_mapping
         num_labels = self.data_labeler.model.num_labels
@@ -117,11 +125,13 @@ class DataLabelerColumn(BaseColumnProfiler):
                                 other.__class__.__name__))
 
         self.assert_equal_conditions(self, other)
-        merged_profile = DataLabelerColumn(None)
+        # reuse the loaded data labeler instead of loading it again
+        merged_profile = DataLabelerColumn(
+            None, data_labeler_dirpath=self._data_labeler_dirpath,
+            data_labeler=self.data_labeler)
         BaseColumnProfiler._add_helper(merged_profile, self, other)
 
         #Set all common variables
-        merged_profile.data_labeler = self.data_labeler
         merged_profile._possible_data_labels = self._possible_data_labels
         merged_profile._top_k_voting = self._top_k_voting
         merged_profile._min_voting_prob = self._min_voting_prob
@@ -260,13 +270,13 @@ class DataLabelerColumn(BaseColumnProfiler):
         Updates the column profile.
         
         :param df_series: df series
-        :type df_series: pandas.core.series.Series
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: None
         """
         if len(df_series) == 0:
             return
         sample_size = min(len(df_series), self._max_sample_size)
-        df_series = df_series.sample(sample_size)
+        df_series = ColumnView.create(df_series).series.sample(sample_size)
 
         profile = dict(sample_size=sample_size)
         BaseColumnProfiler._perform_property_calcs(
@@ -1,4 +1,7 @@
 import datetime
+import locale
+import re
+import string
 import warnings
 
 import numpy as np
@@ -6,6 +9,7 @@ import pandas as pd
 
 from .base_column_profilers import BaseColumnProfiler, \
     BaseColumnPrimitiveTypeProfiler
+from .column_view import ColumnView
 
 
 class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
@@ -35,6 +39,38 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
         "%H:%M:%S.%f"  # 05:46:30.258509
     ]
 
+    # regexes with which `datetime.datetime.strptime` matches the directives
+    # of the date formats, except for the month names of the locale
+    _directive_regexes = {
+        'Y': r'\d\d\d\d', 'y': r'\d\d', 'm': r'(?:1[0-2]|0[1-9]|[1-9])',
+        'd': r'(?:3[01]|[12]\d|0[1-9]|[1-9]| [1-9])',
+        'H': r'(?:2[0-3]|[0-1]\d|\d)', 'M': r'(?:[0-5]\d|\d)',
+        'S': r'(?:6[0-1]|[0-5]\d|\d)', 'f': r'[0-9]{1,6}', '%': '%'}
+
+    # regexes with which `datetime.datetime.strptime` matches the date formats
+    _date_format_regexes = dict()
+
+    # the shape of a value replaces its ascii letters with 'a' and its ascii
+    # digits with 'd', e.g. '2013-03-05' has the shape 'dddd-dd-dd'
+    _shape_table = str.maketrans(
+        string.ascii_letters + string.digits,
+        'a' * len(string.ascii_letters) + 'd' * len(string.digits))
+    _directive_shapes = {
+        'Y': 'dddd', 'y': 'dd', 'm': 'dd?', 'd': '(?:dd?| d)', 'H': 'dd?',
+        'M': 'dd?', 'S': 'dd?', 'f': 'd{1,6}', '%': '%'}
+
+    # regexes of the shapes of the values which can match the date formats
+    _date_format_shape_regexes = dict()
+
+    # memo of the date formats which can match the values of a shape, shared
+    # across chunks and columns, which is cleared once it holds `_max_shapes`
+    _shape_date_formats = dict()
+    _max_shapes = 10000
+
+    # time locale for which the regexes and shapes of the date formats are
+    # cached, since the month names depend on the locale
+    _cache_locale = None
+
     def __init__(self, name, options=None):
         """
         Initialization of column base properties and itself.
@@ -133,78 +169,364 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
 
         return converted_date
 
+    @classmethod
+    def _check_locale(cls):
+        """
+        Clears the cached regexes and shapes of the date formats if the time
+        locale changed since they were cached.
+
+        :return: None
+        """
+        time_locale = locale.setlocale(locale.LC_TIME)
+        if time_locale != cls._cache_locale:
+            cls._date_format_regexes.clear()
+            cls._date_format_shape_regexes.clear()
+            cls._shape_date_formats.clear()
+            cls._cache_locale = time_locale
+
+    @staticmethod
+    def _get_month_names(directive):
+        """
+        Gets the month names of the time locale, which `strptime` matches
+        regardless of their case.
+
+        :param directive: 'b' for the abbreviated names or 'B' for the full
+            names
+        :type directive: str
+        :return: the month names
+        :rtype: list(str)
+        """
+        return [datetime.date(2001, month, 1).strftime('%' + directive)
+                for month in range(1, 13)]
+
+    @classmethod
+    def _get_date_format_regex(cls, date_format):
+        """
+        Gets the regex with which `datetime.datetime.strptime` matches a date
+        format, such that the values of a column are matched at once.
+
+        :param date_format: a date format
+        :type date_format: str
+        :return: compiled regex of the date format
+        :rtype: re.Pattern
+        """
+        if date_format in cls._date_format_regexes:
+            return cls._date_format_regexes[date_format]
+
+        pattern = ''
+        tokens = iter(date_format)
+        for char in tokens:
+            if char == '%':
+                directive = next(tokens, '')
+                if directive in cls._directive_regexes:
+                    pattern += cls._directive_regexes[directive]
+                elif directive in ('b', 'B'):
+                    # longer names are matched first, as strptime does
+                    names = sorted(
+                        (name for name in cls._get_month_names(directive)
+                         if name), key=len, reverse=True)
+                    pattern += '(?:{})'.format('|'.join(map(re.escape,
+                                                            names)))
+                else:
+                    raise ValueError('Unsupported directive in the date '
+                                     'format: %{}'.format(directive))
+            elif char.isspace():
+                # strptime matches any whitespace in the format with `\s+`
+                if not pattern.endswith(r'\s+'):
+                    pattern += r'\s+'
+            else:
+                pattern += re.escape(char)
+
+        regex = re.compile(pattern, re.IGNORECASE)
+        cls._date_format_regexes[date_format] = regex
+        return regex
+
+    @classmethod
+    def _get_date_format_shape_regex(cls, date_format):
+        """
+        Gets the regex of the shapes of the values which can match a date
+        format, i.e. the shape of any value matched by the strptime regex of
+        the format is matched by the shape regex.
+
+        :param date_format: a date format
+        :type date_format: str
+        :return: compiled regex of the shapes of the date format, or None if
+            the format contains a directive without a known shape
+        :rtype: Union[None, re.Pattern]
+        """
+        if date_format in cls._date_format_shape_regexes:
+            return cls._date_format_shape_regexes[date_format]
+
+        pattern = ''
+        tokens = iter(date_format)
+        for char in tokens:
+            if char == '%':
+                directive = next(tokens, '')
+                if directive in cls._directive_shapes:
+                    pattern += cls._directive_shapes[directive]
+                elif directive in ('b', 'B'):
+                    shapes = sorted(set(
+                        name.translate(cls._shape_table)
+                        for name in cls._get_month_names(directive) if name))
+                    pattern += '(?:{})'.format('|'.join(map(re.escape,
+                                                            shapes)))
+                else:
+                    pattern = None
+                    break
+            elif char.isspace():
+                # strptime matches any whitespace in the format with `\s+`
+                if not pattern.endswith(r'\s+'):
+                    pattern += r'\s+'
+            else:
+                pattern += re.escape(char.translate(cls._shape_table))
+
+        shape_regex = re.compile(pattern) if pattern is not None else None
+        cls._date_format_shape_regexes[date_format] = shape_regex
+        return shape_regex
+
+    @classmethod
+    def _get_shape_date_formats(cls, shape):
+        """
+        Gets the date formats which can match the values of a shape.
+
+        :param shape: shape of a value
+        :type shape: str
+        :return: the date formats which can match the values of the shape
+        :rtype: frozenset(str)
+        """
+        date_formats = cls._shape_date_formats.get(shape, None)
+        if date_formats is None:
+            if any(ord(char) > 127 for char in shape):
+                # only ascii letters and digits are part of the shapes, hence
+                # e.g. unicode digits can match any date format
+                date_formats = frozenset(cls._date_formats)
+            else:
+                date_formats = frozenset(
+                    date_format for date_format in cls._date_formats
+                    if cls._get_date_format_shape_regex(date_format) is None
+                    or cls._get_date_format_shape_regex(date_format)
+                    .fullmatch(shape))
+            if len(cls._shape_date_formats) >= cls._max_shapes:
+                cls._shape_date_formats.clear()
+            cls._shape_date_formats[shape] = date_formats
+        return date_formats
+
+    @staticmethod
+    def _has_string_values(df_series):
+        """
+        Determines whether a column has any string values, i.e. whether its
+        values can be matched with the `.str` methods. The inferred type is
+        checked instead of the dtype, since object columns of strings with
+        missing or non-string values don't have a string dtype.
+
+        :param df_series: a given column
+        :type df_series: pandas.core.series.Series
+        :return: whether the column has any string values
+        :rtype: bool
+        """
+        return pd.api.types.infer_dtype(df_series, skipna=True) \
+            in ('string', 'mixed', 'mixed-integer')
+
+    @classmethod
+    def _get_shape_index(cls, df_series, date_formats):
+        """
+        Determines which of the date formats can match each value of a column
+        from the shapes of the values, such that the values are classified by
+        a lookup of their shape instead of matching each date format.
+
+        :param df_series: a given column
+        :type df_series: pandas.core.series.Series
+        :param date_formats: date formats which are checked
+        :type date_formats: list(str)
+        :return: whether each date format can match each value, by date format
+        :rtype: dict
+        """
+        if not cls._has_string_values(df_series):
+            return {date_format: np.zeros(len(df_series), dtype=bool)
+                    for date_format in date_formats}
+        codes, shapes = pd.factorize(
+            df_series.str.translate(cls._shape_table))
+        shape_date_formats = [cls._get_shape_date_formats(shape)
+                              for shape in shapes]
+        shape_index = dict()
+        for date_format in date_formats:
+            # values which are not strings have the code -1, i.e. the last
+            # entry which is always False
+            can_match = np.zeros(len(shapes) + 1, dtype=bool)
+            can_match[:-1] = [
+                date_format in shape_formats
+                or date_format not in cls._date_formats
+                for shape_formats in shape_date_formats]
+            shape_index[date_format] = can_match[codes]
+        return shape_index
+
+    @classmethod
+    def _parse_dates(cls, df_series, date_format, can_match=None):
+        """
+        Parses the values of a column with a date format, with the same results
+        as `datetime.datetime.strptime`. The values which fully match the
+        regex of the format are parsed at once, only those which cannot be
+        parsed as a `pandas.Timestamp`, e.g. dates before 1677 or after 2262
+        or invalid days of the month, are parsed one value at a time.
+
+        :param df_series: a given column
+        :type df_series: pandas.core.series.Series
+        :param date_format: a date format
+        :type date_format: str
+        :param can_match: whether each value can match the date format, by
+            default all of them
+        :type can_match: numpy.ndarray[bool]
+        :return: whether each value is a date, the dates as datetime64 (NaT
+            where a date is parsed one value at a time) and the dates which
+            are parsed one value at a time by their position
+        :rtype: tuple(numpy.ndarray[bool], numpy.ndarray[datetime64], dict)
+        """
+        dates = np.full(len(df_series), np.datetime64('NaT'),
+                        dtype='datetime64[ns]')
+        if not cls._has_string_values(df_series):
+            return np.zeros(len(df_series), dtype=bool), dates, dict()
+
+        if can_match is None:
+            can_match = np.ones(len(df_series), dtype=bool)
+        is_date = np.zeros(len(df_series), dtype=bool)
+        if can_match.any():
+            is_date[can_match] = df_series[can_match].str.fullmatch(
+                cls._get_date_format_regex(date_format)) \
+                .fillna(False).values.astype(bool)
+        if not is_date.any():
+            return is_date, dates, dict()
+
+        dates[is_date] = pd.to_datetime(
+            df_series[is_date], format=date_format, errors='coerce').values
+        fallback_dates = dict()
+        for i in np.flatnonzero(is_date & np.isnat(dates)):
+            date = cls._validate_datetime(df_series.iloc[i], date_format)
+            if pd.isnull(date):
+                is_date[i] = False
+            else:
+                fallback_dates[i] = date
+        return is_date, dates, fallback_dates
+
+    @staticmethod
+    def _get_min_and_max_dates(dates, fallback_dates):
+        """
+        Gets the min and max dates and their positions, i.e. the first position
+        of the min and max if they occur more than once.
+
+        :param dates: parsed dates, NaT where a value is not parsed
+        :type dates: numpy.ndarray[datetime64]
+        :param fallback_dates: dates which are not in `dates` by position
+        :type fallback_dates: dict
+        :return: min date and its position, max date and its position
+        :rtype: tuple(tuple(datetime.datetime, int),
+            tuple(datetime.datetime, int))
+        """
+        candidates = list(zip(fallback_dates.values(), fallback_dates.keys()))
+        positions = np.flatnonzero(~np.isnat(dates))
+        if len(positions):
+            date_values = dates[positions]
+            for ind in (np.argmin(date_values), np.argmax(date_values)):
+                candidates.append((
+                    pd.Timestamp(date_values[ind]).to_pydatetime(),
+                    positions[ind]))
+        min_date = min(candidates, key=lambda date: (date[0], date[1]))
+        max_date = max(candidates, key=lambda date: (date[0], -date[1]))
+        return min_date, max_date
+
+    @classmethod
+    def _get_native_datetime_profile(cls, df_series):
+        """
+        Collects the datetime stats of a column of native datetimes, which are
+        formatted as '%Y-%m-%d %H:%M:%S' when converted to strings unless they
+        are NaT or have fractional seconds, such that they match the date
+        formats as their strings do without being parsed.
+
+        :param df_series: a given column of native datetimes
+        :type df_series: pandas.core.series.Series
+        :return: parameters for datetime columns
+        :rtype: dict
+        """
+        dates = df_series.values.astype('datetime64[ns]')
+        is_date = ~np.isnat(dates)
+        is_date[is_date] = dates[is_date].astype(np.int64) % 10 ** 9 == 0
+        dates[~is_date] = np.datetime64('NaT')
+
+        profile = dict(date_formats=[], min=None, max=None,
+                       min_obj=datetime.datetime.max,
+                       max_obj=datetime.datetime.min,
+                       match_count=int(is_date.sum()))
+        if profile["match_count"]:
+            (min_value_obj, min_ind), (max_value_obj, max_ind) = \
+                cls._get_min_and_max_dates(dates, dict())
+            profile.update(
+                date_formats=[cls._date_formats[0]],
+                min=str(df_series.iloc[min_ind]), min_obj=min_value_obj,
+                max=str(df_series.iloc[max_ind]), max_obj=max_value_obj)
+        return profile
+
     @classmethod
     def _get_datetime_profile(cls, df_series):
         """
         For each value in a column determines if it is a datetime and the format
-        of the value. Also collects datetime stats for the column.
+        of the value, i.e. the first of the date formats which matches it. Also
+        collects datetime stats for the column.
         
         :param df_series: a given column
         :type df_series: pandas.core.series.Series
         :return: parameters for datetime columns
         :rtype: dict
         """
+        if ColumnView.get_native_kind(df_series.dtype) == 'datetime':
+            return cls._get_native_datetime_profile(df_series)
+        cls._check_locale()
 
         profile = dict()
         activated_date_formats = list()
-        len_df = len(df_series)
-
-        is_row_datetime = pd.Series(np.full((len(df_series)), False))
+        match_count = 0
+        # the shapes of the values prune the date formats which are checked
+        # for each value
+        shape_index = cls._get_shape_index(df_series, cls._date_formats)
 
         min_value = None
         max_value = None
         min_value_obj = datetime.datetime.max
         max_value_obj = datetime.datetime.min
         for date_format in cls._date_formats:
-            if is_row_datetime.all():
+            if not len(df_series):
                 break
-            valid_dates = df_series.apply(
-                lambda x: cls._validate_datetime(x, date_format)
-            )
+            is_date, dates, fallback_dates = cls._parse_dates(
+                df_series, date_format, shape_index[date_format])
 
-            df_dates = valid_dates[~valid_dates.isnull()]
-
-            if "%b" in date_format and not df_dates.empty:
+            if "%b" in date_format and is_date.any():
                 may_month = 5 # May can be %b or %B we want to force, so check
-                all_may = df_dates.apply(lambda x: x.month == may_month).all()
+                months = pd.DatetimeIndex(dates[~np.isnat(dates)]).month
+                all_may = (months == may_month).all() and all(
+                    date.month == may_month
+                    for date in fallback_dates.values())
                 if all_may:
-                    valid_dates[:] = np.nan
-                    df_dates = pd.Series([], dtype=object)
-
-            # Create mask to avoid null dates
-            null_date_mask = valid_dates.isnull()
-            np_date_array = df_dates.values
-                    
-            # check off any values which were found to be datetime
-            is_row_datetime[~is_row_datetime] = (~null_date_mask).values
-
-            if len(df_dates) > 0:
-                
-                # Converts to numpy prior to finding max index
-                min_idx = np.argmin(np_date_array)
-                max_idx = np.argmax(np_date_array)
-                
-                # Selects the min, ma value objects for comparison
-                tmp_min_value_obj = df_dates.iloc[min_idx]
-                tmp_max_value_obj = df_dates.iloc[max_idx]
-                
+                    is_date[:] = False
+
+            if is_date.any():
+                (tmp_min_value_obj, min_ind), (tmp_max_value_obj, max_ind) = \
+                    cls._get_min_and_max_dates(dates, fallback_dates)
+
                 # If minimum value, keep reference
                 if tmp_min_value_obj < min_value_obj:
-                    min_value = df_series[~null_date_mask].iloc[min_idx]
+                    min_value = df_series.iloc[min_ind]
                     min_value_obj = tmp_min_value_obj
-                
+
                 # If maximum value, keep reference
                 if tmp_max_value_obj > max_value_obj:
-                    max_value = df_series[~null_date_mask].iloc[max_idx]
+                    max_value = df_series.iloc[max_ind]
                     max_value_obj = tmp_max_value_obj
-                    
-            df_series = df_series[null_date_mask]
 
-            # Get a list of all datetime format identified in column
-            new_len = len(df_series)
-            if new_len < len_df:
+                # Get a list of all datetime format identified in column
+                match_count += int(is_date.sum())
+                df_series = df_series[~is_date]
+                for other_format in shape_index:
+                    shape_index[other_format] = \
+                        shape_index[other_format][~is_date]
                 activated_date_formats.append(date_format)
-                len_df = new_len
                 if "y" in date_format:
                     warnings.warn(
                         "Years provided were in two digit format. As a result, "
@@ -218,11 +540,9 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
         profile["date_formats"] = activated_date_formats
         profile["min"] = min_value
         profile["max"] = max_value
-        profile["min_obj"] = min_value_obj.to_datetime() \
-            if hasattr(min_value_obj, 'to_datetime') else min_value_obj
-        profile["max_obj"] = max_value_obj.to_datetime() \
-            if hasattr(max_value_obj, 'to_datetime') else max_value_obj
-        profile["match_count"] = is_row_datetime.sum()
+        profile["min_obj"] = min_value_obj
+        profile["max_obj"] = max_value_obj
+        profile["match_count"] = match_count
         return profile
 
     def _is_subset_datetime_column(self, df_series):
@@ -307,14 +627,21 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
         Updates the column profile.
         
         :param df_series: df series
-        :type df_series: pandas.core.series.Series
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: None
         """
         if len(df_series) == 0:
             return
-        df_series = df_series.reset_index(drop=True)
+        column_view = ColumnView.create(df_series)
+        if column_view.native_kind == 'datetime':
+            # native datetimes are not parsed, hence the subset isn't checked
+            df_series = column_view.native_series.reset_index(drop=True)
+            is_datetime = True
+        else:
+            df_series = column_view.series.reset_index(drop=True)
+            is_datetime = self._is_subset_datetime_column(df_series)
         profile = {"sample_size": len(df_series), "match_count": 0}
-        if self._is_subset_datetime_column(df_series):
+        if is_datetime:
             super(DateTimeColumn, self)._perform_property_calcs(
                 self.__calculations,
                 df_series=df_series,
@@ -3,6 +3,7 @@ import numpy as np
 from .numerical_column_stats import NumericStatsMixin
 from .base_column_profilers import BaseColumnProfiler, \
     BaseColumnPrimitiveTypeProfiler
+from .column_view import ColumnView
 from .profiler_options import FloatOptions
 
 
@@ -14,6 +15,9 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
 
     col_type = "float"
 
+    # number of values whose precision is calculated at once
+    _precision_chunk_size = 4096
+
     def __init__(self, name, options=None):
         """
         Initialization of column base properties and itself.
@@ -28,6 +32,11 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         NumericStatsMixin.__init__(self, options)
         BaseColumnPrimitiveTypeProfiler.__init__(self, name)
         self.precision = 0
+        self.precision_stats = {
+            "decimal_places": self._get_digit_stats(np.zeros(0, dtype=int)),
+            "significant_digits":
+                self._get_digit_stats(np.zeros(0, dtype=int)),
+        }
         self.__calculations = {
             "precision": FloatColumn._update_precision,
         }
@@ -50,6 +59,19 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         merged_profile = FloatColumn(None)
         BaseColumnPrimitiveTypeProfiler._add_helper(merged_profile, self, other)
         NumericStatsMixin._add_helper(merged_profile, self, other)
+        self._merge_calculations(merged_profile.__calculations,
+                                 self.__calculations,
+                                 other.__calculations)
+        if "precision" in merged_profile.__calculations:
+            merged_profile.precision = max(self.precision, other.precision)
+            merged_profile.precision_stats = {
+                name: self._merge_digit_stats(self.precision_stats[name],
+                                              other.precision_stats[name])
+                for name in self.precision_stats
+            }
+        # the options are kept such that the early elimination and the frozen
+        # histogram selection of the merged profile persist
+        merged_profile.options = self.options or other.options
         return merged_profile
 
     @property
@@ -69,13 +91,47 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             median=None,
             variance=self.variance,
             stddev=self.stddev,
+            skewness=self.skewness,
+            kurtosis=self.kurtosis,
             histogram=self.histogram_methods[histogram_method]['histogram'],
             quantiles=self.quantiles,
             times=self.times,
-            precision=self.precision
+            precision=self.precision,
+            precision_stats={
+                name: dict(
+                    min=stats["min"],
+                    max=stats["max"],
+                    mean=stats["sum"] / stats["sample_size"]
+                    if stats["sample_size"] else None)
+                for name, stats in self.precision_stats.items()
+            }
         )
         return profile
 
+    def _reset_stats(self):
+        """
+        Resets the stats to their initial values, e.g. once they are skipped
+        due to early elimination.
+
+        :return: None
+        """
+        NumericStatsMixin._reset_stats(self)
+        self.precision = 0
+        self.precision_stats = {
+            name: self._get_digit_stats(np.zeros(0, dtype=int))
+            for name in self.precision_stats
+        }
+
+    @property
+    def _skipped_stats(self):
+        """
+        Names of the stats which are skipped due to early elimination.
+        """
+        skipped_stats = NumericStatsMixin._skipped_stats.fget(self)
+        if skipped_stats:
+            skipped_stats += list(self.__calculations)
+        return skipped_stats
+
     @property
     def data_type_ratio(self):
         """
@@ -87,32 +143,101 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             return float(self.match_count) / self.sample_size
         return None
 
+    @staticmethod
+    def _get_digit_stats(digits):
+        """
+        Gets the mergeable stats of the numbers of digits of values.
+
+        :param digits: number of digits of each value
+        :type digits: numpy.ndarray[int]
+        :return: min, max and sum of the numbers of digits and their count
+        :rtype: dict
+        """
+        if not len(digits):
+            return dict(min=None, max=None, sum=0, sample_size=0)
+        return dict(min=int(digits.min()), max=int(digits.max()),
+                    sum=int(digits.sum()), sample_size=len(digits))
+
+    @staticmethod
+    def _merge_digit_stats(stats1, stats2):
+        """
+        Merges the stats of the numbers of digits of two sets of values.
+
+        :param stats1: digit stats of the first values
+        :type stats1: dict
+        :param stats2: digit stats of the second values
+        :type stats2: dict
+        :return: digit stats of all the values
+        :rtype: dict
+        """
+        if not stats1["sample_size"]:
+            return dict(stats2)
+        elif not stats2["sample_size"]:
+            return dict(stats1)
+        return dict(min=min(stats1["min"], stats2["min"]),
+                    max=max(stats1["max"], stats2["max"]),
+                    sum=stats1["sum"] + stats2["sum"],
+                    sample_size=stats1["sample_size"] + stats2["sample_size"])
+
     @classmethod
     def _get_float_precision(cls, df_series):
         """
-        Determines the precision of the numeric value
-        :param df_series: a given column
+        Determines the precision of each value, i.e. the number of characters
+        after its last '.', or 0 if it has none, and its significant digits,
+        i.e. the digits of its mantissa without the leading zeros, or 1 if all
+        its digits are zeros. The characters of the values are compared at once
+        as a matrix of character codes, in chunks of values.
+
+        :param df_series: a given column of float strings
         :type df_series: pandas.core.series.Series
-        :return: string representing its precision print format
-        :rtype: int
+        :return: digit stats of the decimal places of the values and of the
+            significant digits of the values which have digits
+        :rtype: dict
         """
-        integer_decimal_loc = -1
-        float_precision = 0
-        for value in df_series:
-            decimal_loc = value.rfind('.')
+        values = np.asarray(df_series, dtype=object)
+        decimal_places = [np.zeros(0, dtype=int)]
+        significant_digits = [np.zeros(0, dtype=int)]
+        for start in range(0, len(values), cls._precision_chunk_size):
+            chunk = values[start:start + cls._precision_chunk_size]
+            try:
+                chunk = chunk.astype(bytes)
+                codes = chunk.view(np.uint8)
+            except UnicodeEncodeError:
+                chunk = chunk.astype(str)
+                codes = chunk.view(np.uint32)
+            codes = codes.reshape(len(chunk), -1)
+            positions = np.arange(codes.shape[1])
 
-            # integers will not have a '.'
-            if decimal_loc == integer_decimal_loc:
-                continue
+            # position of the last '.', counted from the end of the value
+            lengths = np.count_nonzero(codes, axis=1)
+            is_decimal = codes[:, ::-1] == ord('.')
+            decimal_locs = codes.shape[1] - 1 - is_decimal.argmax(axis=1)
+            decimal_places.append(np.where(
+                is_decimal.any(axis=1), lengths - decimal_locs - 1, 0))
 
-            # since has a '.', subtract the str len from the position,
-            # since indexes start at 0: len - pos - 1
-            value_len = len(value)
-            value_precision = value_len - decimal_loc - 1
+            # digits of the mantissa, i.e. before an exponent, from the first
+            # digit which is not a zero
+            is_exponent = (codes == ord('e')) | (codes == ord('E'))
+            exponent_locs = np.where(is_exponent.any(axis=1),
+                                     is_exponent.argmax(axis=1),
+                                     codes.shape[1])
+            is_digit = (codes >= ord('0')) & (codes <= ord('9')) \
+                & (positions < exponent_locs[:, None])
+            is_nonzero = is_digit & (codes != ord('0'))
+            nonzero_locs = np.where(is_nonzero.any(axis=1),
+                                    is_nonzero.argmax(axis=1),
+                                    codes.shape[1])
+            digits = np.count_nonzero(
+                is_digit & (positions >= nonzero_locs[:, None]), axis=1)
+            has_digits = is_digit.any(axis=1)
+            significant_digits.append(np.maximum(digits[has_digits], 1))
 
-            if float_precision < value_precision:
-                float_precision = value_precision
-        return float_precision
+        return {
+            "decimal_places":
+                cls._get_digit_stats(np.concatenate(decimal_places)),
+            "significant_digits":
+                cls._get_digit_stats(np.concatenate(significant_digits)),
+        }
 
     @classmethod
     def _is_each_row_float(cls, df_series):
@@ -124,21 +249,17 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         For column [1.0, np.NaN, 1.0] returns [True, True, True]
         For column [1.0, "a", "b"] returns [True, False, False]
         :param df_series: series of values to evaluate
-        :type df_series: pandas.core.series.Series
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: is_float_col
-        :rtype: list
+        :rtype: numpy.ndarray[bool]
         """
-        len_df = len(df_series)
-        if len_df == 0:
-            return list()
-
-        return [NumericStatsMixin.is_float(x) for x in df_series]
+        return ColumnView.create(df_series).is_float
 
     @BaseColumnProfiler._timeit(name='precision')
     def _update_precision(self, df_series, prev_dependent_properties,
                           subset_properties):
         """
-        Updates the precision value of the column.
+        Updates the precision value and precision stats of the column.
 
         :param prev_dependent_properties: Contains all the previous properties
         that the calculations depend on.
@@ -150,9 +271,14 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         :type df_series: pandas.DataFrame
         :return: None
         """
+        precision_stats = self._get_float_precision(df_series)
+        self.precision_stats = {
+            name: self._merge_digit_stats(self.precision_stats[name],
+                                          precision_stats[name])
+            for name in self.precision_stats
+        }
         self.precision = max(
-            self.precision, self._get_float_precision(df_series)
-        )
+            self.precision, self.precision_stats["decimal_places"]["max"] or 0)
 
     def _update_helper(self, df_series_clean, profile):
         """
@@ -172,23 +298,34 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         """
         Updates the column profile.
         :param df_series: df series
-        :type df_series: pandas.core.series.Series
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: None
         """
         if len(df_series) == 0:
             return
-        df_series = df_series.reset_index(drop=True)
-        is_each_row_float = self._is_each_row_float(df_series)
+        column_view = ColumnView.create(df_series)
+        is_each_row_float = self._is_each_row_float(column_view)
         sample_size = len(is_each_row_float)
         float_count = np.sum(is_each_row_float)
         profile = dict(match_count=float_count, sample_size=sample_size)
+        if self._is_eliminated(float_count, sample_size):
+            # the data type ratio can no longer be 1.0, hence only the counts
+            # are tracked
+            if not self._is_eliminated():
+                self._reset_stats()
+            self._update_column_base_properties(profile)
+            return
 
-        BaseColumnProfiler._perform_property_calcs(
-            self, self.__calculations, df_series=df_series[is_each_row_float],
-            prev_dependent_properties={}, subset_properties=profile)
+        if self.__calculations:
+            # only the calculations need the values as strings
+            df_series = column_view.series.reset_index(drop=True)
+            BaseColumnProfiler._perform_property_calcs(
+                self, self.__calculations, df_series=df_series[is_each_row_float],
+                prev_dependent_properties={}, subset_properties=profile)
 
+        # the stats are calculated from the already parsed values
         self._update_helper(
-            df_series_clean=df_series[is_each_row_float],
+            df_series_clean=column_view.get_float_series(is_each_row_float),
             profile=profile
         )
 
@@ -0,0 +1,126 @@
+from . import BaseColumnProfiler
+from .column_view import ColumnView
+from .sketches import MisraGries
+
+
+class HeavyHittersColumn(BaseColumnProfiler):
+    """
+    Heavy hitters column profile subclass of BaseColumnProfiler. Represents the
+    most frequent values of a column in the dataset and their counts, which
+    are tracked in fixed memory.
+    """
+
+    col_type = "heavy_hitters"
+
+    def __init__(self, name, options=None):
+        """
+        Initialization of column base properties and itself.
+
+        :param name: Name of data
+        :type name: String
+        :param options: Options for the Heavy Hitters column
+        :type options: HeavyHittersOptions
+        """
+        self.options = options
+        super(HeavyHittersColumn, self).__init__(name)
+        self.top_k = 20
+        num_counters = 1000
+        if options:
+            self.top_k = options.top_k
+            num_counters = options.num_counters
+        self._sketch = MisraGries(num_counters)
+        self.__calculations = {
+            "is_enabled": HeavyHittersColumn._update_heavy_hitters
+        }
+        self._filter_properties_w_options(self.__calculations, options)
+
+    def __add__(self, other):
+        """
+        Merges the properties of two HeavyHittersColumn profiles
+
+        :param self: first profile
+        :param other: second profile
+        :type self: HeavyHittersColumn
+        :type other: HeavyHittersColumn
+        :return: New HeavyHittersColumn merged profile
+        """
+        if not isinstance(other, HeavyHittersColumn):
+            raise TypeError("Unsupported operand type(s) for +: "
+                            "'HeavyHittersColumn' and '{}'".format(
+                                other.__class__.__name__))
+
+        merged_profile = HeavyHittersColumn(None, options=self.options)
+        merged_profile._sketch = self._sketch + other._sketch
+        BaseColumnProfiler._add_helper(merged_profile, self, other)
+        return merged_profile
+
+    @property
+    def profile(self):
+        """
+        Property for profile. Returns the profile of the column.
+        """
+        profile = dict(
+            statistics=dict(heavy_hitters=self.heavy_hitters),
+            times=self.times
+        )
+        return profile
+
+    @property
+    def heavy_hitters(self):
+        """
+        Property for heavy_hitters. Returns the `top_k` most frequent values
+        and their counts, which are underestimated by at most the number of
+        values / (num_counters + 1).
+        """
+        return self._sketch.get_most_frequent(self.top_k)
+
+    @BaseColumnProfiler._timeit(name="heavy_hitters")
+    def _update_heavy_hitters(self, df_series, prev_dependent_properties=None,
+                              subset_properties=None):
+        """
+        Adds the values of the column to the sketch of the most frequent
+        values.
+
+        :param prev_dependent_properties: Contains all the previous properties
+        that the calculations depend on.
+        :type prev_dependent_properties: dict
+        :param subset_properties: Contains the results of the properties of the
+        subset before they are merged into the main data profile.
+        :type subset_properties: dict
+        :param df_series: Data to be profiled
+        :type df_series: pandas.DataFrame
+        :return: None
+        """
+        self._sketch.update(df_series)
+
+    def _update_helper(self, df_series_clean, profile):
+        """
+        Method for updating the column profile properties with a cleaned
+        dataset and the known profile of the dataset.
+
+        :param df_series_clean: df series with nulls removed
+        :type df_series_clean: pandas.core.series.Series
+        :param profile: heavy hitters profile dictionary
+        :type profile: dict
+        :return: None
+        """
+        self._update_column_base_properties(profile)
+
+    def update(self, df_series):
+        """
+        Updates the column profile.
+
+        :param df_series: Data to profile.
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
+        :return: None
+        """
+        df_series = ColumnView.create(df_series).series
+        profile = dict(
+            sample_size=len(df_series)
+        )
+
+        BaseColumnProfiler._perform_property_calcs(
+            self, self.__calculations, df_series=df_series,
+            prev_dependent_properties={}, subset_properties=profile)
+
+        self._update_helper(df_series, profile)
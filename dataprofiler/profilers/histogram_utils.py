@@ -251,6 +251,69 @@ _hist_bin_selectors = {'stone': _hist_bin_stone,
                        'sturges': _hist_bin_sturges}
 
 
+def _get_bin_widths(a, sorted_a, bin_names):
+    """
+    Estimates the bin width of each of the given bin estimators at once. The
+    statistics shared by the estimators are calculated once, where the range
+    and the interquartile range are read from the sorted data.
+    Parameters
+    ----------
+    a : ndarray
+        Ravelled data array, may not be empty.
+    sorted_a : ndarray
+        The data array sorted.
+    bin_names : list(str)
+        Names of the bin estimators.
+    Returns
+    -------
+    widths : dict
+        An estimate of the optimal bin width of each bin estimator.
+    """
+    size = a.size
+    ptp_a = _unsigned_subtract(sorted_a[-1], sorted_a[0])
+    std = None
+    if {'scott', 'doane'} & set(bin_names):
+        std = np.std(a)
+    fd_bw = None
+    if {'fd', 'auto'} & set(bin_names):
+        iqr = np.subtract(*np.percentile(sorted_a, [75, 25]))
+        fd_bw = 2.0 * iqr * size ** (-1.0 / 3.0)
+    sturges_bw = ptp_a / (np.log2(size) + 1.0)
+
+    widths = dict()
+    for bin_name in bin_names:
+        if bin_name == 'sqrt':
+            widths[bin_name] = ptp_a / np.sqrt(size)
+        elif bin_name == 'sturges':
+            widths[bin_name] = sturges_bw
+        elif bin_name == 'rice':
+            widths[bin_name] = ptp_a / (2.0 * size ** (1.0 / 3))
+        elif bin_name == 'scott':
+            widths[bin_name] = \
+                (24.0 * np.pi ** 0.5 / size) ** (1.0 / 3.0) * std
+        elif bin_name == 'fd':
+            widths[bin_name] = fd_bw
+        elif bin_name == 'auto':
+            widths[bin_name] = min(fd_bw, sturges_bw) if fd_bw else sturges_bw
+        elif bin_name == 'doane':
+            widths[bin_name] = 0.0
+            if size > 2 and std > 0.0:
+                sg1 = np.sqrt(6.0 * (size - 2) / ((size + 1.0) * (size + 3)))
+                temp = a - np.mean(a)
+                np.true_divide(temp, std, temp)
+                np.power(temp, 3, temp)
+                g1 = np.mean(temp)
+                widths[bin_name] = ptp_a / (1.0 + np.log2(size) +
+                                            np.log2(1.0 + np.absolute(g1) / sg1))
+        elif bin_name in _hist_bin_selectors:
+            widths[bin_name] = _hist_bin_selectors[bin_name](
+                a, (sorted_a[0], sorted_a[-1]))
+        else:
+            raise ValueError(
+                "{!r} is not a valid estimator for `bins`".format(bin_name))
+    return widths
+
+
 def _ravel_and_check_weights(a, weights):
     """ Check a and weights have matching shapes, and ravel both """
     a = np.asarray(a)
@@ -3,6 +3,7 @@ import numpy as np
 from .numerical_column_stats import NumericStatsMixin
 from .base_column_profilers import BaseColumnProfiler, \
     BaseColumnPrimitiveTypeProfiler
+from .column_view import ColumnView
 from .profiler_options import IntOptions
 
 
@@ -51,6 +52,9 @@ class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         self._merge_calculations(merged_profile.__calculations,
                                  self.__calculations,
                                  other.__calculations)
+        # the options are kept such that the early elimination and the frozen
+        # histogram selection of the merged profile persist
+        merged_profile.options = self.options or other.options
         return merged_profile
 
     @property
@@ -71,6 +75,8 @@ class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             median=None,
             variance=self.variance,
             stddev=self.stddev,
+            skewness=self.skewness,
+            kurtosis=self.kurtosis,
             histogram=self.histogram_methods[histogram_method]['histogram'],
             quantiles=self.quantiles,
             times=self.times
@@ -100,15 +106,11 @@ class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         For column [1.1 1.1 1.1] returns False
         
         :param df_series: series of values to evaluate
-        :type df_series: pandas.core.series.Series
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: is_int_col
-        :rtype: list
+        :rtype: numpy.ndarray[bool]
         """
-        len_df = len(df_series)
-        if len_df == 0:
-            return list()
-
-        return [NumericStatsMixin.is_int(x) for x in df_series]
+        return ColumnView.create(df_series).is_int
 
     def _update_helper(self, df_series_clean, profile):
         """
@@ -130,23 +132,34 @@ class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         Updates the column profile.
         
         :param df_series: df series
-        :type df_series: pandas.core.series.Series
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: None
         """
         if len(df_series) == 0:
             return
 
-        df_series = df_series.reset_index(drop=True)
-        is_each_row_int = self._is_each_row_int(df_series)
+        column_view = ColumnView.create(df_series)
+        is_each_row_int = self._is_each_row_int(column_view)
         sample_size = len(is_each_row_int)
         match_int_count = np.sum(is_each_row_int)
         profile = dict(match_count=match_int_count, sample_size=sample_size)
+        if self._is_eliminated(match_int_count, sample_size):
+            # the data type ratio can no longer be 1.0, hence only the counts
+            # are tracked
+            if not self._is_eliminated():
+                self._reset_stats()
+            self._update_column_base_properties(profile)
+            return
 
-        BaseColumnProfiler._perform_property_calcs(
-            self, self.__calculations, df_series=df_series[is_each_row_int],
-            prev_dependent_properties={}, subset_properties=profile)
+        if self.__calculations:
+            # only the calculations need the values as strings
+            df_series = column_view.series.reset_index(drop=True)
+            BaseColumnProfiler._perform_property_calcs(
+                self, self.__calculations, df_series=df_series[is_each_row_int],
+                prev_dependent_properties={}, subset_properties=profile)
 
+        # the stats are calculated from the already parsed values
         self._update_helper(
-            df_series_clean=df_series[is_each_row_int],
+            df_series_clean=column_view.get_float_series(is_each_row_int),
             profile=profile
         )
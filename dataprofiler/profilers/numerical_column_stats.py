@@ -8,7 +8,6 @@ from __future__ import print_function
 from __future__ import division
 
 from future.utils import with_metaclass
-import copy
 import time
 import abc
 import warnings
@@ -18,6 +17,7 @@ import numpy as np
 from . import histogram_utils
 from .base_column_profilers import BaseColumnProfiler
 from .profiler_options import NumericalOptions
+from .sketches import KLLSketch
 
 
 class abstractstaticmethod(staticmethod):
@@ -38,6 +38,13 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
     """
     col_type = None
 
+    # number of quantiles in the quantile set
+    _num_quantiles = 1000
+
+    # number of consecutive updates for which the selected bin method must
+    # be unchanged for the selection to be frozen
+    _histogram_freeze_updates = 3
+
     def __init__(self, options=None):
         """
         Initialization of column base properties and itself.
@@ -52,6 +59,13 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         self.max = None
         self.sum = 0
         self.variance = 0
+        # sums of the 3rd and 4th powers of the deviations from the mean, from
+        # which the skewness and kurtosis are calculated
+        self._m3 = 0.
+        self._m4 = 0.
+        # number of values the stats are reduced from, i.e. the matching values
+        # without nan values
+        self._stats_count = 0
         self.max_histogram_bin = 10000
         self.histogram_bin_method_names = ['auto', 'fd', 'doane', 'scott',
                                            'rice', 'sturges', 'sqrt']
@@ -66,10 +80,10 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
                 }
             }
         self.histogram_selection = None
+        self._histogram_selection_streak = 0
 
-        self.quantiles = {
-            bin_num: None for bin_num in range(1000)
-        }
+        self._quantiles = None
+        self._quantile_sketch = self._create_quantile_sketch()
 
         self.__calculations = {
             "min": NumericStatsMixin._get_min,
@@ -88,6 +102,19 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
     def __getitem__(self, item):
         return super(NumericStatsMixin, self).__getitem__(item)
 
+    def _create_quantile_sketch(self):
+        """
+        Creates the sketch of the values from which the quantiles are
+        estimated, if enabled in the options.
+
+        :return: sketch of the values or None if the quantiles are estimated
+            from the histogram
+        :rtype: Union[None, KLLSketch]
+        """
+        if not self.options or not self.options.quantile_sketch.is_enabled:
+            return None
+        return KLLSketch(self.options.quantile_sketch.error_rate)
+
     @BaseColumnProfiler._timeit(name="histogram_and_quantiles")
     def _add_helper_merge_profile_histograms(self, other1, other2):
         """
@@ -108,10 +135,11 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         self.histogram_bin_method_names = bin_methods
 
         for i, method in enumerate(self.histogram_bin_method_names):
-            combined_values = other1._histogram_to_array(
-                method) + other2._histogram_to_array(method)
-            bin_counts, bin_edges = self._get_histogram(
-                combined_values, method)
+            histogram1 = other1.histogram_methods[method]['histogram']
+            histogram2 = other2.histogram_methods[method]['histogram']
+            bin_counts, bin_edges = self._merge_histograms(
+                histogram1['bin_counts'], histogram1['bin_edges'],
+                histogram2['bin_counts'], histogram2['bin_edges'])
             self.histogram_methods[method]['histogram']['bin_counts'] = \
                 bin_counts
             self.histogram_methods[method]['histogram']['bin_edges'] = bin_edges
@@ -120,7 +148,7 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         # Either both profiles have the same selection or you at least use one
         # of the profiles selected method
         self.histogram_selection = other1.histogram_selection
-        self._get_quantiles()
+        self._quantiles = None
 
     def _add_helper(self, other1, other2):
         """
@@ -137,20 +165,44 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
             other2._NumericStatsMixin__calculations)
 
         # Merge variance, histogram, min, max, and sum
+        self._stats_count = other1._stats_count + other2._stats_count
         if "variance" in self.__calculations.keys():
-            self.variance = self._merge_variance(
-                other1.match_count, other1.variance, other1.mean,
-                other2.match_count, other2.variance, other2.mean)
+            with np.errstate(invalid='ignore', over='ignore'):
+                self.variance = self._merge_variance(
+                    other1._stats_count, other1.variance, other1.mean,
+                    other2._stats_count, other2.variance, other2.mean)
+                self._m3, self._m4 = self._merge_moments(
+                    other1._stats_count, other1.mean, other1.variance,
+                    other1._m3, other1._m4,
+                    other2._stats_count, other2.mean, other2.variance,
+                    other2._m3, other2._m4)
         if "histogram_and_quantiles" in self.__calculations.keys():
+            # the quantiles are only estimated from the sketches if both
+            # profiles have one, otherwise from the merged histogram
+            if other1._quantile_sketch is not None \
+                    and other2._quantile_sketch is not None:
+                self._quantile_sketch = \
+                    other1._quantile_sketch + other2._quantile_sketch
             if other1.histogram_selection is not None and \
                     other2.histogram_selection is not None:
                 self._add_helper_merge_profile_histograms(other1, other2)
+                # the selected method is only frozen if both profiles froze
+                # the same method
+                if other1.histogram_selection == other2.histogram_selection:
+                    self._histogram_selection_streak = min(
+                        other1._histogram_selection_streak,
+                        other2._histogram_selection_streak)
             elif other2.histogram_selection is None:
                 self.histogram_methods = other1.histogram_methods
-                self.quantiles = other1.quantiles
+                self.histogram_selection = other1.histogram_selection
+                self._histogram_selection_streak = \
+                    other1._histogram_selection_streak
             else:
                 self.histogram_methods = other2.histogram_methods
-                self.quantiles = other2.quantiles
+                self.histogram_selection = other2.histogram_selection
+                self._histogram_selection_streak = \
+                    other2._histogram_selection_streak
+            self._quantiles = None
         if "min" in self.__calculations.keys():
             if other1.min is not None and other2.min is not None:
                 self.min = min(other1.min, other2.min)
@@ -168,15 +220,104 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         if "sum" in self.__calculations.keys():
             self.sum = other1.sum + other2.sum
 
+    def _is_eliminated(self, match_count=0, sample_size=0):
+        """
+        Determines whether the numeric stats are skipped, i.e. early
+        elimination is enabled and the profile has seen a value which does not
+        match its data type, hence its data type ratio cannot be 1.0.
+
+        :param match_count: number of matching values of the current update
+        :type match_count: int
+        :param sample_size: number of values of the current update
+        :type sample_size: int
+        :return: whether the numeric stats are skipped
+        :rtype: bool
+        """
+        # only the int and float options have early elimination, since a text
+        # profile matches all values
+        early_elimination = getattr(self.options, 'early_elimination', None)
+        if not early_elimination or not early_elimination.is_enabled:
+            return False
+        return self.match_count + match_count \
+            < self.sample_size + sample_size
+
+    def _reset_stats(self):
+        """
+        Resets the numeric stats to their initial values, e.g. once they are
+        skipped due to early elimination.
+
+        :return: None
+        """
+        self.min = None
+        self.max = None
+        self.sum = 0
+        self.variance = 0
+        self._m3 = 0.
+        self._m4 = 0.
+        self._stats_count = 0
+        for method in self.histogram_bin_method_names:
+            self.histogram_methods[method] = {
+                'total_loss': 0,
+                'current_loss': 0,
+                'histogram': {
+                    'bin_counts': None,
+                    'bin_edges': None
+                }
+            }
+        self.histogram_selection = None
+        self._histogram_selection_streak = 0
+        self._quantiles = None
+        self._quantile_sketch = self._create_quantile_sketch()
+
+    @property
+    def _skipped_stats(self):
+        """
+        Names of the stats which are skipped due to early elimination.
+        """
+        if not self._is_eliminated():
+            return []
+        return list(self.__calculations)
+
     @property
     def mean(self):
-        if self.match_count == 0:
+        if self._stats_count == 0:
             return 0
-        return float(self.sum) / self.match_count
+        return float(self.sum) / self._stats_count
+
+    @property
+    def skewness(self):
+        """
+        Sample skewness of the values, adjusted for the sample size like
+        pandas.Series.skew.
+        """
+        count = self._stats_count
+        if "variance" not in self.__calculations or count < 3:
+            return np.nan
+        m2 = self.variance * (count - 1)
+        if m2 <= 0:
+            return 0.
+        return float(count * np.sqrt(count - 1)
+                     / (count - 2) * self._m3 / m2 ** 1.5)
+
+    @property
+    def kurtosis(self):
+        """
+        Sample excess kurtosis of the values, adjusted for the sample size like
+        pandas.Series.kurt.
+        """
+        count = self._stats_count
+        if "variance" not in self.__calculations or count < 4:
+            return np.nan
+        m2 = self.variance * (count - 1)
+        if m2 <= 0:
+            return 0.
+        g2 = count * self._m4 / m2 ** 2 - 3
+        return float((count - 1) / ((count - 2) * (count - 3))
+                     * ((count + 1) * g2 + 6))
 
     @property
     def stddev(self):
-        if self.match_count == 0:
+        if self._stats_count == 0:
             return np.nan
         return np.sqrt(self.variance)
 
@@ -190,8 +331,9 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         :return: combined variance
         :rtype: float
         """
-        return self._merge_variance(self.match_count, self.variance, self.mean,
-                                    batch_count, batch_var, batch_mean)
+        return self._merge_variance(self._stats_count, self.variance,
+                                    self.mean, batch_count, batch_var,
+                                    batch_mean)
 
     @staticmethod
     def _merge_variance(match_count1, variance1, mean1,
@@ -226,6 +368,71 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         new_variance = M2 / (curr_count + match_count2 - 1)
         return new_variance
 
+    @staticmethod
+    def _get_batch_moments(values, mean):
+        """
+        Calculates the sums of the 2nd, 3rd and 4th powers of the deviations of
+        the values from their mean, sharing the deviations and their squares
+        across the sums.
+
+        :param values: values of the chunk
+        :type values: numpy.ndarray[float]
+        :param mean: mean of the values
+        :type mean: float
+        :return: sums of the 2nd, 3rd and 4th powers of the deviations
+        :rtype: tuple(float, float, float)
+        """
+        deviations = values - mean
+        squared_deviations = deviations * deviations
+        return float(squared_deviations.sum()), \
+            float(np.dot(squared_deviations, deviations)), \
+            float(np.dot(squared_deviations, squared_deviations))
+
+    @staticmethod
+    def _merge_moments(match_count1, mean1, variance1, m3_1, m4_1,
+                       match_count2, mean2, variance2, m3_2, m4_2):
+        """
+        Calculate the combined sums of the 3rd and 4th powers of the deviations
+        from the mean of two datasets, with the pairwise formulas of:
+        P. Pebay, "Formulas for robust, one-pass parallel computation of
+        covariances and arbitrary-order statistical moments," Sandia Report
+        SAND2008-6212, 2008.
+
+        :param match_count1: number of samples in chunk 1
+        :param mean1: mean of chunk 1
+        :param variance1: variance of chunk 1
+        :param m3_1: sum of the cubed deviations of chunk 1
+        :param m4_1: sum of the 4th powers of the deviations of chunk 1
+        :param match_count2: number of samples in chunk 2
+        :param mean2: mean of chunk 2
+        :param variance2: variance of chunk 2
+        :param m3_2: sum of the cubed deviations of chunk 2
+        :param m4_2: sum of the 4th powers of the deviations of chunk 2
+        :return: combined sums of the 3rd and 4th powers of the deviations
+        :rtype: tuple(float, float)
+        """
+        if match_count1 < 1:
+            return m3_2, m4_2
+        elif match_count2 < 1:
+            return m3_1, m4_1
+
+        m2_1 = 0. if np.isnan(variance1) else variance1 * (match_count1 - 1)
+        m2_2 = 0. if np.isnan(variance2) else variance2 * (match_count2 - 1)
+        count = match_count1 + match_count2
+        delta = mean2 - mean1
+        m3 = m3_1 + m3_2 \
+            + delta ** 3 * match_count1 * match_count2 \
+            * (match_count1 - match_count2) / count ** 2 \
+            + 3 * delta * (match_count1 * m2_2 - match_count2 * m2_1) / count
+        m4 = m4_1 + m4_2 \
+            + delta ** 4 * match_count1 * match_count2 \
+            * (match_count1 ** 2 - match_count1 * match_count2
+               + match_count2 ** 2) / count ** 3 \
+            + 6 * delta ** 2 * (match_count1 ** 2 * m2_2
+                                + match_count2 ** 2 * m2_1) / count ** 2 \
+            + 4 * delta * (match_count1 * m3_2 - match_count2 * m3_1) / count
+        return m3, m4
+
     def _estimate_stats_from_histogram(self, method):
         # test estimated mean and var
         bin_counts = self.histogram_methods[method]['histogram']['bin_counts']
@@ -239,13 +446,20 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
     def _total_histogram_bin_variance(self, input_array, method):
         # calculate total variance over all bins of a histogram
         bin_edges = self.histogram_methods[method]['histogram']['bin_edges']
-        inds = np.digitize(input_array, bin_edges)
-        sum_var = 0
-        for i in range(1, len(bin_edges)):
-            elements_in_bin = input_array[inds == i]
-            bin_var = elements_in_bin.var() if len(elements_in_bin) > 0 else 0
-            sum_var += bin_var
-        return sum_var
+        num_bins = len(bin_edges) - 1
+        inds = np.digitize(input_array, bin_edges) - 1
+        is_in_bins = (inds >= 0) & (inds < num_bins)
+        inds, input_array = inds[is_in_bins], input_array[is_in_bins]
+
+        # the variance of each bin from the sums of its elements and of their
+        # squared deviations from the mean of the bin
+        bin_sizes = np.maximum(np.bincount(inds, minlength=num_bins), 1)
+        bin_means = np.bincount(
+            inds, weights=input_array, minlength=num_bins) / bin_sizes
+        bin_vars = np.bincount(
+            inds, weights=(input_array - bin_means[inds]) ** 2,
+            minlength=num_bins) / bin_sizes
+        return bin_vars.sum()
 
     @staticmethod
     def _histogram_loss(diff_var, avg_diffvar, total_var,
@@ -287,51 +501,143 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
 
         return selected_method
 
-    def _histogram_to_array(self, bins):
-        # Extend histogram to array format
-        bin_counts = self.histogram_methods[bins]['histogram']['bin_counts']
-        bin_edges = self.histogram_methods[bins]['histogram']['bin_edges']
-        hist_to_array = [[bin_edge] * bin_count for bin_count, bin_edge in
-                         zip(bin_counts[:-1], bin_edges[:-2])]
-        hist_to_array.append([bin_edges[-2]] * int(bin_counts[-1] / 2))
-        hist_to_array.append([bin_edges[-1]] *
-                             (bin_counts[-1] - int(bin_counts[-1] / 2)))
-        array_flatten = [element for sublist in hist_to_array for
-                         element in sublist]
-        return array_flatten
-
     def _get_histogram(self, values, bin_method):
         """
-        Get histogram from values and bin method, using np.histogram
+        Get histogram from values and bin method, equivalent to np.histogram
         :param values: input values
         :type values: np.array or pd.Series
         :param bin_method: bin method, e.g., sqrt, rice, etc
         :type bin_method: str
         :return: bin edges and bin counts
         """
-        if len(np.unique(values)) == 1:
-            bin_counts = np.array([len(values)])
-            if isinstance(values, (np.ndarray, list)):
-                unique_value = values[0]
-            else:
-                unique_value = values.iloc[0]
-            bin_edges = np.array([unique_value, unique_value])
-        else:
-            values, weights = histogram_utils._ravel_and_check_weights(
-                values, None)
-            _, n_equal_bins = histogram_utils._get_bin_edges(
-                values, bin_method, None, None)
-            n_equal_bins = min(n_equal_bins, self.max_histogram_bin)
-            bin_counts, bin_edges = np.histogram(values, bins=n_equal_bins)
+        values, _ = histogram_utils._ravel_and_check_weights(values, None)
+        sorted_values = np.sort(values)
+        bin_width = histogram_utils._get_bin_widths(
+            values, sorted_values, [bin_method])[bin_method]
+        return self._get_histogram_from_sorted(sorted_values, bin_width)
+
+    def _get_histogram_from_sorted(self, sorted_values, bin_width):
+        """
+        Get histogram of equal width bins from sorted values, where the count
+        of each bin is the difference of the positions of its edges in the
+        sorted values, equivalent to np.histogram.
+
+        :param sorted_values: input values sorted
+        :type sorted_values: numpy.ndarray
+        :param bin_width: estimated bin width of the bin method
+        :type bin_width: float
+        :return: bin edges and bin counts
+        """
+        first_edge, last_edge = sorted_values[0], sorted_values[-1]
+        if first_edge == last_edge:
+            return np.array([len(sorted_values)]), \
+                np.array([first_edge, last_edge])
+
+        n_equal_bins = 1
+        if bin_width:
+            n_equal_bins = int(np.ceil(histogram_utils._unsigned_subtract(
+                last_edge, first_edge) / bin_width))
+        n_equal_bins = min(n_equal_bins, self.max_histogram_bin)
+        bin_edges = np.linspace(first_edge, last_edge, n_equal_bins + 1)
+
+        # bins are half open except the last, which includes the last edge
+        bin_starts = np.searchsorted(sorted_values, bin_edges[:-1], side='left')
+        bin_counts = np.diff(np.append(bin_starts, len(sorted_values)))
+        return bin_counts, bin_edges
+
+    @staticmethod
+    def _rebin_histogram(bin_counts, bin_edges, new_bin_edges):
+        """
+        Redistributes the counts of a histogram into new bins which cover its
+        bins. The values are assumed to be uniformly distributed within each
+        bin, hence a bin is split in proportion to its overlap with the new
+        bins, and a bin of zero width, i.e. of a single value, is added to the
+        new bin which contains its value. The split counts are rounded by their
+        largest remainders, such that the total count is conserved exactly.
+
+        :param bin_counts: counts of the bins of the histogram
+        :type bin_counts: numpy.ndarray[int]
+        :param bin_edges: edges of the bins of the histogram
+        :type bin_edges: numpy.ndarray[float]
+        :param new_bin_edges: edges of the new bins
+        :type new_bin_edges: numpy.ndarray[float]
+        :return: counts of the new bins
+        :rtype: numpy.ndarray[int]
+        """
+        bin_counts = np.asarray(bin_counts)
+        bin_edges = np.asarray(bin_edges, dtype=float)
+        new_bin_counts = np.zeros(len(new_bin_edges) - 1)
+
+        is_point = bin_edges[1:] == bin_edges[:-1]
+        if is_point.any():
+            point_inds = np.searchsorted(
+                new_bin_edges, bin_edges[:-1][is_point], side='right') - 1
+            point_inds = np.clip(point_inds, 0, len(new_bin_counts) - 1)
+            np.add.at(new_bin_counts, point_inds, bin_counts[is_point])
+
+        # the cumulative counts at the new edges split the bins in proportion
+        # to their overlap
+        cumulative_counts = np.concatenate(
+            [[0], np.cumsum(np.where(is_point, 0, bin_counts))])
+        new_bin_counts += np.diff(
+            np.interp(new_bin_edges, bin_edges, cumulative_counts))
+
+        rounded_counts = np.floor(new_bin_counts)
+        num_remaining = int(bin_counts.sum() - rounded_counts.sum())
+        if num_remaining > 0:
+            remainders = new_bin_counts - rounded_counts
+            largest_inds = np.argsort(-remainders, kind='stable')
+            rounded_counts[largest_inds[:num_remaining]] += 1
+        return rounded_counts.astype(int)
+
+    def _merge_histograms(self, bin_counts1, bin_edges1, bin_counts2,
+                          bin_edges2):
+        """
+        Merges two histograms into a histogram of equal width bins which covers
+        both of them, with as many bins as the histogram with the most bins, at
+        most `max_histogram_bin`. The counts are rebinned rather than the
+        values recreated, hence the size of the histogram and the cost of
+        merging are bounded regardless of the number of values.
+
+        :param bin_counts1: counts of the bins of the first histogram
+        :type bin_counts1: numpy.ndarray[int]
+        :param bin_edges1: edges of the bins of the first histogram
+        :type bin_edges1: numpy.ndarray[float]
+        :param bin_counts2: counts of the bins of the second histogram
+        :type bin_counts2: numpy.ndarray[int]
+        :param bin_edges2: edges of the bins of the second histogram
+        :type bin_edges2: numpy.ndarray[float]
+        :return: bin counts and bin edges of the merged histogram
+        :rtype: tuple(numpy.ndarray[int], numpy.ndarray[float])
+        """
+        num_bins = min(max(len(bin_counts1), len(bin_counts2)),
+                       self.max_histogram_bin)
+        bin_edges = np.linspace(min(bin_edges1[0], bin_edges2[0]),
+                                max(bin_edges1[-1], bin_edges2[-1]),
+                                num_bins + 1)
+        bin_counts = \
+            self._rebin_histogram(bin_counts1, bin_edges1, bin_edges) \
+            + self._rebin_histogram(bin_counts2, bin_edges2, bin_edges)
         return bin_counts, bin_edges
 
-    def _merge_histogram(self, values, bins):
-        # values is the current array of values,
-        # that needs to be updated to the accumulated histogram
-        combined_values = values + self._histogram_to_array(bins)
-        bin_counts, bin_edges = self._get_histogram(combined_values, bins)
-        self.histogram_methods[bins]['histogram']['bin_counts'] = bin_counts
-        self.histogram_methods[bins]['histogram']['bin_edges'] = bin_edges
+    def _merge_histogram(self, bin_counts, bin_edges, bins):
+        """
+        Merges the histogram of a chunk of values into the accumulated
+        histogram of the bin method.
+
+        :param bin_counts: counts of the bins of the histogram of the chunk
+        :type bin_counts: numpy.ndarray[int]
+        :param bin_edges: edges of the bins of the histogram of the chunk
+        :type bin_edges: numpy.ndarray[float]
+        :param bins: bin method of the histogram
+        :type bins: str
+        :return: None
+        """
+        histogram = self.histogram_methods[bins]['histogram']
+        histogram['bin_counts'], histogram['bin_edges'] = \
+            self._merge_histograms(histogram['bin_counts'],
+                                   histogram['bin_edges'],
+                                   bin_counts, bin_edges)
 
     def _update_histogram(self, df_series):
         """
@@ -347,6 +653,11 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         losses up to the current time: all methods are compared using the
         accumulated losses, and the best method with minimal loss is picked
 
+        The values are sorted once, from which the histograms of all the
+        methods are calculated. If enabled in the options, the selected method
+        is frozen once it has been selected for a number of consecutive
+        updates, after which the losses are no longer calculated.
+
         :param df_series: a given column
         :type df_series: pandas.core.series.Series
         :return:
@@ -356,89 +667,126 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         if df_series.empty:
             return
 
+        values = df_series.values
+        sorted_values = np.sort(values)
+        bin_widths = histogram_utils._get_bin_widths(
+            values, sorted_values, self.histogram_bin_method_names)
+        is_frozen = self._is_histogram_selection_frozen()
+
         current_est_var = np.zeros(len(self.histogram_bin_method_names))
-        current_exact_var = np.zeros(len(self.histogram_bin_method_names))
+        current_exact_var = values.var()
         current_total_var = np.zeros(len(self.histogram_bin_method_names))
         current_run_time = np.zeros(len(self.histogram_bin_method_names))
         for i, method in enumerate(self.histogram_bin_method_names):
             # update histogram for the method
             start_time = time.time()
-            bin_counts, bin_edges = self._get_histogram(df_series, method)
+            bin_counts, bin_edges = self._get_histogram_from_sorted(
+                sorted_values, bin_widths[method])
             if self.histogram_methods[method]['histogram']['bin_counts'] is None:
                 self.histogram_methods[method]['histogram']['bin_counts'] = bin_counts
                 self.histogram_methods[method]['histogram']['bin_edges'] = bin_edges
             else:
-                self._merge_histogram(df_series.tolist(), bins=method)
+                self._merge_histogram(bin_counts, bin_edges, bins=method)
             run_time = time.time() - start_time
-            # update loss for the method
-            current_est_var[i] = self._estimate_stats_from_histogram(method)[1]
-            current_exact_var = df_series.values.var()
-            current_total_var[i] = self._total_histogram_bin_variance(
-                df_series.values, method)
             current_run_time[i] = run_time
+            self.times['histogram_method_{}'.format(method)] += run_time
+            # update loss for the method
+            if not is_frozen:
+                current_est_var[i] = \
+                    self._estimate_stats_from_histogram(method)[1]
+                current_total_var[i] = self._total_histogram_bin_variance(
+                    sorted_values, method)
+
+        if is_frozen:
+            return
 
         # select the best method and update the total loss
         selected_method = self._select_method_for_histogram(
             current_exact_var, current_est_var,
             current_total_var, current_run_time)
+        if selected_method == self.histogram_selection:
+            self._histogram_selection_streak += 1
+        else:
+            self._histogram_selection_streak = 0
         self.histogram_selection = selected_method
 
-    def _get_percentile(self, percentile):
+    def _is_histogram_selection_frozen(self):
+        """
+        Determines whether the selected bin method of the histogram is frozen,
+        i.e. freezing is enabled and the method has been selected for the
+        required number of consecutive updates.
+
+        :return: whether the selected bin method is frozen
+        :rtype: bool
         """
-        Get value for the number where the given percentage of values fall below
-        it.
+        if not self.options \
+                or not self.options.freeze_histogram_selection.is_enabled:
+            return False
+        return self._histogram_selection_streak \
+            >= self._histogram_freeze_updates
 
-        :param percentile: Percentage of values to fall before the value
-        :type percentile: float
-        :return: Value for which the percentage of values in the distribution
-            fall before the percentage
+    def _get_percentiles(self, percentiles):
+        """
+        Get the values for the numbers where the given percentages of values
+        fall below them, estimated from the quantile sketch if available,
+        otherwise from the selected histogram.
+
+        :param percentiles: Percentages of values to fall before the values
+        :type percentiles: Union[list(float), numpy.ndarray]
+        :return: Values for which the percentages of values in the
+            distribution fall before the percentages, None if no values have
+            been profiled
+        :rtype: list
         """
+        percentiles = np.asarray(percentiles, dtype=float)
+        if self._quantile_sketch is not None and self._quantile_sketch.count:
+            return self._quantile_sketch.get_quantiles(
+                percentiles / 100).tolist()
+
         selected_method = self.histogram_selection
+        if selected_method is None:
+            return [None] * len(percentiles)
         bin_counts = \
             self.histogram_methods[selected_method]['histogram']['bin_counts']
-        bin_edges = \
-            self.histogram_methods[selected_method]['histogram']['bin_edges']
-        num_edges = len(bin_edges)
-
-        if percentile == 100:
-            return bin_edges[-1]
-        percentile = float(percentile) / 100
-
-        accumulated_count = 0
-        bin_counts = bin_counts.astype(float)
-        normalized_bin_counts = bin_counts / np.sum(bin_counts)
-
-        bin_id = -1
-        # keep updating the total counts until it is
-        # close to the designated percentile
-        while accumulated_count < percentile:
-            bin_id += 1
-            accumulated_count += normalized_bin_counts[bin_id]
-
-        if accumulated_count == percentile:
-            if (num_edges % 2) == 0:
-                return 0.5 * (bin_edges[bin_id] + bin_edges[bin_id + 1])
-            else:
-                return bin_edges[bin_id + 1]
+        bin_edges = np.asarray(
+            self.histogram_methods[selected_method]['histogram']['bin_edges'],
+            dtype=float)
+        bin_mids = 0.5 * (bin_edges[:-1] + bin_edges[1:])
+
+        # the first bin whose accumulated count reaches each percentile
+        accumulated_counts = np.cumsum(
+            bin_counts.astype(float) / np.sum(bin_counts))
+        bin_ids = np.minimum(
+            np.searchsorted(accumulated_counts, percentiles / 100),
+            len(bin_counts) - 1)
+        is_reached = accumulated_counts[bin_ids] == percentiles / 100
+
+        if len(bin_edges) % 2 == 0:
+            values = np.where(is_reached, bin_mids[bin_ids],
+                              bin_mids[np.maximum(bin_ids - 1, 0)])
         else:
-            if bin_id == 0:
-                return 0.5 * (bin_edges[0] + bin_edges[1])
-            if (num_edges % 2) == 0:
-                return 0.5 * (bin_edges[bin_id - 1] + bin_edges[bin_id])
-            else:
-                return bin_edges[bin_id]
+            values = np.where(is_reached, bin_edges[bin_ids + 1],
+                              bin_edges[bin_ids])
+            values = np.where(~is_reached & (bin_ids == 0), bin_mids[0],
+                              values)
+        values = np.where(percentiles == 100, bin_edges[-1], values)
+        return values.tolist()
 
-    def _get_quantiles(self):
+    @property
+    def quantiles(self):
         """
-        Retrieves the quantile set based on the specified number of quantiles
-        in self.quantiles.
+        Quantile set of the specified number of quantiles, which is calculated
+        once it is accessed and cached until the profile is updated.
 
-        :return: list of quantiles
+        :return: quantiles by their index
+        :rtype: dict
         """
-        size_bins = 100 / len(self.quantiles)
-        for bin_num in range(len(self.quantiles) - 1):
-            self.quantiles[bin_num] = self._get_percentile(
-                percentile=((bin_num + 1) * size_bins))
+        if self._quantiles is None:
+            num_quantiles = self._num_quantiles
+            self._quantiles = dict(enumerate(self._get_percentiles(
+                np.arange(1, num_quantiles) * (100 / num_quantiles))))
+            self._quantiles[num_quantiles - 1] = None
+        return self._quantiles
 
     def _update_helper(self, df_series_clean, profile):
         """
@@ -455,57 +803,104 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
             return
 
         prev_dependent_properties = {"mean": self.mean}
-        subset_properties = copy.deepcopy(profile)
+        # the calculations only add their results to the subset properties,
+        # hence a shallow copy of the profile suffices
+        subset_properties = dict(profile)
         df_series_clean = df_series_clean.astype(float)
+        # the calculations reduce the values directly, hence nan values, e.g.
+        # parsed from "nan", are dropped once beforehand and are not counted
+        # in the stats
+        is_nan = np.isnan(df_series_clean.values)
+        if is_nan.any():
+            df_series_clean = df_series_clean[~is_nan]
+            if df_series_clean.empty:
+                return
+        self._get_batch_stats(df_series_clean.values, subset_properties)
         super(NumericStatsMixin, self)._perform_property_calcs(self.__calculations,
                                      df_series=df_series_clean,
                                      prev_dependent_properties=prev_dependent_properties,
                                      subset_properties=subset_properties)
+        self._stats_count += len(df_series_clean)
+
+    def _get_batch_stats(self, values, subset_properties):
+        """
+        Reduces the values to the enabled stats of the batch in one pass, i.e.
+        the min, max and sum, from which the mean is derived, and the sums of
+        the powers of the deviations from the mean. The results are added to
+        the subset properties, from which the calculations merge them into the
+        profile. Since the stats are reduced together, the time of the
+        reduction is divided evenly among the times of the enabled stats.
+
+        :param values: values of the batch without nan values
+        :type values: numpy.ndarray[float]
+        :param subset_properties: Contains the results of the properties of
+            the subset before they are merged into the main data profile.
+        :type subset_properties: dict
+        :return: None
+        """
+        calculations = self.__calculations
+        subset_properties["batch_count"] = len(values)
+        stat_names = [name for name in ("min", "max", "sum", "variance")
+                      if name in calculations]
+        if not stat_names:
+            return
+
+        ts = time.time()
+        # infinite values result in nan sums and moments, as in pandas
+        with np.errstate(invalid='ignore', over='ignore'):
+            if "min" in calculations:
+                subset_properties["min"] = values.min()
+            if "max" in calculations:
+                subset_properties["max"] = values.max()
+            if "sum" in calculations or "variance" in calculations:
+                subset_properties["sum"] = values.sum()
+            if "variance" in calculations:
+                subset_properties["moments"] = self._get_batch_moments(
+                    values, subset_properties["sum"] / len(values))
+        te = time.time()
+        for name in stat_names:
+            self.times[name] += (te - ts) / len(stat_names)
 
-    @BaseColumnProfiler._timeit(name="min")
     def _get_min(self, df_series, prev_dependent_properties,
                  subset_properties):
-        min_value = df_series.min()
+        min_value = subset_properties["min"]
         self.min = min_value if not self.min else min(self.min, min_value)
-        subset_properties["min"] = min_value
 
-    @BaseColumnProfiler._timeit(name="max")
     def _get_max(self, df_series, prev_dependent_properties,
                  subset_properties):
-        max_value = df_series.max()
+        max_value = subset_properties["max"]
         self.max = max_value if not self.max else max(self.max, max_value)
-        subset_properties["max"] = max_value
 
-    @BaseColumnProfiler._timeit(name="sum")
     def _get_sum(self, df_series, prev_dependent_properties,
                  subset_properties):
-        sum_value = df_series.sum()
-        subset_properties["sum"] = sum_value
-        self.sum = self.sum + sum_value
+        self.sum = self.sum + subset_properties["sum"]
 
-    @BaseColumnProfiler._timeit(name="variance")
     def _get_variance(self, df_series, prev_dependent_properties,
                       subset_properties):
-        variance = df_series.var()
+        batch_count = subset_properties["batch_count"]
+        batch_mean = float(subset_properties["sum"]) / batch_count
+        batch_m2, batch_m3, batch_m4 = subset_properties["moments"]
+        variance = batch_m2 / (batch_count - 1) if batch_count > 1 else np.nan
         subset_properties["variance"] = variance
-        sum_value = subset_properties["sum"]
-        batch_count = subset_properties["match_count"]
-        batch_mean = 0. if not batch_count else \
-            float(sum_value) / batch_count
-        self.variance = self._merge_variance(self.match_count, self.variance,
-                                             prev_dependent_properties["mean"],
-                                             batch_count,
-                                             variance,
-                                             batch_mean)
+        with np.errstate(invalid='ignore', over='ignore'):
+            self._m3, self._m4 = self._merge_moments(
+                self._stats_count, prev_dependent_properties["mean"],
+                self.variance, self._m3, self._m4,
+                batch_count, batch_mean, variance, batch_m3, batch_m4)
+            self.variance = self._merge_variance(
+                self._stats_count, self.variance,
+                prev_dependent_properties["mean"], batch_count, variance,
+                batch_mean)
 
     @BaseColumnProfiler._timeit(name="histogram_and_quantiles")
     def _get_histogram_and_quantiles(self, df_series,
                                      prev_dependent_properties,
                                      subset_properties):
         try:
+            if self._quantile_sketch is not None:
+                self._quantile_sketch.update(df_series.values)
             self._update_histogram(df_series)
-            if self.histogram_selection is not None:
-                self._get_quantiles()
+            self._quantiles = None
         except BaseException:
             warnings.warn(
                 'Histogram error. Histogram and quantile results will not be '
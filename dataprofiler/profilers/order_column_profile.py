@@ -1,4 +1,5 @@
 from . import BaseColumnProfiler
+from .column_view import ColumnView
 
 
 class OrderColumn(BaseColumnProfiler):
@@ -240,36 +241,36 @@ class OrderColumn(BaseColumnProfiler):
         Additionally, returns the first and last value of the series.
 
         :param df_series: a given column
-        :type df_series: pandas.core.series.Series
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: order, first_value, last_value
         :rtype: String, Float, Float
         """
-        try:
-            df_series = df_series.astype(float)
-        except ValueError:
-            pass
-
-        order = None
-        last_value = df_series.iloc[0]
-        first_value = df_series.iloc[0]
-
-        for i in range(1, len(df_series)):
-            value = df_series.iloc[i]
-            if value < last_value and order == 'ascending':
-                order = 'random'
-                break
-            elif value < last_value and order is None:
-                order = 'descending'
-            elif value > last_value and order == 'descending':
-                order = 'random'
-                break
-            elif value > last_value and order is None:
-                order = 'ascending'
-            last_value = value
-        if not order:
-            order = "constant value"
-
-        return order, first_value, last_value
+        # values are compared as floats if they can all be parsed as floats
+        column_view = ColumnView.create(df_series)
+        if column_view.is_float.all():
+            values = column_view.float_values
+        else:
+            values = column_view.series.values
+
+        # each value is compared to the previous value, incomparable values,
+        # e.g. nan, are neither ascending nor descending
+        first_value = values[0]
+        is_ascending = values[1:] > values[:-1]
+        is_descending = values[1:] < values[:-1]
+        is_changed = is_ascending | is_descending
+        if not is_changed.any():
+            return "constant value", first_value, values[-1]
+
+        # the order is set by the first change of the values and becomes
+        # random at the first change in the opposite direction, in which case
+        # the last value is the value before that change
+        if is_descending[is_changed.argmax()]:
+            order, is_reversed = "descending", is_ascending
+        else:
+            order, is_reversed = "ascending", is_descending
+        if is_reversed.any():
+            return "random", first_value, values[is_reversed.argmax()]
+        return order, first_value, values[-1]
 
     def _update_order(self, df_series, prev_dependent_properties=None, 
                       subset_properties=None):
@@ -281,7 +282,7 @@ class OrderColumn(BaseColumnProfiler):
            order information.
 
         :param df_series: Data to be profiled
-        :type df_series: pandas.DataFrame
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :param prev_dependent_properties: Contains all the previous properties
         that the calculations depend on.
         :type prev_dependent_properties: dict
@@ -318,7 +319,7 @@ class OrderColumn(BaseColumnProfiler):
         Updates the column profile.
 
         :param df_series: df series
-        :type df_series: pandas.core.series.Series
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: None
         """
         if len(df_series) == 0:
@@ -326,6 +327,6 @@ class OrderColumn(BaseColumnProfiler):
 
         profile = dict(sample_size=len(df_series))
         BaseColumnProfiler._perform_property_calcs(
-            self, self.__calculations, df_series=df_series,
+            self, self.__calculations, df_series=ColumnView.create(df_series),
             prev_dependent_properties={}, subset_properties=profile)
         self._update_helper(df_series, profile)
@@ -9,33 +9,62 @@ from __future__ import print_function
 from __future__ import division
 
 import copy
-import random
 import re
 import hashlib
+import operator
+import sys
 from collections import OrderedDict
+from concurrent import futures
 
+import numpy as np
 import pandas as pd
 
+from . import sampling
+from . import serialization
 from . import utils
 from .. import data_readers
 from .column_profile_compilers import ColumnPrimitiveTypeProfileCompiler, \
     ColumnStatsProfileCompiler, ColumnDataLabelerCompiler
+from .column_view import ColumnView
 from .helpers.report_helpers import calculate_quantiles, _prepare_report
+from .numerical_column_stats import NumericStatsMixin
 from .profiler_options import ProfilerOptions, StructuredOptions
+from .sketches import ExactUniqueCounter, HyperLogLog
 
 
 class StructuredDataProfile(object):
 
     def __init__(self, df_series, sample_size=None, min_sample_size=500,
                  sampling_ratio=0.2, min_true_samples=None,
-                 options=None):
+                 options=None, row_sample=None, sampling_options=None):
+        """
+        Profile of a single column of a structured dataset. If `df_series` is
+        None, an empty profile without any column profiles is created, e.g. to
+        hold the merger of two profiles. The rows of the column are sampled in
+        the order of `row_sample`, e.g. shared by all the columns of a dataset,
+        or in a new random order if None. If the `sampling_options` are
+        adaptive, the column is profiled in batches of increasing size until
+        its estimates converge.
+        """
         self.options = options
+        self._sampling_options = sampling_options
         self._min_sample_size = min_sample_size
         self._sampling_ratio = sampling_ratio
         self._min_true_samples = min_true_samples
         if self._min_true_samples is None:
             self._min_true_samples = 0
 
+        self.name = None
+        self.sample_size = 0
+        self._sample_reservoir = sampling.ReservoirSampler(5)
+        self.null_count = 0
+        self.null_types = list()
+        self.null_types_index = {}
+        self.profiles = dict()
+        self._convergence = None
+        if df_series is None:
+            return
+
         # if you create your own DF without giving the column name,
         # it labels the name as an int64, however, if you try to
         # `json.dump` an int64, it errors.
@@ -44,16 +73,33 @@ class StructuredDataProfile(object):
         else:
             self.name = int(df_series.name)
 
-        self.sample_size = 0
-        self.sample = list()
-        self.null_count = 0
-        self.null_types = list()
-        self.null_types_index = {}
+        if self._is_adaptive:
+            # the column profiles are created empty and updated with each batch
+            self._create_profiles(pd.Series([], dtype=object, name=self.name))
+            self._update_profile_adaptively(
+                df_series, sample_size or len(df_series),
+                row_sample=row_sample)
+            return
+
         if not sample_size:
             sample_size = self._get_sample_size(df_series)
         clean_sampled_df, base_stats = \
-            self.get_base_props_and_clean_null_params(df_series, sample_size)
+            self.get_base_props_and_clean_null_params(
+                df_series, sample_size, row_sample=row_sample)
         self._update_base_stats(base_stats)
+        self._create_profiles(clean_sampled_df)
+
+    def _create_profiles(self, clean_sampled_df):
+        """
+        Creates the column profiles from the cleaned sample of the column.
+
+        :param clean_sampled_df: sampled values of the column without nulls
+        :type clean_sampled_df: pandas.core.series.Series
+        :return: None
+        """
+        # the cleaned values are already strings or native values, hence the
+        # view of the column is created once and shared across the compilers
+        clean_sampled_df = ColumnView(clean_sampled_df)
         self.profiles = {
             'data_type_profile':
                 ColumnPrimitiveTypeProfileCompiler(clean_sampled_df,
@@ -63,14 +109,49 @@ class StructuredDataProfile(object):
 
         # use the data labeler by default
         use_data_labeler = True
-        if options and isinstance(options, StructuredOptions):
-            use_data_labeler = options.data_labeler.is_enabled
+        if self.options and isinstance(self.options, StructuredOptions):
+            use_data_labeler = self.options.data_labeler.is_enabled
 
         if use_data_labeler:
             self.profiles.update(
                 {'data_label_profile':
                      ColumnDataLabelerCompiler(clean_sampled_df, self.options)})
 
+    def _update_data_labeler_profile(self, df_series, sample_size,
+                                     row_sample=None,
+                                     data_labeler_profile=None):
+        """
+        Creates or updates the data labeler profile of a column which was
+        profiled without it, e.g. in another process to which the data labeler
+        can't be sent, from the same rows of the column as the other profiles.
+
+        :param df_series: the column which was profiled
+        :type df_series: pandas.core.series.Series
+        :param sample_size: number of rows of the column which were profiled
+            in the update
+        :type sample_size: int
+        :param row_sample: random order in which the rows were sampled
+        :type row_sample: sampling.RowSample
+        :param data_labeler_profile: existing data labeler profile of the
+            column, if None, it is created
+        :type data_labeler_profile: Union[None, ColumnDataLabelerCompiler]
+        :return: None
+        """
+        # the rows are sampled from the start of the random order, hence the
+        # profiled rows are the first `sample_size` rows of the order
+        clean_sampled_df = df_series.iloc[:0]
+        if sample_size:
+            clean_sampled_df, _ = self.get_base_props_and_clean_null_params(
+                df_series, sample_size, min_true_samples=0,
+                row_sample=row_sample)
+        clean_sampled_df = ColumnView(clean_sampled_df)
+        if data_labeler_profile is None:
+            data_labeler_profile = ColumnDataLabelerCompiler(
+                clean_sampled_df, self.options)
+        else:
+            data_labeler_profile.update_profile(clean_sampled_df)
+        self.profiles['data_label_profile'] = data_labeler_profile
+
     def __add__(self, other):
         """
         Merges two Structured profiles together overriding the `+` operator.
@@ -89,32 +170,42 @@ class StructuredDataProfile(object):
             raise ValueError('Structured profilers were not setup with the same'
                              ' options, hence they do not calculate the same '
                              'profiles and cannot be added together.')
+        # the column profiles are merged below, hence the merged profile
+        # is created without any
         merged_profile = StructuredDataProfile(
-            df_series=pd.Series([]),
+            df_series=None,
             min_sample_size=max(self._min_sample_size, other._min_sample_size),
             sampling_ratio=max(self._sampling_ratio, other._sampling_ratio),
             min_true_samples=max(self._min_true_samples,
-                                 other._min_true_samples))
+                                 other._min_true_samples),
+            options=self.options,
+            sampling_options=self._sampling_options)
 
         merged_profile.name = self.name
+        merged_profile._convergence = self._merge_convergence(
+            self._convergence, other._convergence)
         merged_profile._update_base_stats(
-            {"sample": self.sample, 'sample_size': self.sample_size,
+            {"sample": self._sample_reservoir, 'sample_size': self.sample_size,
              "null_count": self.null_count,
              "null_types": copy.deepcopy(self.null_types_index)}
         )
         merged_profile._update_base_stats(
-            {"sample": other.sample, 'sample_size': other.sample_size,
+            {"sample": other._sample_reservoir,
+             'sample_size': other.sample_size,
              "null_count": other.null_count,
              "null_types": copy.deepcopy(other.null_types_index)}
         )
-        samples = list(dict.fromkeys(self.sample + other.sample))
-        merged_profile.sample = random.sample(samples, min(len(samples), 5))
         for profile_name in self.profiles:
             merged_profile.profiles[profile_name] = (
                 self.profiles[profile_name] + other.profiles[profile_name]
             )
         return merged_profile
 
+    @property
+    def sample(self):
+        """Random example values of the column."""
+        return self._sample_reservoir.samples
+
     @property
     def profile(self):
         unordered_profile = dict()
@@ -134,6 +225,9 @@ class StructuredDataProfile(object):
                     unordered_profile["data_type_representation"],
                 "data_label_probability": None,
             })
+            if self._convergence is not None:
+                unordered_profile["statistics"]["convergence"] = \
+                    self._convergence
 
         dict_order = [
             "column_name",
@@ -175,7 +269,8 @@ class StructuredDataProfile(object):
 
     def _update_base_stats(self, base_stats):
         self.sample_size += base_stats["sample_size"]
-        self.sample = base_stats["sample"]
+        # the examples are sampled uniformly from all the profiled values
+        self._sample_reservoir += base_stats["sample"]
         self.null_count += base_stats["null_count"]
         self.null_types = self._combine_unique_sets(
             self.null_types, list(base_stats["null_types"].keys())
@@ -186,18 +281,182 @@ class StructuredDataProfile(object):
                 null_rows.sort()
             self.null_types_index.setdefault(null_type, []).extend(null_rows)
 
-    def update_profile(self, df_series, sample_size=None, min_true_samples=None):
+    def update_profile(self, df_series, sample_size=None, min_true_samples=None,
+                       row_sample=None):
+        if self._is_adaptive:
+            self._update_profile_adaptively(
+                df_series, sample_size or len(df_series),
+                min_true_samples=min_true_samples, row_sample=row_sample)
+            return
         if not sample_size:
             sample_size = len(df_series)
         if not sample_size:
             sample_size = self._get_sample_size(df_series)
         clean_sampled_df, base_stats = \
             self.get_base_props_and_clean_null_params(
-                df_series, sample_size, min_true_samples=min_true_samples)
+                df_series, sample_size, min_true_samples=min_true_samples,
+                row_sample=row_sample)
         self._update_base_stats(base_stats)
+        clean_sampled_df = ColumnView(clean_sampled_df)
         for profile in self.profiles.values():
             profile.update_profile(clean_sampled_df)
 
+    @property
+    def _is_adaptive(self):
+        """Whether the column is profiled until its estimates converge."""
+        return bool(self._sampling_options
+                    and self._sampling_options.adaptive)
+
+    def _update_profile_adaptively(self, df_series, max_sample_size,
+                                   min_true_samples=None, row_sample=None):
+        """
+        Updates the profile with batches of increasing size of the rows of the
+        column, in their random order, until the estimates of the profile
+        change by at most the convergence tolerance between two batches, or
+        `max_sample_size` rows are profiled.
+
+        :param df_series: a given column
+        :type df_series: pandas.core.series.Series
+        :param max_sample_size: max number of rows which are profiled
+        :type max_sample_size: int
+        :param min_true_samples: minimum number of non-null samples profiled
+            before the estimates can converge
+        :type min_true_samples: int
+        :param row_sample: random order in which the rows are sampled, if None,
+            a new random order is used
+        :type row_sample: sampling.RowSample
+        :return: None
+        """
+        if min_true_samples is None:
+            min_true_samples = self._min_true_samples
+        len_df = len(df_series)
+        if row_sample is None or row_sample.data_length != len_df:
+            row_sample = sampling.RowSample(len_df)
+        max_sample_size = min(max_sample_size, len_df)
+        tolerance = self._sampling_options.convergence_tolerance
+
+        convergence = {"converged": False, "max_change": None,
+                       "tolerance": tolerance, "batches": 0}
+        estimates = None
+        true_sample_size = 0
+        start = 0
+        stop = min(self._sampling_options.initial_batch_size, max_sample_size)
+        while start < stop:
+            clean_sampled_df, base_stats = \
+                self.get_base_props_and_clean_null_params(
+                    df_series, stop - start, min_true_samples=0,
+                    row_sample=row_sample, start=start)
+            self._update_base_stats(base_stats)
+            true_sample_size += len(clean_sampled_df)
+            clean_sampled_df = ColumnView(clean_sampled_df)
+            for profile in self.profiles.values():
+                profile.update_profile(clean_sampled_df)
+            convergence["batches"] += 1
+
+            prev_estimates, estimates = \
+                estimates, self._get_convergence_estimates()
+            if prev_estimates is not None:
+                max_change = self._get_max_change(prev_estimates, estimates)
+                convergence["max_change"] = max_change
+                if max_change <= tolerance \
+                        and true_sample_size >= min_true_samples:
+                    convergence["converged"] = True
+                    break
+            start, stop = stop, min(
+                max(int(stop * self._sampling_options.batch_growth_factor),
+                    stop + 1),
+                max_sample_size)
+
+        self._convergence = self._merge_convergence(
+            self._convergence, convergence)
+
+    def _get_convergence_estimates(self):
+        """
+        Gets the estimates of the profile which must converge: the ratios of
+        the data types, the null ratio, the mean and variance of the numeric
+        profiles and whether the column is categorical.
+
+        :return: the estimates by name
+        :rtype: dict
+        """
+        estimates = {
+            "null_ratio":
+                self.null_count / self.sample_size if self.sample_size else 0.,
+            "categorical": None,
+        }
+        for profile in self.profiles['data_type_profile']._profiles.values():
+            estimates[profile.col_type + "_ratio"] = \
+                profile.data_type_ratio or 0.
+            if isinstance(profile, NumericStatsMixin) and profile.match_count:
+                estimates[profile.col_type + "_mean"] = profile.mean
+                estimates[profile.col_type + "_variance"] = profile.variance
+        category_profile = \
+            self.profiles['data_stats_profile']._profiles.get('category')
+        if category_profile is not None:
+            estimates["categorical"] = category_profile.is_match
+        return estimates
+
+    @staticmethod
+    def _get_max_change(prev_estimates, estimates):
+        """
+        Gets the max change between two sets of estimates. Ratios change
+        absolutely, the means relative to the standard deviation and the
+        variances relatively. A changed categorical decision or a newly
+        estimated statistic is a change of 1.
+
+        :param prev_estimates: estimates of the previous batch
+        :type prev_estimates: dict
+        :param estimates: estimates of the current batch
+        :type estimates: dict
+        :return: max change of the estimates
+        :rtype: float
+        """
+        max_change = 0.
+        for name, value in estimates.items():
+            prev_value = prev_estimates.get(name, None)
+            if name == "categorical" or prev_value is None:
+                change = float(value != prev_value)
+            elif name.endswith("_mean"):
+                scale = np.sqrt(estimates[name[:-len("mean")] + "variance"])
+                change = abs(value - prev_value)
+                if scale > 0:
+                    change /= scale
+            elif name.endswith("_variance"):
+                change = abs(value - prev_value)
+                if max(value, prev_value) > 0:
+                    change /= max(value, prev_value)
+            else:
+                change = abs(value - prev_value)
+            max_change = max(max_change, float(change))
+        return max_change
+
+    @staticmethod
+    def _merge_convergence(convergence1, convergence2):
+        """
+        Merges the convergence of two profiles of the same column, which is
+        converged if both are converged.
+
+        :param convergence1: convergence of the first profile
+        :type convergence1: Union[None, dict]
+        :param convergence2: convergence of the second profile
+        :type convergence2: Union[None, dict]
+        :return: merged convergence
+        :rtype: Union[None, dict]
+        """
+        if convergence1 is None or convergence2 is None:
+            return copy.copy(convergence1 or convergence2)
+        max_changes = [convergence["max_change"] for convergence
+                       in (convergence1, convergence2)
+                       if convergence["max_change"] is not None]
+        return {
+            "converged":
+                convergence1["converged"] and convergence2["converged"],
+            "max_change": max(max_changes) if max_changes else None,
+            "tolerance": max(convergence1["tolerance"],
+                             convergence2["tolerance"]),
+            "batches": convergence1["batches"] + convergence2["batches"],
+        }
+
     def _get_sample_size(self, df_series):
         """
         Determines the minimum sampling size for detecting column type.
@@ -214,8 +473,62 @@ class StructuredDataProfile(object):
 
     # TODO: flag column name with null values and potentially return row
     #  index number in the error as well
+    @staticmethod
+    def _get_null_regex(null_values_and_flags):
+        """
+        Combines the null values into a single regex which matches a value if
+        any of the null values match. Each null value is captured by its own
+        group, such that the first matching null value can be identified. The
+        null values may only have the IGNORECASE flag and no capturing groups
+        of their own, as validated by the null values options.
+
+        :param null_values_and_flags: null value regexes and their regex flags
+        :type null_values_and_flags: dict
+        :return: the combined regex and the group index of each null value
+        :rtype: tuple(str, list(int))
+        """
+        null_regexes = []
+        for na, flags in null_values_and_flags.items():
+            null_regexes.append(
+                '(?i:({}))'.format(na) if flags & re.IGNORECASE
+                else '({})'.format(na))
+        return '^(?:{})$'.format('|'.join(null_regexes)), \
+            list(range(len(null_regexes)))
+
+    @staticmethod
+    def _update_null_types(na_columns, null_series, null_regex,
+                           null_group_inds):
+        """
+        Adds the rows of the null values to the null types, in the order of the
+        null values which matched them first and then the order of the rows.
+
+        :param na_columns: null values and the rows which contain them
+        :type na_columns: dict
+        :param null_series: values of the column which are null
+        :type null_series: pandas.core.series.Series
+        :param null_regex: the combined regex of the null values
+        :type null_regex: str
+        :param null_group_inds: the group index of each null value in the regex
+        :type null_group_inds: list(int)
+        :return: None
+        """
+        null_inds = null_series.str.extract(null_regex) \
+            .iloc[:, null_group_inds].notna().values.argmax(axis=1)
+        sort_inds = np.argsort(null_inds, kind='stable')
+        null_values = null_series.values[sort_inds]
+        null_rows = null_series.index.values[sort_inds]
+
+        # group the rows by value in order of first appearance
+        codes, unique_values = pd.factorize(null_values)
+        null_rows = null_rows[np.argsort(codes, kind='stable')]
+        split_inds = np.cumsum(np.bincount(codes))[:-1]
+        for value, rows in zip(unique_values,
+                               np.split(null_rows, split_inds)):
+            na_columns.setdefault(value, list()).extend(rows.tolist())
+
     def get_base_props_and_clean_null_params(self, df_series, sample_size,
-                                             min_true_samples=None):
+                                             min_true_samples=None,
+                                             row_sample=None, start=0):
         """
         Identify null characters and return them in a dictionary as well as
         remove any nulls in column.
@@ -227,8 +540,15 @@ class StructuredDataProfile(object):
         :param min_true_samples: Minimum number of samples required for the
             profiler
         :type min_true_samples: int
-        :return: updated column with null removed and dictionary of null
-            parameters
+        :param row_sample: random order in which the rows are sampled, if None,
+            a new random order is used
+        :type row_sample: sampling.RowSample
+        :param start: position in the random order of the rows from which the
+            rows are sampled
+        :type start: int
+        :return: updated column with null removed, as strings unless its
+            values are native (see `ColumnView.get_native_kind`), and
+            dictionary of null parameters
         :rtype: pd.Series, dict
         """
         NO_FLAG = 0
@@ -241,53 +561,81 @@ class StructuredDataProfile(object):
             "--*": NO_FLAG,
             "__*": NO_FLAG,
         }
+        options = getattr(self, 'options', None)
+        added_null_values = dict()
+        if isinstance(options, StructuredOptions):
+            added_null_values = options.null_values.null_values_and_flags
+        null_values_and_flags.update(added_null_values)
+        null_regex, null_group_inds = \
+            StructuredDataProfile._get_null_regex(null_values_and_flags)
+
+        # the strings of native numeric and datetime values can only match the
+        # default null values if they are NaN, hence the native values are
+        # kept unless other null values are given
+        native_kind = None
+        if not added_null_values:
+            native_kind = ColumnView.get_native_kind(df_series.dtype)
 
         len_df = len(df_series)
         if not len_df:
             return df_series, {
                 "sample_size": 0, "null_count": 0, "null_types": dict(),
-                "sample": []}
+                "sample": sampling.ReservoirSampler(5)}
 
         if min_true_samples is None:
             min_true_samples = self._min_true_samples
 
-        # Pandas reads empty values in the csv files as nan
-        df_series = df_series.apply(str)
-
-        sample_ind_generator = utils.shuffle_in_chunks(
-            len_df, chunk_size=sample_size)
+        if row_sample is None or row_sample.data_length != len_df:
+            row_sample = sampling.RowSample(len_df)
+        sample_ind_generator = row_sample.iter_indices(
+            chunk_size=sample_size, return_keys=True, start=start)
 
         na_columns = dict()
         true_sample_list = list()
+        true_sample_size = 0
+        sample_reservoir = sampling.ReservoirSampler(5)
         total_sample_size = 0
-        for sample_inds in sample_ind_generator:
+        for sample_inds, sample_keys in sample_ind_generator:
             total_sample_size += len(sample_inds)
 
-            df_series_subset = df_series.iloc[sample_inds]
-            # Check if known null types exist in column
-            for na, flags in null_values_and_flags.items():
-                # Check for the regex of the na in the string.
-                reg_ex_na = f"^{na}$"
-                matching_na_elements = df_series_subset.str.contains(
-                    reg_ex_na, flags=flags)
-                for row, elem in matching_na_elements.items():
-                    if elem:
-                        # Since df_series_subset[row] is mutable,
-                        # need to make new var
-                        row_value = str(df_series_subset[row])
-                        na_columns.setdefault(row_value, list()).append(row)
-
-                # Drop the values that matched regex_na
-                df_series_subset = df_series_subset[~matching_na_elements]
-            true_sample_list += df_series_subset.index.tolist()
-
-            if len(true_sample_list) >= min_true_samples and total_sample_size:
+            if native_kind is not None:
+                df_series_subset = df_series.iloc[sample_inds]
+                matching_na_elements = np.zeros(len(sample_inds), dtype=bool)
+                if native_kind == 'float':
+                    matching_na_elements = np.isnan(df_series_subset.values)
+                if matching_na_elements.any():
+                    na_columns.setdefault('nan', list()).extend(
+                        df_series_subset.index[matching_na_elements].tolist())
+            else:
+                # Pandas reads empty values in the csv files as nan, hence only
+                # the sampled rows are converted to strings
+                df_series_subset = df_series.iloc[sample_inds].apply(str)
+                # Check if known null types exist in column with a single pass
+                matching_na_elements = df_series_subset.str.match(
+                    null_regex).values
+                if matching_na_elements.any():
+                    StructuredDataProfile._update_null_types(
+                        na_columns, df_series_subset[matching_na_elements],
+                        null_regex, null_group_inds)
+
+            # Drop the values that matched a null type
+            true_sample_list.append(df_series_subset[~matching_na_elements])
+            sample_reservoir.update(
+                df_series_subset[~matching_na_elements],
+                sample_keys[~matching_na_elements],
+                convert_to_str=native_kind is not None)
+
+            true_sample_size += (~matching_na_elements).sum()
+            if true_sample_size >= min_true_samples and total_sample_size:
                 break
 
         # close the generator in case it is not exhausted.
         sample_ind_generator.close()
 
-        df_series = df_series.loc[sorted(true_sample_list)]
+        df_series = pd.concat(true_sample_list)
+        if native_kind is None:
+            df_series = df_series.astype(object)
+        df_series = df_series.sort_index(kind='mergesort')
         non_na = len(df_series)
         total_na = total_sample_size - non_na
 
@@ -297,8 +645,7 @@ class StructuredDataProfile(object):
             "sample_size": total_sample_size,
             "null_count": total_na,
             "null_types": na_columns,
-            "sample": random.sample(list(df_series.values),
-                                    min(len(df_series), 5))
+            "sample": sample_reservoir
         }
 
         return df_series, base_stats
@@ -306,6 +653,13 @@ class StructuredDataProfile(object):
 
 class Profiler(object):
 
+    # local dask schedulers used for each executor method
+    _dask_schedulers = {
+        'serial': 'synchronous',
+        'thread': 'threads',
+        'process': 'processes',
+    }
+
     def __init__(self, data, samples_per_update=None, min_true_samples=None, 
                  profiler_options=None):
         """
@@ -336,8 +690,10 @@ class Profiler(object):
         self.encoding = None
         self.file_type = None
         self.null_in_row_count = 0
-        self.hashed_row_dict = dict()
+        self.hashed_row_counter = self._create_row_counter(self.options)
         self.rows_ingested = 0
+        self._sampling_generator = np.random.default_rng(
+            sampling.get_seed(self.options.sampling.seed))
         self._samples_per_update = samples_per_update
         self._min_true_samples = min_true_samples
         self._profile = dict()
@@ -355,6 +711,36 @@ class Profiler(object):
         :type other: Profiler
         :return: merger of the two profiles
         """
+        merged_profile = self._merge_row_statistics(other)
+        for profile_name in self._profile:
+            merged_profile._profile[profile_name] = (
+                self._profile[profile_name] + other._profile[profile_name]
+            )
+        return merged_profile
+
+    def __getstate__(self):
+        # the random generator is pickled as its state, such that the saved
+        # profiles don't reference the internals of numpy
+        state = self.__dict__.copy()
+        state['_sampling_generator'] = sampling.get_generator_state(
+            self._sampling_generator)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._sampling_generator = sampling.create_generator(
+            self._sampling_generator)
+
+    def _merge_row_statistics(self, other):
+        """
+        Validates that two profiles can be merged and merges all but their
+        column profiles, which are left to the caller to merge.
+
+        :param other: profile being add to this one.
+        :type other: Profiler
+        :return: merger of the two profiles without the column profiles
+        :rtype: Profiler
+        """
         if type(other) is not type(self):
             raise TypeError('`{}` and `{}` are not of the same profiler type.'.
                             format(type(self).__name__, type(other).__name__))
@@ -362,7 +748,9 @@ class Profiler(object):
             raise ValueError('Profiles do not have the same schema.')
         elif not all([isinstance(other._profile[p_name],
                                  type(self._profile[p_name]))
-                      for p_name in self._profile]):  # options check
+                      for p_name in self._profile]) \
+                or type(self.hashed_row_counter) \
+                is not type(other.hashed_row_counter):  # options check
             raise ValueError('The two profilers were not setup with the same '
                              'options, hence they do not calculate the same '
                              'profiles and cannot be added together.')
@@ -378,15 +766,199 @@ class Profiler(object):
         merged_profile.null_in_row_count = \
             self.null_in_row_count + other.null_in_row_count
         merged_profile.rows_ingested = self.rows_ingested + other.rows_ingested
-        merged_profile.hashed_row_dict.update(self.hashed_row_dict)
-        merged_profile.hashed_row_dict.update(other.hashed_row_dict)
-
-        for profile_name in self._profile:
-            merged_profile._profile[profile_name] = (
-                self._profile[profile_name] + other._profile[profile_name]
-            )
+        merged_profile.hashed_row_counter = \
+            self.hashed_row_counter + other.hashed_row_counter
         return merged_profile
 
+    @classmethod
+    def merge(cls, profiles, n_jobs=None):
+        """
+        Merges many profiles, e.g. the profiles of the partitions of a dataset,
+        into a single profile. The profiles are merged pairwise in a balanced
+        tree, with the column profiles of each level of the tree merged in
+        parallel, which gives the same result as left-folding the profiles with
+        the `+` operator, up to the floating point rounding of the statistics.
+
+        :param profiles: profiles being merged, in order
+        :type profiles: Iterable[Profiler]
+        :param n_jobs: max number of threads merging the column profiles. If
+            None, the default of `concurrent.futures.ThreadPoolExecutor` is
+            used, if 1, the profiles are merged serially.
+        :type n_jobs: int
+        :return: merger of the profiles
+        :rtype: Profiler
+        """
+        profiles = list(profiles)
+        if not profiles:
+            raise ValueError('At least one profile is required to merge.')
+        for profile in profiles:
+            if not isinstance(profile, cls):
+                raise TypeError('`{}` and `{}` are not of the same profiler '
+                                'type.'.format(cls.__name__,
+                                               type(profile).__name__))
+        if n_jobs is not None and (not isinstance(n_jobs, int)
+                                   or isinstance(n_jobs, bool) or n_jobs < 1):
+            raise ValueError('`n_jobs` must be a positive integer or None.')
+
+        # threads are used since the column profiles, e.g. data labelers, are
+        # costly to send to other processes, while the heavy lifting of the
+        # merges is done by numpy
+        executor = None
+        if n_jobs != 1 and len(profiles) > 2:
+            executor = futures.ThreadPoolExecutor(max_workers=n_jobs)
+        try:
+            while len(profiles) > 1:
+                # merge adjacent pairs to keep the order of the left fold
+                merged_profiles = []
+                column_merges = []
+                for profile, other in zip(profiles[0::2], profiles[1::2]):
+                    merged_profile = profile._merge_row_statistics(other)
+                    for profile_name in profile._profile:
+                        args = (profile._profile[profile_name],
+                                other._profile[profile_name])
+                        column_merge = executor.submit(operator.add, *args) \
+                            if executor else operator.add(*args)
+                        column_merges.append(
+                            (merged_profile, profile_name, column_merge))
+                    merged_profiles.append(merged_profile)
+                if len(profiles) % 2:
+                    merged_profiles.append(profiles[-1])
+
+                for merged_profile, profile_name, column_merge in column_merges:
+                    if executor:
+                        column_merge = column_merge.result()
+                    merged_profile._profile[profile_name] = column_merge
+                profiles = merged_profiles
+        finally:
+            if executor:
+                executor.shutdown()
+        return profiles[0]
+
+    @classmethod
+    def from_partitions(cls, partitions, samples_per_update=None,
+                        min_true_samples=None, profiler_options=None):
+        """
+        Profiles the partitions of a dataset in parallel with the local dask
+        scheduler specified by the executor options ('serial' uses the
+        synchronous, 'thread' the threaded and 'process' the multiprocessing
+        scheduler) and merges the profiles of the partitions.
+
+        :param partitions: Data to be profiled, either a dask DataFrame or an
+            iterable of partitions, i.e. DataFrames or dask delayed DataFrames
+        :type partitions: Union[dask.dataframe.DataFrame,
+            Iterable[pandas.DataFrame]]
+        :param samples_per_update: Number of samples to use in generating
+            the profile of each partition
+        :type samples_per_update: int
+        :param min_true_samples: Minimum number of samples required for the
+            profiler
+        :type min_true_samples: int
+        :param profiler_options: Options for the profiler.
+        :type profiler_options: ProfilerOptions Object
+        :return: Profiler
+        """
+        profiler = cls(pd.DataFrame([]), samples_per_update=samples_per_update,
+                       min_true_samples=min_true_samples,
+                       profiler_options=profiler_options)
+        if _is_dask_dataframe(partitions):
+            profiler.update_profile(partitions)
+        else:
+            profiler._update_profile_from_partitions(
+                partitions, samples_per_update, min_true_samples)
+        return profiler
+
+    @classmethod
+    def from_stream(cls, data, chunk_size=100000, samples_per_update=None,
+                    min_true_samples=None, profiler_options=None):
+        """
+        Profiles the data one chunk at a time through the incremental
+        `update_profile`, such that only a single chunk of the data is held in
+        memory at a time.
+
+        :param data: Data to be profiled, either a data reader, which is read
+            in chunks of `chunk_size` rows, or an iterable of DataFrames
+        :type data: Union[data_readers.base_data.BaseData,
+            Iterable[pandas.DataFrame]]
+        :param chunk_size: max number of rows read from the data reader for
+            each update of the profile
+        :type chunk_size: int
+        :param samples_per_update: Number of samples to use in generating
+            profile
+        :type samples_per_update: int
+        :param min_true_samples: Minimum number of samples required for the
+            profiler
+        :type min_true_samples: int
+        :param profiler_options: Options for the profiler.
+        :type profiler_options: ProfilerOptions Object
+        :return: Profiler
+        """
+        if isinstance(data, data_readers.text_data.TextData):
+            raise TypeError("Cannot provide TextData object to Profiler")
+        elif isinstance(data, data_readers.base_data.BaseData):
+            if not hasattr(data, 'iter_chunks'):
+                raise TypeError('Cannot stream a `{}` object to Profiler.'
+                                .format(type(data).__name__))
+            chunks = data.iter_chunks(chunk_size)
+        elif isinstance(data, pd.DataFrame):
+            chunks = [data]
+        else:
+            chunks = data
+
+        profiler = cls(pd.DataFrame([]), samples_per_update=samples_per_update,
+                       min_true_samples=min_true_samples,
+                       profiler_options=profiler_options)
+        # the pool of workers is shared by the updates of all the chunks
+        executor = cls._create_executor(profiler.options)
+        try:
+            for chunk in chunks:
+                if not isinstance(chunk, pd.DataFrame):
+                    raise ValueError("Each chunk of the streamed data must be "
+                                     "a pd.DataFrame.")
+                profiler._update_profile(chunk, executor=executor)
+        finally:
+            if executor:
+                executor.shutdown()
+
+        if isinstance(data, data_readers.base_data.BaseData):
+            profiler.encoding = data.file_encoding
+            profiler.file_type = data.data_type
+        return profiler
+
+    def save(self, filepath):
+        """
+        Saves the profile to a file in a compact binary format, in which the
+        numeric arrays of the profile are stored as raw buffers and the data
+        labeler is stored by reference to its directory path.
+
+        :param filepath: path of the file to which the profile is saved
+        :type filepath: str
+        :return: None
+        """
+        serialization.save_profile(self, filepath)
+
+    @classmethod
+    def load(cls, filepath, mmap_mode='c'):
+        """
+        Loads a profile saved with `Profiler.save`. Only the classes of the
+        profiles can be loaded from the file, however, the data labeler is
+        loaded from the directory path stored in the file, hence only files
+        from trusted sources must be loaded.
+
+        :param filepath: path of the file from which the profile is loaded
+        :type filepath: str
+        :param mmap_mode: if not None, the numeric arrays of the profile are
+            memory-mapped from the file with the mode (see `numpy.memmap`)
+            instead of being read into memory
+        :type mmap_mode: Union[None, str]
+        :return: the loaded profile
+        :rtype: Profiler
+        """
+        profile = serialization.load_profile(filepath, mmap_mode=mmap_mode)
+        if not isinstance(profile, cls):
+            raise ValueError('`{}` does not contain a saved `{}`.'
+                             .format(filepath, cls.__name__))
+        return profile
+
     @property
     def profile(self):
         return self._profile
@@ -399,6 +971,14 @@ class Profiler(object):
             }
         output_format = report_options.get("output_format", None)
         num_quantile_groups = report_options.get("num_quantile_groups", 4)
+        quantile_points = report_options.get("quantile_points", None)
+        if quantile_points is not None and (
+                not isinstance(quantile_points, (list, tuple))
+                or not all(isinstance(point, (int, float))
+                           and not isinstance(point, bool)
+                           and 0 <= point <= 1 for point in quantile_points)):
+            raise ValueError("`quantile_points` must be a list of floats "
+                             "between 0 and 1.")
 
         columns = list(self._profile.values())
         report = OrderedDict([
@@ -419,7 +999,15 @@ class Profiler(object):
             report["data_stats"][key] = self._profile[key].profile
             quantiles = report["data_stats"][key]["statistics"].get(
                 'quantiles')
-            if quantiles:
+            if quantiles and quantile_points is not None:
+                # the quantiles are calculated at the requested points from
+                # the histogram or sketch of the data type of the column
+                profiler = self._profile[key].profiles['data_type_profile'] \
+                    ._selected_profiler
+                quantiles = dict(zip(quantile_points, profiler._get_percentiles(
+                    [point * 100 for point in quantile_points])))
+                report["data_stats"][key]["statistics"]["quantiles"] = quantiles
+            elif quantiles:
                 quantiles = calculate_quantiles(num_quantile_groups, quantiles)
                 report["data_stats"][key]["statistics"]["quantiles"] = quantiles
 
@@ -428,13 +1016,64 @@ class Profiler(object):
         return report
 
     def _get_unique_row_ratio(self):
-        return len(self.hashed_row_dict) / self.rows_ingested
+        return self._get_unique_row_count() / self.rows_ingested
 
     def _get_null_row_ratio(self):
         return self.null_in_row_count / self.rows_ingested
 
     def _get_duplicate_row_count(self):
-        return self.rows_ingested - len(self.hashed_row_dict)
+        return self.rows_ingested - self._get_unique_row_count()
+
+    def _get_unique_row_count(self):
+        # an approximate count can't exceed the number of rows ingested
+        return min(self.hashed_row_counter.count, self.rows_ingested)
+
+    @staticmethod
+    def _create_row_counter(options):
+        """
+        Creates the counter of the unique rows as specified by the options.
+
+        :param options: Options for the profiler
+        :type options: ProfilerOptions
+        :return: counter of the unique row hashes
+        :rtype: Union[ExactUniqueCounter, HyperLogLog]
+        """
+        row_options = options.row_statistics
+        if row_options.unique_count_method == 'approximate':
+            return HyperLogLog(row_options.unique_count_error_rate)
+        return ExactUniqueCounter()
+
+    def _get_sampling_seed(self):
+        """
+        Gets the seed of the random sample of the rows of the next chunk of
+        data, such that the samples are reproducible with the sampling seed.
+
+        :return: seed of the random sample of the rows
+        :rtype: int
+        """
+        return int(self._sampling_generator.integers(2 ** 63 - 1))
+
+    @staticmethod
+    def _create_executor(options):
+        """
+        Creates the pool of workers which profile the columns of the data, as
+        specified by the executor options. The caller shuts the workers down
+        once the data is profiled.
+
+        :param options: Options for the profiler
+        :type options: ProfilerOptions
+        :return: pool of workers, or None if the columns are profiled serially
+        :rtype: Union[None, concurrent.futures.Executor]
+        """
+        method, max_workers = 'serial', None
+        if options and options.executor:
+            method = options.executor.method
+            max_workers = options.executor.max_workers
+        if method == 'thread':
+            return futures.ThreadPoolExecutor(max_workers=max_workers)
+        elif method == 'process':
+            return futures.ProcessPoolExecutor(max_workers=max_workers)
+        return None
 
     def _update_row_statistics(self, data):
         """
@@ -446,13 +1085,11 @@ class Profiler(object):
         :param data: a dataset
         :type data: pandas.DataFrame
         """
-        
-        self.rows_ingested = len(data)
-        self.hashed_row_dict = dict.fromkeys(
-            pd.util.hash_pandas_object(data, index=False), True
-        )
-        self.null_in_row_count = data.isnull().any(axis=1).sum()
-        
+        self.rows_ingested += len(data)
+        self.hashed_row_counter.update(
+            pd.util.hash_pandas_object(data, index=False).values)
+        self.null_in_row_count += data.isnull().any(axis=1).sum()
+
     def update_profile(self, data, sample_size=None, min_true_samples=None):
         """
         Update the profile for data provided. User can specify the sample
@@ -467,31 +1104,140 @@ class Profiler(object):
         :type min_true_samples
         :return: None
         """
+        self._update_profile(data, sample_size, min_true_samples)
+
+    def _update_profile(self, data, sample_size=None, min_true_samples=None,
+                        executor=None):
+        """
+        Updates the profile for the data provided, as in `update_profile`,
+        with the columns of DataFrames profiled by the given pool of workers.
+
+        :param data: data to be profiled
+        :type data: Union[data_readers.base_data.BaseData, pandas.DataFrame]
+        :param sample_size: number of samples to profile from the data
+        :type sample_size: int
+        :param min_true_samples: minimum number of non-null samples to profile
+        :type min_true_samples
+        :param executor: pool of workers which profile the columns, if None,
+            a pool is created for the update as specified by the executor
+            options
+        :type executor: Union[None, concurrent.futures.Executor]
+        :return: None
+        """
         if not sample_size:
             sample_size = self._samples_per_update
         if not min_true_samples:
             min_true_samples = self._min_true_samples
 
         if isinstance(data, data_readers.base_data.BaseData):
-            self._profile = self._update_profile_from_chunk(
-                data.data, self._profile, sample_size, min_true_samples, self.options)
-            self._update_row_statistics(data.data)
+            self._update_profile_from_dataframe(
+                data.data, sample_size, min_true_samples, executor)
             self.encoding = data.file_encoding
             self.file_type = data.data_type
         elif isinstance(data, pd.DataFrame):
-            self._profile = self._update_profile_from_chunk(
-                data, self._profile, sample_size, min_true_samples, self.options)
-            self._update_row_statistics(data)
+            self._update_profile_from_dataframe(
+                data, sample_size, min_true_samples, executor)
+            self.file_type = str(data.__class__)
+        elif _is_dask_dataframe(data):
+            self._update_profile_from_partitions(
+                data.to_delayed(), sample_size, min_true_samples)
             self.file_type = str(data.__class__)
         else:
             raise ValueError(
-                "Data must either be imported using the data_readers or "
-                "pd.DataFrame."
+                "Data must either be imported using the data_readers, "
+                "pd.DataFrame or dask.dataframe.DataFrame."
             )
 
+    def _update_profile_from_dataframe(self, df, sample_size=None,
+                                       min_true_samples=None, executor=None):
+        """
+        Profiles the columns of a dataframe with the pool of workers specified
+        by the executor options and updates the row statistics of the profile.
+
+        :param df: dataframe to be profiled
+        :type df: pandas.DataFrame
+        :param sample_size: number of samples to profile from the dataframe
+        :type sample_size: int
+        :param min_true_samples: minimum number of non-null samples to profile
+        :type min_true_samples: int
+        :param executor: pool of workers which profile the columns, if None,
+            a pool is created and shut down for this update
+        :type executor: Union[None, concurrent.futures.Executor]
+        :return: None
+        """
+        owns_executor = executor is None
+        if owns_executor:
+            executor = self._create_executor(self.options)
+        try:
+            self._profile = self._update_profile_from_chunk(
+                df, self._profile, sample_size, min_true_samples,
+                self.options, self._get_sampling_seed(), executor)
+        finally:
+            if owns_executor and executor:
+                executor.shutdown()
+        self._update_row_statistics(df)
+
+    def _update_profile_from_partitions(self, partitions, sample_size=None,
+                                        min_true_samples=None):
+        """
+        Profiles each partition of a dataset as a task of the local dask
+        scheduler specified by the executor options and merges the profiles of
+        the partitions into this profile.
+
+        :param partitions: partitions of the dataset
+        :type partitions: Iterable[Union[pandas.DataFrame, dask.delayed]]
+        :param sample_size: number of samples to profile from each partition
+        :type sample_size: int
+        :param min_true_samples: minimum number of non-null samples to profile
+        :type min_true_samples: int
+        :return: None
+        """
+        try:
+            import dask
+        except ImportError:
+            raise ImportError('dask must be installed to profile partitioned '
+                              'data, e.g. `pip install "dask[dataframe]"`.')
+
+        method = self.options.executor.method
+        max_workers = self.options.executor.max_workers
+        compute_kwargs = dict(scheduler=self._dask_schedulers[method])
+        if max_workers is not None:
+            compute_kwargs['num_workers'] = max_workers
+
+        # the partitions are profiled in parallel, hence the columns of each
+        # partition are profiled serially
+        partition_options = copy.deepcopy(self.options)
+        partition_options.executor.method = 'serial'
+
+        # the profiles are serialized to be sent back from the processes,
+        # since their data labelers can't be pickled
+        serialize = method == 'process'
+        tasks = [dask.delayed(_profile_partition)(
+                     partition, sample_size, min_true_samples,
+                     partition_options, serialize, self._get_sampling_seed())
+                 for partition in partitions]
+        if not tasks:
+            return
+        partition_profiles = list(dask.compute(*tasks, **compute_kwargs))
+        if serialize:
+            data_labelers = dict()
+            partition_profiles = [
+                serialization.loads_profile(profile, data_labelers)
+                for profile in partition_profiles]
+
+        if self._profile:
+            partition_profiles.insert(0, self)
+        merged_profile = Profiler.merge(partition_profiles, n_jobs=max_workers)
+        self._profile = merged_profile._profile
+        self.hashed_row_counter = merged_profile.hashed_row_counter
+        self.rows_ingested = merged_profile.rows_ingested
+        self.null_in_row_count = merged_profile.null_in_row_count
+        self.file_type = merged_profile.file_type
+
     @staticmethod
     def _update_profile_from_chunk(df, profile=None, sample_size=None,
-                                   min_true_samples=None, options=None):
+                                   min_true_samples=None, options=None,
+                                   seed=None, executor=None):
         """
         Iterate over the columns of a dataset and identify its parameters.
         
@@ -505,6 +1251,12 @@ class Profiler(object):
         :type min_true_samples: int
         :param options: Options for the profiler
         :type options: ProfilerOptions
+        :param seed: seed of the random sample of the rows, if None, the seed
+            is drawn from the global numpy random state
+        :type seed: Union[None, int]
+        :param executor: pool of workers which profile the columns, if None,
+            the columns are profiled serially
+        :type executor: Union[None, concurrent.futures.Executor]
         :return: list of column profile base subclasses
         :rtype: list(BaseColumnProfiler)
         """
@@ -515,23 +1267,213 @@ class Profiler(object):
             raise ValueError('`Profiler` does not currently support data which '
                              'contains columns with duplicate names.')
 
-        for col in df.columns:
-            if col in profile:
-                column_profile = profile[col]
-                column_profile.update_profile(
-                    df[col],
-                    sample_size=sample_size,
-                    min_true_samples=min_true_samples
-                )
+        structured_options = None
+        if options and options.structured_options:
+            structured_options = options.structured_options
+        sampling_options = None
+        if options and options.sampling:
+            sampling_options = options.sampling
+
+        # all the columns sample the same rows in the same random order
+        row_sample = sampling.RowSample(len(df), seed)
+
+        if isinstance(executor, futures.ProcessPoolExecutor) \
+                and len(df.columns) > 1:
+            column_profiles = _profile_columns_in_processes(
+                executor, df, profile, sample_size, min_true_samples,
+                structured_options, row_sample, sampling_options)
+        else:
+            column_args = [
+                (df[col], profile.get(col, None), sample_size,
+                 min_true_samples, structured_options, row_sample,
+                 sampling_options)
+                for col in df.columns
+            ]
+            if executor is None or len(column_args) < 2:
+                column_profiles = [
+                    _profile_column(*args) for args in column_args]
             else:
-                structured_options = None
-                if options and options.structured_options:
-                    structured_options = options.structured_options
-                profile[col] = StructuredDataProfile(
-                    df[col],
-                    sample_size=sample_size,
-                    min_true_samples=min_true_samples,
-                    options=structured_options
-                )
+                column_profiles = list(
+                    executor.map(_profile_column, *zip(*column_args)))
+
+        # keep the original column order of the dataset
+        for col, column_profile in zip(df.columns, column_profiles):
+            profile[col] = column_profile
 
         return profile
+
+
+def _is_dask_dataframe(data):
+    """
+    Determines whether the data is a dask DataFrame without importing dask,
+    which is an optional dependency.
+
+    :param data: data to check
+    :type data: object
+    :return: whether the data is a dask DataFrame
+    :rtype: bool
+    """
+    dask_dataframe = sys.modules.get('dask.dataframe', None)
+    return dask_dataframe is not None \
+        and isinstance(data, dask_dataframe.DataFrame)
+
+
+def _profile_partition(df, sample_size=None, min_true_samples=None,
+                       options=None, serialize=False, seed=None):
+    """
+    Profiles a partition of a dataset. Defined at the module level such that
+    it can be sent to the workers of the dask scheduler.
+
+    :param df: a partition of a dataset
+    :type df: pandas.DataFrame
+    :param sample_size: number of samples for df to use for profiling
+    :type sample_size: int
+    :param min_true_samples: minimum number of true samples required
+    :type min_true_samples: int
+    :param options: Options for the profiler
+    :type options: ProfilerOptions
+    :param serialize: whether to return the profile serialized to bytes
+    :type serialize: bool
+    :param seed: seed of the random sample of the rows of the partition
+    :type seed: Union[None, int]
+    :return: profile of the partition
+    :rtype: Union[Profiler, bytes]
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise ValueError("Each partition of the data must be a pd.DataFrame.")
+
+    # partitions, e.g. of dask, may have string extension columns whose
+    # missing values are pd.NA, which are cast to object columns of NaN such
+    # that they match the null values
+    string_columns = [
+        column for column, dtype in df.dtypes.items()
+        if dtype != object and pd.api.types.is_string_dtype(dtype)]
+    if string_columns:
+        df = df.astype({column: object for column in string_columns})
+        df[string_columns] = df[string_columns].where(
+            df[string_columns].notna(), np.nan)
+
+    if seed is not None:
+        options = copy.deepcopy(options) if options else ProfilerOptions()
+        options.sampling.seed = seed
+    profile = Profiler(df, samples_per_update=sample_size,
+                       min_true_samples=min_true_samples,
+                       profiler_options=options)
+    if serialize:
+        return serialization.dumps_profile(profile)
+    return profile
+
+
+def _profile_column(df_series, column_profile=None, sample_size=None,
+                    min_true_samples=None, options=None, row_sample=None,
+                    sampling_options=None):
+    """
+    Creates or updates the profile of a single column. Defined at the module
+    level such that it can be sent to the workers of a process pool.
+
+    :param df_series: a column of data
+    :type df_series: pandas.core.series.Series
+    :param column_profile: existing profile of the column, if any
+    :type column_profile: Union[None, StructuredDataProfile]
+    :param sample_size: number of samples for df to use for profiling
+    :type sample_size: int
+    :param min_true_samples: minimum number of true samples required
+    :type min_true_samples: int
+    :param options: Options for the structured profiler
+    :type options: StructuredOptions
+    :param row_sample: random order in which the rows are sampled
+    :type row_sample: sampling.RowSample
+    :param sampling_options: Options for the sampling of the rows
+    :type sampling_options: SamplingOptions
+    :return: the created or updated profile of the column
+    :rtype: StructuredDataProfile
+    """
+    if column_profile is not None:
+        column_profile.update_profile(
+            df_series,
+            sample_size=sample_size,
+            min_true_samples=min_true_samples,
+            row_sample=row_sample
+        )
+        return column_profile
+    return StructuredDataProfile(
+        df_series,
+        sample_size=sample_size,
+        min_true_samples=min_true_samples,
+        options=options,
+        row_sample=row_sample,
+        sampling_options=sampling_options
+    )
+
+
+def _profile_columns_in_processes(executor, df, profile, sample_size=None,
+                                  min_true_samples=None, options=None,
+                                  row_sample=None, sampling_options=None):
+    """
+    Profiles the columns of a dataset in a pool of processes. The data,
+    options and existing profile of each column are sent to the processes
+    without the data labeler, since its model can't be pickled, and the
+    processes create or update the profile as in a serial update. The data
+    labeler is then run in this process on the rows sampled for the other
+    profiles.
+
+    :param executor: pool of processes which profile the columns
+    :type executor: concurrent.futures.ProcessPoolExecutor
+    :param df: a dataset
+    :type df: pandas.DataFrame
+    :param profile: existing profiles of the columns
+    :type profile: dict
+    :param sample_size: number of samples for df to use for profiling
+    :type sample_size: int
+    :param min_true_samples: minimum number of true samples required
+    :type min_true_samples: int
+    :param options: Options for the structured profiler
+    :type options: StructuredOptions
+    :param row_sample: random order in which the rows are sampled
+    :type row_sample: sampling.RowSample
+    :param sampling_options: Options for the sampling of the rows
+    :type sampling_options: SamplingOptions
+    :return: the profiles of the columns
+    :rtype: list(StructuredDataProfile)
+    """
+    use_data_labeler = options is None or options.data_labeler.is_enabled
+    process_options = copy.deepcopy(options) if options \
+        else StructuredOptions()
+    process_options.data_labeler.is_enabled = False
+
+    # the data labelers are detached from the existing profiles while they
+    # are sent to the processes
+    data_labeler_profiles = dict()
+    prev_sample_sizes = dict()
+    for col in df.columns:
+        if col in profile:
+            prev_sample_sizes[col] = profile[col].sample_size
+            data_labeler_profiles[col] = \
+                profile[col].profiles.pop('data_label_profile', None)
+    try:
+        column_args = [
+            (df[col], profile.get(col, None), sample_size, min_true_samples,
+             process_options, row_sample, sampling_options)
+            for col in df.columns
+        ]
+        processed_profiles = list(
+            executor.map(_profile_column, *zip(*column_args)))
+    finally:
+        for col, data_labeler_profile in data_labeler_profiles.items():
+            if data_labeler_profile is not None:
+                profile[col].profiles['data_label_profile'] = \
+                    data_labeler_profile
+
+    column_profiles = list()
+    for col, column_profile in zip(df.columns, processed_profiles):
+        if col in profile:
+            column_profile.options = profile[col].options
+        else:
+            column_profile.options = options
+        if use_data_labeler:
+            column_profile._update_data_labeler_profile(
+                df[col],
+                column_profile.sample_size - prev_sample_sizes.get(col, 0),
+                row_sample, data_labeler_profiles.get(col, None))
+        column_profiles.append(column_profile)
+    return column_profiles
@@ -6,6 +6,9 @@ Specify the options when running the data profiler.
 import warnings
 import abc
 import copy
+import re
+
+from .sketches import HyperLogLog
 
 
 class BaseOption(object):
@@ -139,6 +142,39 @@ class BooleanOption(BaseOption):
         return errors
 
 
+class QuantileSketchOptions(BooleanOption):
+
+    def __init__(self, is_enabled=False, error_rate=0.01):
+        """
+        Options for estimating the quantiles with a sketch of fixed memory
+        instead of the histogram.
+
+        :ivar is_enabled: boolean option to enable/disable the sketch.
+        :vartype is_enabled: bool
+        :ivar error_rate: max normalized rank error of the estimated quantiles
+        :vartype error_rate: float
+        """
+        super().__init__(is_enabled=is_enabled)
+        self.error_rate = error_rate
+
+    def _validate_helper(self, variable_path='QuantileSketchOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        if not isinstance(self.error_rate, (int, float)) \
+                or isinstance(self.error_rate, bool) \
+                or not 0 < self.error_rate < 1:
+            errors.append("{}.error_rate must be a float between 0 and 1."
+                          .format(variable_path))
+        return errors
+
+
 class BaseColumnOptions(BooleanOption):
     def __init__(self):
         """
@@ -202,12 +238,21 @@ class NumericalOptions(BaseColumnOptions):
         :ivar is_numeric_stats_enabled: boolean to enable/disable all numeric
             stats
         :vartype is_numeric_stats_enabled: bool
+        :ivar quantile_sketch: option to enable/disable estimating the
+            quantiles with a sketch of fixed memory
+        :vartype quantile_sketch: QuantileSketchOptions
+        :ivar freeze_histogram_selection: boolean option to enable/disable
+            freezing the selected histogram bin method once it has been
+            selected for a number of consecutive updates
+        :vartype freeze_histogram_selection: BooleanOption
         """
         self.min = BooleanOption(is_enabled=True)
         self.max = BooleanOption(is_enabled=True)
         self.sum = BooleanOption(is_enabled=True)
         self.variance = BooleanOption(is_enabled=True)
         self.histogram_and_quantiles = BooleanOption(is_enabled=True)
+        self.quantile_sketch = QuantileSketchOptions(is_enabled=False)
+        self.freeze_histogram_selection = BooleanOption(is_enabled=False)
         BaseColumnOptions.__init__(self)
 
     @property
@@ -266,7 +311,8 @@ class NumericalOptions(BaseColumnOptions):
 
         errors = super()._validate_helper(variable_path=variable_path)
         for item in ["histogram_and_quantiles", "min", "max", "sum",
-                     "variance"]:
+                     "variance", "quantile_sketch",
+                     "freeze_histogram_selection"]:
             if not isinstance(self.properties[item], BooleanOption):
                 errors.append("{}.{} must be a BooleanOption."
                               .format(variable_path, item))
@@ -311,8 +357,37 @@ class IntOptions(NumericalOptions):
         :ivar is_numeric_stats_enabled: boolean to enable/disable all numeric
             stats
         :vartype is_numeric_stats_enabled: bool
+        :ivar early_elimination: boolean option to enable/disable skipping the
+            numeric stats once a value does not match the data type
+        :vartype early_elimination: BooleanOption
+        :ivar quantile_sketch: option to enable/disable estimating the
+            quantiles with a sketch of fixed memory
+        :vartype quantile_sketch: QuantileSketchOptions
+        :ivar freeze_histogram_selection: boolean option to enable/disable
+            freezing the selected histogram bin method once it has been
+            selected for a number of consecutive updates
+        :vartype freeze_histogram_selection: BooleanOption
         """
         NumericalOptions.__init__(self)
+        self.early_elimination = BooleanOption(is_enabled=False)
+
+    def _validate_helper(self, variable_path='IntOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        if not isinstance(self.early_elimination, BooleanOption):
+            errors.append("{}.early_elimination must be a BooleanOption."
+                          .format(variable_path))
+        else:
+            errors += self.early_elimination._validate_helper(
+                variable_path + '.early_elimination')
+        return errors
 
 
 class FloatOptions(NumericalOptions):
@@ -338,9 +413,20 @@ class FloatOptions(NumericalOptions):
         :ivar is_numeric_stats_enabled: boolean to enable/disable all numeric
             stats
         :vartype is_numeric_stats_enabled: bool
+        :ivar early_elimination: boolean option to enable/disable skipping the
+            numeric stats once a value does not match the data type
+        :vartype early_elimination: BooleanOption
+        :ivar quantile_sketch: option to enable/disable estimating the
+            quantiles with a sketch of fixed memory
+        :vartype quantile_sketch: QuantileSketchOptions
+        :ivar freeze_histogram_selection: boolean option to enable/disable
+            freezing the selected histogram bin method once it has been
+            selected for a number of consecutive updates
+        :vartype freeze_histogram_selection: BooleanOption
         """
         NumericalOptions.__init__(self)
         self.precision = BooleanOption(is_enabled=True)
+        self.early_elimination = BooleanOption(is_enabled=False)
 
     def _validate_helper(self, variable_path='FloatOptions'):
         """
@@ -356,6 +442,12 @@ class FloatOptions(NumericalOptions):
             errors.append("{}.precision must be a BooleanOption."
                           .format(variable_path))
         errors += self.precision._validate_helper(variable_path)
+        if not isinstance(self.early_elimination, BooleanOption):
+            errors.append("{}.early_elimination must be a BooleanOption."
+                          .format(variable_path))
+        else:
+            errors += self.early_elimination._validate_helper(
+                variable_path + '.early_elimination')
         return errors
 
 
@@ -368,6 +460,9 @@ class TextOptions(NumericalOptions):
         :vartype is_enabled: bool
         :ivar vocab: boolean option to enable/disable vocab
         :vartype vocab: BooleanOption
+        :ivar vocab_count: boolean option to enable/disable reporting the
+            number of occurrences of each character of the vocab
+        :vartype vocab_count: BooleanOption
         :ivar min: boolean option to enable/disable min
         :vartype min: BooleanOption
         :ivar max: boolean option to enable/disable max
@@ -382,9 +477,17 @@ class TextOptions(NumericalOptions):
         :ivar is_numeric_stats_enabled: boolean to enable/disable all numeric
             stats
         :vartype is_numeric_stats_enabled: bool
+        :ivar quantile_sketch: option to enable/disable estimating the
+            quantiles with a sketch of fixed memory
+        :vartype quantile_sketch: QuantileSketchOptions
+        :ivar freeze_histogram_selection: boolean option to enable/disable
+            freezing the selected histogram bin method once it has been
+            selected for a number of consecutive updates
+        :vartype freeze_histogram_selection: BooleanOption
         """
         NumericalOptions.__init__(self)
         self.vocab = BooleanOption(is_enabled=True)
+        self.vocab_count = BooleanOption(is_enabled=False)
 
     def _validate_helper(self, variable_path='TextOptions'):
         """
@@ -400,6 +503,12 @@ class TextOptions(NumericalOptions):
             errors.append("{}.vocab must be a BooleanOption."
                           .format(variable_path))
         errors += self.vocab._validate_helper(variable_path)
+        if not isinstance(self.vocab_count, BooleanOption):
+            errors.append("{}.vocab_count must be a BooleanOption."
+                          .format(variable_path))
+        else:
+            errors += self.vocab_count._validate_helper(
+                variable_path + '.vocab_count')
         return errors
 
 
@@ -426,14 +535,78 @@ class OrderOptions(BaseColumnOptions):
 
 
 class CategoricalOptions(BaseColumnOptions):
-    def __init__(self):
+    def __init__(self, max_categories=None):
         """
         Options for the Categorical Column
 
         :ivar is_enabled: boolean option to enable/disable the column.
         :vartype is_enabled: bool
+        :ivar max_categories: max number of unique values which are counted
+            exactly, beyond which a column which is not categorical on the
+            values profiled so far is no longer categorical and its unique
+            values are only counted approximately, if None, there is no max
+        :vartype max_categories: Union[None, int]
+        """
+        BaseColumnOptions.__init__(self)
+        self.max_categories = max_categories
+
+    def _validate_helper(self, variable_path='CategoricalOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        if self.max_categories is not None and (
+                not isinstance(self.max_categories, int)
+                or isinstance(self.max_categories, bool)
+                or self.max_categories < 1):
+            errors.append("{}.max_categories must be None or a positive "
+                          "integer.".format(variable_path))
+        return errors
+
+
+class HeavyHittersOptions(BaseColumnOptions):
+    def __init__(self, top_k=20, num_counters=1000):
+        """
+        Options for the Heavy Hitters Column
+
+        :ivar is_enabled: boolean option to enable/disable the column.
+        :vartype is_enabled: bool
+        :ivar top_k: number of most frequent values to report
+        :vartype top_k: int
+        :ivar num_counters: max number of counters of the sketch of the most
+            frequent values, their counts are underestimated by at most the
+            number of values / (num_counters + 1)
+        :vartype num_counters: int
         """
         BaseColumnOptions.__init__(self)
+        self.top_k = top_k
+        self.num_counters = num_counters
+
+    def _validate_helper(self, variable_path='HeavyHittersOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+        if not isinstance(self.top_k, int) or isinstance(self.top_k, bool) \
+                or self.top_k < 1:
+            errors.append("{}.top_k must be a positive integer."
+                          .format(variable_path))
+        elif not isinstance(self.num_counters, int) \
+                or isinstance(self.num_counters, bool) \
+                or self.num_counters < self.top_k:
+            errors.append("{}.num_counters must be an integer greater than or "
+                          "equal to top_k.".format(variable_path))
+        return errors
 
 
 class DataLabelerOptions(BaseColumnOptions):
@@ -472,6 +645,71 @@ class DataLabelerOptions(BaseColumnOptions):
         return errors
 
 
+class NullValuesOptions(BooleanOption):
+
+    def __init__(self, is_enabled=True, values=None):
+        """
+        Options for the values which are considered null in addition to the
+        default null values.
+
+        :ivar is_enabled: boolean option to enable/disable the added null
+            values.
+        :vartype is_enabled: bool
+        :ivar values: null values (regex) and their regex flags.
+        :vartype values: Union[None, dict]
+        """
+        super().__init__(is_enabled=is_enabled)
+        self.values = values
+
+    @property
+    def null_values_and_flags(self):
+        """Returns the added null values and their flags, if enabled."""
+        if not self.is_enabled or not self.values:
+            return dict()
+        return self.values
+
+    def _validate_helper(self, variable_path='NullValuesOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+
+        # the null values are matched in full by a single combined regex,
+        # hence only the flag which doesn't depend on the anchors of the
+        # combined regex can be scoped to a single null value
+        if self.values is not None and (
+                not isinstance(self.values, dict)
+                or not all(isinstance(key, str)
+                           and isinstance(value, int)
+                           and not value & ~re.IGNORECASE
+                           for key, value in self.values.items())):
+            errors.append("{}.values must be either None or a dictionary "
+                          "that contains keys of type str and values of type "
+                          "int (0 or the re.IGNORECASE flag)."
+                          .format(variable_path))
+        elif self.values:
+            for null_value in self.values:
+                try:
+                    null_regex = re.compile(null_value)
+                except re.error:
+                    errors.append("{}.values contains an invalid regex: "
+                                  "{}".format(variable_path, null_value))
+                    continue
+                # each null value is identified by its group in the combined
+                # regex, which groups of its own would shift
+                if null_regex.groups:
+                    errors.append("{}.values contains a regex with capturing "
+                                  "groups, which must be non-capturing "
+                                  "(?:...): {}".format(variable_path,
+                                                       null_value))
+        return errors
+
+
 class StructuredOptions(BaseOption):
 
     def __init__(self):
@@ -490,8 +728,13 @@ class StructuredOptions(BaseOption):
         :vartype order: OrderOptions
         :ivar category: option set for category profiling.
         :vartype category: CategoricalOptions
+        :ivar heavy_hitters: option set for heavy hitters profiling.
+        :vartype heavy_hitters: HeavyHittersOptions
         :ivar data_labeler: option set for data_labeler profiling.
         :vartype data_labeler: DataLabelerOptions
+        :ivar null_values: option set for the values which are considered
+            null in addition to the default null values.
+        :vartype null_values: NullValuesOptions
         """
         self.int = IntOptions()
         self.float = FloatOptions()
@@ -499,14 +742,16 @@ class StructuredOptions(BaseOption):
         self.text = TextOptions()
         self.order = OrderOptions()
         self.category = CategoricalOptions()
+        self.heavy_hitters = HeavyHittersOptions()
         self.data_labeler = DataLabelerOptions()
+        self.null_values = NullValuesOptions()
 
     @property
     def enabled_columns(self):
         """Returns a list of the enabled profiler columns."""
         enabled_columns = list()
         for key, value in self.properties.items():
-            if value.is_enabled:
+            if isinstance(value, BaseColumnOptions) and value.is_enabled:
                 enabled_columns.append(key)
         return enabled_columns
 
@@ -527,6 +772,171 @@ class StructuredOptions(BaseOption):
         return errors
 
 
+class ExecutorOptions(BaseOption):
+
+    # methods available for executing the column profiles of a dataset
+    _methods = ['serial', 'thread', 'process']
+
+    def __init__(self, method='serial', max_workers=None):
+        """
+        Options for how the columns of a dataset, or the partitions of a
+        partitioned dataset, are profiled.
+
+        :ivar method: how to execute the column profiles, one of: 'serial',
+            'thread' (thread pool), or 'process' (process pool). Partitions
+            are profiled with the matching local dask scheduler.
+        :vartype method: str
+        :ivar max_workers: max number of workers for the thread / process pool,
+            if None, the default of the pool is used
+        :vartype max_workers: Union[None, int]
+        """
+        self.method = method
+        self.max_workers = max_workers
+
+    def _validate_helper(self, variable_path='ExecutorOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        if not isinstance(variable_path, str):
+            raise ValueError("The variable path must be a string.")
+
+        errors = []
+        if self.method not in self._methods:
+            errors.append("{}.method must be one of the following: {}."
+                          .format(variable_path, self._methods))
+        if self.max_workers is not None and (
+                not isinstance(self.max_workers, int)
+                or isinstance(self.max_workers, bool)
+                or self.max_workers < 1):
+            errors.append("{}.max_workers must be None or a positive integer."
+                          .format(variable_path))
+        return errors
+
+
+class RowStatisticsOptions(BaseOption):
+
+    # methods available for counting the unique rows of a dataset
+    _unique_count_methods = ['exact', 'approximate']
+
+    def __init__(self, unique_count_method='exact',
+                 unique_count_error_rate=0.01):
+        """
+        Options for the row statistics of a dataset.
+
+        :ivar unique_count_method: how to count the unique rows, one of:
+            'exact' (stores the hash of each unique row) or 'approximate'
+            (HyperLogLog sketch of fixed memory)
+        :vartype unique_count_method: str
+        :ivar unique_count_error_rate: max relative standard error of the
+            approximate unique row count, at least
+            `HyperLogLog.min_error_rate` (about 0.002)
+        :vartype unique_count_error_rate: float
+        """
+        self.unique_count_method = unique_count_method
+        self.unique_count_error_rate = unique_count_error_rate
+
+    def _validate_helper(self, variable_path='RowStatisticsOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        if not isinstance(variable_path, str):
+            raise ValueError("The variable path must be a string.")
+
+        errors = []
+        if self.unique_count_method not in self._unique_count_methods:
+            errors.append("{}.unique_count_method must be one of the "
+                          "following: {}."
+                          .format(variable_path, self._unique_count_methods))
+        # the HyperLogLog sketch can't estimate the count more accurately
+        # than its min error rate
+        if not isinstance(self.unique_count_error_rate, (int, float)) \
+                or isinstance(self.unique_count_error_rate, bool) \
+                or not HyperLogLog.min_error_rate \
+                <= self.unique_count_error_rate < 1:
+            errors.append("{}.unique_count_error_rate must be a float between "
+                          "{} and 1.".format(variable_path,
+                                             HyperLogLog.min_error_rate))
+        return errors
+
+
+class SamplingOptions(BaseOption):
+
+    def __init__(self, seed=None, adaptive=False, convergence_tolerance=0.01,
+                 initial_batch_size=1000, batch_growth_factor=2):
+        """
+        Options for how the rows of a dataset are sampled.
+
+        :ivar seed: seed of the random sampling of the rows, if None, the
+            sampling is seeded from the global numpy random state
+        :vartype seed: Union[None, int]
+        :ivar adaptive: whether each column is profiled in batches of
+            increasing size until its estimates converge, instead of profiling
+            a fixed ratio of the rows
+        :vartype adaptive: bool
+        :ivar convergence_tolerance: max change of the estimates of a column
+            between two batches for the column to be converged
+        :vartype convergence_tolerance: float
+        :ivar initial_batch_size: number of rows of the first batch
+        :vartype initial_batch_size: int
+        :ivar batch_growth_factor: factor by which the number of profiled rows
+            grows with each batch
+        :vartype batch_growth_factor: float
+        """
+        self.seed = seed
+        self.adaptive = adaptive
+        self.convergence_tolerance = convergence_tolerance
+        self.initial_batch_size = initial_batch_size
+        self.batch_growth_factor = batch_growth_factor
+
+    def _validate_helper(self, variable_path='SamplingOptions'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        if not isinstance(variable_path, str):
+            raise ValueError("The variable path must be a string.")
+
+        errors = []
+        if self.seed is not None and (not isinstance(self.seed, int)
+                                      or isinstance(self.seed, bool)
+                                      or self.seed < 0):
+            errors.append("{}.seed must be None or a non-negative integer."
+                          .format(variable_path))
+        if not isinstance(self.adaptive, bool):
+            errors.append("{}.adaptive must be a Boolean."
+                          .format(variable_path))
+        if not isinstance(self.convergence_tolerance, (int, float)) \
+                or isinstance(self.convergence_tolerance, bool) \
+                or not 0 <= self.convergence_tolerance < 1:
+            errors.append("{}.convergence_tolerance must be a float in "
+                          "[0, 1).".format(variable_path))
+        if not isinstance(self.initial_batch_size, int) \
+                or isinstance(self.initial_batch_size, bool) \
+                or self.initial_batch_size < 1:
+            errors.append("{}.initial_batch_size must be a positive integer."
+                          .format(variable_path))
+        if not isinstance(self.batch_growth_factor, (int, float)) \
+                or isinstance(self.batch_growth_factor, bool) \
+                or self.batch_growth_factor <= 1:
+            errors.append("{}.batch_growth_factor must be a number greater "
+                          "than 1.".format(variable_path))
+        return errors
+
+
 class ProfilerOptions(BaseOption):
 
     def __init__(self):
@@ -535,8 +945,17 @@ class ProfilerOptions(BaseOption):
 
         :ivar structured_options: option set for structured dataset profiling.
         :vartype structured_options: StructuredOptions
+        :ivar executor: option set for executing the column profiles.
+        :vartype executor: ExecutorOptions
+        :ivar row_statistics: option set for the row statistics of a dataset.
+        :vartype row_statistics: RowStatisticsOptions
+        :ivar sampling: option set for the sampling of the rows of a dataset.
+        :vartype sampling: SamplingOptions
         """
         self.structured_options = StructuredOptions()
+        self.executor = ExecutorOptions()
+        self.row_statistics = RowStatisticsOptions()
+        self.sampling = SamplingOptions()
 
     def _validate_helper(self, variable_path='ProfilerOptions'):
         """
@@ -547,5 +966,12 @@ class ProfilerOptions(BaseOption):
         :return: list of errors (if raise_error is false)
         :rtype: list(str)
         """
-        return self.structured_options._validate_helper(
+        errors = self.structured_options._validate_helper(
             variable_path=variable_path + '.structured_options')
+        errors += self.executor._validate_helper(
+            variable_path=variable_path + '.executor')
+        errors += self.row_statistics._validate_helper(
+            variable_path=variable_path + '.row_statistics')
+        errors += self.sampling._validate_helper(
+            variable_path=variable_path + '.sampling')
+        return errors
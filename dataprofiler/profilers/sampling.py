@@ -0,0 +1,308 @@
+"""
+Vectorized sampling of the rows of a dataset, such that the rows which are
+profiled and the example samples of the profiles are chosen without looping
+over the rows in python.
+"""
+import math
+import threading
+
+import numpy as np
+
+
+def get_seed(seed=None):
+    """
+    Gets the seed of a random generator. If no seed is given, the seed is drawn
+    from the global numpy random state, such that it is reproducible with
+    `numpy.random.seed`.
+
+    :param seed: seed of the random generator
+    :type seed: Union[None, int]
+    :return: seed of the random generator
+    :rtype: int
+    """
+    if seed is None:
+        seed = np.random.randint(0, 2 ** 63 - 1, dtype=np.int64)
+    return int(seed)
+
+
+def get_generator_state(generator):
+    """
+    Gets the state of a random generator as a dict of plain python values,
+    such that it can be pickled without referencing the internals of numpy.
+
+    :param generator: random generator, or None
+    :type generator: Union[None, numpy.random.Generator]
+    :return: state of the bit generator of the random generator, or None
+    :rtype: Union[None, dict]
+    """
+    if generator is None:
+        return None
+    return generator.bit_generator.state
+
+
+def create_generator(state):
+    """
+    Creates a random generator from the state given by `get_generator_state`.
+
+    :param state: state of the bit generator of the random generator, or None
+    :type state: Union[None, dict]
+    :return: random generator continuing from the state, or None
+    :rtype: Union[None, numpy.random.Generator]
+    """
+    if state is None:
+        return None
+    bit_generator = getattr(np.random, state['bit_generator'])()
+    bit_generator.state = state
+    return np.random.Generator(bit_generator)
+
+
+class RowSample(object):
+
+    def __init__(self, data_length, seed=None):
+        """
+        Random order of the rows of a dataset, calculated lazily in vectorized
+        chunks, along with a random key for each row in that order. The order
+        is safe to share across threads, e.g. such that all the columns of a
+        dataset sample the same rows.
+
+        :param data_length: number of rows of the dataset
+        :type data_length: int
+        :param seed: seed of the random order, if None, the seed is drawn from
+            the global numpy random state
+        :type seed: Union[None, int]
+        """
+        self.data_length = data_length
+        self.seed = get_seed(seed)
+        index_seed, key_seed = np.random.SeedSequence(self.seed).spawn(2)
+        self._index_generator = np.random.default_rng(index_seed)
+        self._key_generator = np.random.default_rng(key_seed)
+        self._indices = np.zeros(0, dtype=np.int64)
+        self._keys = np.zeros(0)
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_lock')
+        state['_index_generator'] = get_generator_state(self._index_generator)
+        state['_key_generator'] = get_generator_state(self._key_generator)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._index_generator = create_generator(self._index_generator)
+        self._key_generator = create_generator(self._key_generator)
+        self._lock = threading.Lock()
+
+    def _extend_indices(self, stop):
+        """
+        Extends the random order of the rows up to `stop` rows.
+
+        :param stop: number of rows in the extended order
+        :type stop: int
+        :return: None
+        """
+        if not len(self._indices):
+            # only the random subset of rows which is needed is drawn
+            self._indices = self._index_generator.choice(
+                self.data_length, size=stop, replace=False)
+        else:
+            # the remaining rows are shuffled at once
+            is_remaining = np.ones(self.data_length, dtype=bool)
+            is_remaining[self._indices] = False
+            self._indices = np.concatenate([
+                self._indices, self._index_generator.permutation(
+                    np.flatnonzero(is_remaining))])
+
+    def get_indices(self, start, stop):
+        """
+        Gets the rows from `start` to `stop` in the random order of the rows.
+
+        :param start: position of the first row in the random order
+        :type start: int
+        :param stop: position after the last row in the random order
+        :type stop: int
+        :return: indices of the rows
+        :rtype: numpy.ndarray[int]
+        """
+        stop = min(stop, self.data_length)
+        with self._lock:
+            if stop > len(self._indices):
+                self._extend_indices(stop)
+        return self._indices[start:stop]
+
+    def get_keys(self, start, stop):
+        """
+        Gets the random keys of the rows from `start` to `stop` in the random
+        order of the rows. The keys are independent uniform random numbers,
+        e.g. used to sample the rows with a `ReservoirSampler`.
+
+        :param start: position of the first row in the random order
+        :type start: int
+        :param stop: position after the last row in the random order
+        :type stop: int
+        :return: keys of the rows
+        :rtype: numpy.ndarray[float]
+        """
+        stop = min(stop, self.data_length)
+        with self._lock:
+            if stop > len(self._keys):
+                self._keys = np.concatenate([
+                    self._keys,
+                    self._key_generator.random(stop - len(self._keys))])
+        return self._keys[start:stop]
+
+    def iter_indices(self, chunk_size, return_keys=False, start=0):
+        """
+        Generator of the rows in the random order, in chunks of `chunk_size`
+        rows.
+
+        :param chunk_size: number of rows in each chunk
+        :type chunk_size: int
+        :param return_keys: whether to also return the keys of the rows
+        :type return_keys: bool
+        :param start: position in the random order of the first row
+        :type start: int
+        :return: indices of the rows of each chunk, and their keys if
+            `return_keys` is True
+        :rtype: Generator[Union[numpy.ndarray,
+            tuple(numpy.ndarray, numpy.ndarray)]]
+        """
+        num_chunks = max(
+            math.ceil((self.data_length - start) / chunk_size), 1)
+        for chunk_ind in range(num_chunks):
+            chunk_start = start + chunk_ind * chunk_size
+            chunk_stop = chunk_start + chunk_size
+            indices = self.get_indices(chunk_start, chunk_stop)
+            if return_keys:
+                yield indices, self.get_keys(chunk_start, chunk_stop)
+            else:
+                yield indices
+
+
+def shuffle_in_chunks(data_length, chunk_size, seed=None):
+    """
+    A generator for creating shuffled indexes in chunks. This reduces the cost
+    of having to create all indexes, but only of that what is needed.
+
+    :param data_length: length of data to be shuffled
+    :type data_length: int
+    :param chunk_size: size of shuffled chunks
+    :type chunk_size: int
+    :param seed: seed of the shuffle, if None, the seed is drawn from the
+        global numpy random state
+    :type seed: Union[None, int]
+    :return: shuffled indices of chunk size
+    :rtype: Generator[numpy.ndarray[int]]
+    """
+    return RowSample(data_length, seed).iter_indices(chunk_size)
+
+
+class ReservoirSampler(object):
+
+    def __init__(self, sample_size, seed=None):
+        """
+        Uniform random sample of a stream of values of fixed size. Each value
+        is given a uniform random key and the values with the smallest keys
+        are kept, such that two samplers can be merged without bias.
+
+        :param sample_size: max number of values in the sample
+        :type sample_size: int
+        :param seed: seed of the keys drawn for the values, if None, the seed
+            is drawn from the global numpy random state
+        :type seed: Union[None, int]
+        """
+        self.sample_size = sample_size
+        self.count = 0
+        self._seed = seed
+        self._key_generator = None
+        self._values = []
+        self._keys = np.zeros(0)
+
+    def __add__(self, other):
+        """
+        Merges two samplers together overriding the `+` operator.
+
+        :param other: sampler being added to this one.
+        :type other: ReservoirSampler
+        :return: merger of the two samplers
+        :rtype: ReservoirSampler
+        """
+        if type(other) is not type(self):
+            raise TypeError('`{}` and `{}` are not of the same sampler type.'.
+                            format(type(self).__name__, type(other).__name__))
+        merged_sampler = ReservoirSampler(
+            max(self.sample_size, other.sample_size), self._seed)
+        merged_sampler.count = self.count + other.count
+        merged_sampler._keep_smallest_keys(
+            self._values + other._values,
+            np.concatenate([self._keys, other._keys]))
+        return merged_sampler
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_key_generator'] = get_generator_state(self._key_generator)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._key_generator = create_generator(self._key_generator)
+
+    @property
+    def samples(self):
+        """Sampled values, in random order."""
+        return list(self._values)
+
+    def _keep_smallest_keys(self, values, keys):
+        """
+        Keeps the values with the smallest keys as the sample.
+
+        :param values: candidate values of the sample
+        :type values: list
+        :param keys: keys of the values
+        :type keys: numpy.ndarray[float]
+        :return: None
+        """
+        sorted_inds = np.argsort(keys, kind='stable')[:self.sample_size]
+        self._values = [values[i] for i in sorted_inds]
+        self._keys = keys[sorted_inds]
+
+    def update(self, values, keys=None, convert_to_str=False):
+        """
+        Adds the values to the sample.
+
+        :param values: values being sampled
+        :type values: Union[list, numpy.ndarray, pandas.Series]
+        :param keys: uniform random keys of the values, if None, the keys are
+            drawn by the sampler
+        :type keys: numpy.ndarray[float]
+        :param convert_to_str: whether the values are converted to strings,
+            which only the values which can be in the sample are
+        :type convert_to_str: bool
+        :return: None
+        """
+        values = np.asarray(values, dtype=object)
+        if keys is None:
+            if self._key_generator is None:
+                self._key_generator = np.random.default_rng(
+                    get_seed(self._seed))
+            keys = self._key_generator.random(len(values))
+        keys = np.asarray(keys, dtype=float)
+        if len(values) != len(keys):
+            raise ValueError('`values` and `keys` must be the same length.')
+        self.count += len(values)
+        if not len(values):
+            return
+
+        # only the smallest keys of the values can be in the sample
+        if len(keys) > self.sample_size > 0:
+            candidate_inds = np.argpartition(
+                keys, self.sample_size - 1)[:self.sample_size]
+            values, keys = values[candidate_inds], keys[candidate_inds]
+        values = values.tolist()
+        if convert_to_str:
+            values = [str(value) for value in values]
+        self._keep_smallest_keys(self._values + values,
+                                 np.concatenate([self._keys, keys]))
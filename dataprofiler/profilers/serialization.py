@@ -0,0 +1,330 @@
+"""
+Binary format for saving and loading profiles.
+
+The format consists of::
+
+    magic | version (uint32) | header length (uint64) | header (json) |
+    pickled profile | padding | numpy buffers
+
+The profile is pickled with its numeric numpy arrays stored by reference to raw
+buffers, each aligned to `_BUFFER_ALIGNMENT` bytes, such that the buffers can be
+memory-mapped when loaded. Data labelers are stored by reference to their
+directory path and are reloaded (once per directory path) when loaded.
+
+Only the classes of the profilers, the methods of the column profiles and the
+few other globals listed in `_SAFE_GLOBALS` can be loaded from the pickled
+profile, such that a crafted profile can't call arbitrary functions. The data
+labelers are still loaded from the directory paths stored in the profile,
+hence profiles must only be loaded from trusted sources.
+"""
+import inspect
+import io
+import json
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+from . import data_labeler_column_profile
+from .base_column_profilers import BaseColumnProfiler
+from .numerical_column_stats import NumericStatsMixin
+
+
+_MAGIC = b'DPROFILE'
+_FORMAT_VERSION = 1
+_BUFFER_ALIGNMENT = 64
+
+# globals outside of the profilers which are referenced by the pickled profiles
+_SAFE_GLOBALS = frozenset([
+    ('builtins', 'bytearray'),
+    ('builtins', 'complex'),
+    ('builtins', 'float'),
+    ('builtins', 'frozenset'),
+    ('builtins', 'int'),
+    ('builtins', 'set'),
+    ('builtins', 'slice'),
+    ('collections', 'OrderedDict'),
+    ('collections', 'defaultdict'),
+    ('datetime', 'date'),
+    ('datetime', 'datetime'),
+    ('datetime', 'time'),
+    ('datetime', 'timedelta'),
+    ('datetime', 'timezone'),
+    ('numpy', 'dtype'),
+    ('numpy', 'ndarray'),
+    ('numpy.core.multiarray', '_reconstruct'),
+    ('numpy.core.multiarray', 'scalar'),
+    ('numpy._core.multiarray', '_reconstruct'),
+    ('numpy._core.multiarray', 'scalar'),
+])
+
+
+def _get_padding(offset):
+    """Number of bytes needed to align the offset to the buffer alignment."""
+    return -offset % _BUFFER_ALIGNMENT
+
+
+class _ProfilePickler(pickle.Pickler):
+
+    def __init__(self, file):
+        """
+        Pickler which stores the numeric numpy arrays and the data labelers of
+        a profile by reference.
+
+        :param file: file to which the pickled profile is written
+        :type file: io.BytesIO
+        """
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.buffers = []
+        self._buffer_ids = dict()
+        self._data_labeler_dirpaths = dict()
+
+    def persistent_id(self, obj):
+        if isinstance(obj, data_labeler_column_profile.DataLabelerColumn):
+            # columns are pickled prior to their data labeler, hence the data
+            # labeler can be identified when it is pickled
+            self._data_labeler_dirpaths[id(obj.data_labeler)] = \
+                obj._data_labeler_dirpath
+        elif id(obj) in self._data_labeler_dirpaths:
+            return 'data_labeler', self._data_labeler_dirpaths[id(obj)]
+        elif type(obj) is np.ndarray and not obj.dtype.hasobject:
+            if id(obj) not in self._buffer_ids:
+                self._buffer_ids[id(obj)] = len(self.buffers)
+                self.buffers.append(obj)
+            return 'ndarray', self._buffer_ids[id(obj)]
+        return None
+
+
+class _ProfileUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, buffers, data_labelers=None):
+        """
+        Unpickler which loads the numeric numpy arrays and data labelers stored
+        by reference.
+
+        :param file: file from which the pickled profile is read
+        :type file: io.BytesIO
+        :param buffers: numpy arrays stored by reference
+        :type buffers: list(numpy.ndarray)
+        :param data_labelers: already loaded data labelers by directory path,
+            which is updated with the data labelers loaded by the unpickler
+        :type data_labelers: dict
+        """
+        super().__init__(file)
+        self.buffers = buffers
+        self._data_labelers = data_labelers
+        if self._data_labelers is None:
+            self._data_labelers = dict()
+
+    def persistent_load(self, pid):
+        ref_type, ref = pid
+        if ref_type == 'ndarray':
+            return self.buffers[ref]
+        elif ref_type == 'data_labeler':
+            # load each data labeler once and share it across the columns
+            if ref not in self._data_labelers:
+                self._data_labelers[ref] = \
+                    data_labeler_column_profile.DataLabeler(
+                        labeler_type='structured', dirpath=ref,
+                        load_options=None)
+            return self._data_labelers[ref]
+        raise pickle.UnpicklingError(
+            'Unsupported persistent id: {}'.format(ref_type))
+
+    def find_class(self, module, name):
+        """
+        Loads a global referenced by the pickled profile, which is either a
+        class of the profilers, a method of the column profiles, e.g. used
+        as a calculation of a column profile, or one of `_SAFE_GLOBALS`.
+        """
+        if (module, name) in _SAFE_GLOBALS:
+            return super().find_class(module, name)
+        if module.startswith('dataprofiler.profilers.'):
+            obj = super().find_class(module, name)
+            if inspect.isclass(obj) \
+                    and obj.__module__.startswith('dataprofiler.profilers.'):
+                return obj
+            if inspect.isfunction(obj) and '.' in name:
+                owner = super().find_class(module, name.rsplit('.', 1)[0])
+                if inspect.isclass(owner) and issubclass(
+                        owner, (BaseColumnProfiler, NumericStatsMixin)):
+                    return obj
+        raise pickle.UnpicklingError(
+            '`{}.{}` is not allowed in a saved profile.'.format(module, name))
+
+
+def _write_profile(profile, output_file):
+    """
+    Writes the profile to the file in the binary profile format.
+
+    :param profile: profile being written
+    :type profile: Union[Profiler, StructuredDataProfile]
+    :param output_file: file to which the profile is written
+    :type output_file: file-like object
+    :return: None
+    """
+    pickled_profile = io.BytesIO()
+    pickler = _ProfilePickler(pickled_profile)
+    pickler.dump(profile)
+    pickled_profile = pickled_profile.getvalue()
+
+    buffers_info = []
+    offset = 0
+    for array in pickler.buffers:
+        offset += _get_padding(offset)
+        buffers_info.append({
+            'dtype': np.lib.format.dtype_to_descr(array.dtype),
+            'shape': array.shape,
+            'fortran_order': not array.flags.c_contiguous
+                and array.flags.f_contiguous,
+            'offset': offset,
+            'nbytes': array.nbytes,
+        })
+        offset += array.nbytes
+
+    header = json.dumps({
+        'pickle_nbytes': len(pickled_profile),
+        'buffers': buffers_info,
+    }).encode('utf-8')
+
+    output_file.write(_MAGIC)
+    output_file.write(np.uint32(_FORMAT_VERSION).tobytes())
+    output_file.write(np.uint64(len(header)).tobytes())
+    output_file.write(header)
+    output_file.write(pickled_profile)
+    output_file.write(b'\0' * _get_padding(output_file.tell()))
+    for array, buffer_info in zip(pickler.buffers, buffers_info):
+        output_file.write(b'\0' * _get_padding(output_file.tell()))
+        order = 'F' if buffer_info['fortran_order'] else 'C'
+        output_file.write(array.tobytes(order=order))
+
+
+def _read_profile(input_file, mmap_mode=None, data_labelers=None,
+                  name='input'):
+    """
+    Reads a profile in the binary profile format from the file.
+
+    :param input_file: file from which the profile is read
+    :type input_file: file-like object
+    :param mmap_mode: if not None, the numpy buffers are memory-mapped with
+        the mode (see `numpy.memmap`) instead of read into memory
+    :type mmap_mode: Union[None, str]
+    :param data_labelers: already loaded data labelers by directory path
+    :type data_labelers: dict
+    :param name: name of the input used in the error messages
+    :type name: str
+    :return: the read profile
+    :rtype: Union[Profiler, StructuredDataProfile]
+    """
+    if input_file.read(len(_MAGIC)) != _MAGIC:
+        raise ValueError('`{}` is not a saved profile.'.format(name))
+    version = int(np.frombuffer(input_file.read(4), dtype=np.uint32)[0])
+    if version != _FORMAT_VERSION:
+        raise ValueError(
+            'The saved profile format version {} is not supported, only '
+            'version {} can be loaded.'.format(version, _FORMAT_VERSION))
+    header_nbytes = int(
+        np.frombuffer(input_file.read(8), dtype=np.uint64)[0])
+    header = json.loads(input_file.read(header_nbytes).decode('utf-8'))
+    pickled_profile = input_file.read(header['pickle_nbytes'])
+    data_offset = input_file.tell()
+    data_offset += _get_padding(data_offset)
+
+    data_nbytes = 0
+    if header['buffers']:
+        data_nbytes = max(info['offset'] + info['nbytes']
+                          for info in header['buffers'])
+    if not data_nbytes:
+        data = np.zeros(0, dtype=np.uint8)
+    elif mmap_mode:
+        data = np.memmap(input_file, dtype=np.uint8, mode=mmap_mode,
+                         offset=data_offset, shape=(data_nbytes,))
+    else:
+        input_file.seek(data_offset)
+        data = np.frombuffer(bytearray(input_file.read(data_nbytes)),
+                             dtype=np.uint8)
+
+    buffers = []
+    for info in header['buffers']:
+        array = data[info['offset']:info['offset'] + info['nbytes']]
+        array = np.asarray(array).view(
+            np.lib.format.descr_to_dtype(info['dtype']))
+        order = 'F' if info['fortran_order'] else 'C'
+        buffers.append(array.reshape(info['shape'], order=order))
+
+    return _ProfileUnpickler(
+        io.BytesIO(pickled_profile), buffers, data_labelers).load()
+
+
+def save_profile(profile, filepath):
+    """
+    Saves the profile to the filepath in the binary profile format.
+
+    :param profile: profile being saved
+    :type profile: Union[Profiler, StructuredDataProfile]
+    :param filepath: path of the file to which the profile is saved
+    :type filepath: str
+    :return: None
+    """
+    # the profile is written to a temporary file which then replaces the
+    # filepath, since the buffers may be memory-mapped from the filepath
+    output_file = tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(os.path.abspath(filepath)), delete=False)
+    try:
+        _write_profile(profile, output_file)
+        output_file.close()
+        os.replace(output_file.name, filepath)
+    except BaseException:
+        output_file.close()
+        os.remove(output_file.name)
+        raise
+
+
+def load_profile(filepath, mmap_mode='c'):
+    """
+    Loads a profile saved in the binary profile format.
+
+    :param filepath: path of the file from which the profile is loaded
+    :type filepath: str
+    :param mmap_mode: if not None, the numpy buffers are memory-mapped with
+        the mode (see `numpy.memmap`) instead of read into memory. The default
+        mode 'c' (copy-on-write) never modifies the file.
+    :type mmap_mode: Union[None, str]
+    :return: the loaded profile
+    :rtype: Union[Profiler, StructuredDataProfile]
+    """
+    with open(filepath, 'rb') as input_file:
+        return _read_profile(input_file, mmap_mode=mmap_mode, name=filepath)
+
+
+def dumps_profile(profile):
+    """
+    Serializes the profile to bytes in the binary profile format, e.g. to send
+    it between processes.
+
+    :param profile: profile being serialized
+    :type profile: Union[Profiler, StructuredDataProfile]
+    :return: the serialized profile
+    :rtype: bytes
+    """
+    output_file = io.BytesIO()
+    _write_profile(profile, output_file)
+    return output_file.getvalue()
+
+
+def loads_profile(data, data_labelers=None):
+    """
+    Deserializes a profile from bytes in the binary profile format.
+
+    :param data: the serialized profile
+    :type data: bytes
+    :param data_labelers: already loaded data labelers by directory path, which
+        is updated with the loaded data labelers such that they can be shared
+        across profiles
+    :type data_labelers: dict
+    :return: the deserialized profile
+    :rtype: Union[Profiler, StructuredDataProfile]
+    """
+    return _read_profile(io.BytesIO(data), data_labelers=data_labelers,
+                         name='bytes')
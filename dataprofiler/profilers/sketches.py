@@ -0,0 +1,472 @@
+"""
+Mergeable, fixed-memory summaries of data which are used to calculate the
+statistics of the profiles without holding all the data in memory.
+"""
+import math
+
+import numpy as np
+import pandas as pd
+
+from . import sampling
+
+
+def _uint64_bit_length(values):
+    """
+    Calculates the bit length of each of the uint64 values, i.e. the position
+    of the highest set bit, such that 0 has a bit length of 0.
+
+    :param values: values for which to calculate the bit length
+    :type values: numpy.ndarray[numpy.uint64]
+    :return: bit length of each value
+    :rtype: numpy.ndarray[numpy.int64]
+    """
+    values = np.array(values, dtype=np.uint64)
+    bit_length = np.zeros(values.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        has_high_bits = (values >> np.uint64(shift)) != 0
+        values = np.where(has_high_bits, values >> np.uint64(shift), values)
+        bit_length += has_high_bits * shift
+    return bit_length + (values != 0)
+
+
+class ExactUniqueCounter(object):
+
+    def __init__(self):
+        """
+        Counts the unique 64 bit hashes exactly. The unique hashes of each
+        update are buffered and only merged into the sorted array of the
+        unique hashes when the count is read, or when the buffer grows larger
+        than the array, such that the array isn't sorted again on every
+        update.
+        """
+        self._hashes = np.array([], dtype=np.uint64)
+        self._buffer = list()
+        self._buffer_size = 0
+
+    def __add__(self, other):
+        """
+        Merges two unique counters together overriding the `+` operator.
+
+        :param other: unique counter being added to this one.
+        :type other: ExactUniqueCounter
+        :return: merger of the two unique counters
+        :rtype: ExactUniqueCounter
+        """
+        if type(other) is not type(self):
+            raise TypeError('`{}` and `{}` are not of the same counter type.'.
+                            format(type(self).__name__, type(other).__name__))
+        merged_counter = ExactUniqueCounter()
+        merged_counter._hashes = self._hashes
+        merged_counter._buffer = self._buffer + [other._hashes] + other._buffer
+        merged_counter._buffer_size = \
+            self._buffer_size + len(other._hashes) + other._buffer_size
+        return merged_counter
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def count(self):
+        """Number of unique hashes."""
+        self._merge_buffer()
+        return len(self._hashes)
+
+    def _merge_buffer(self):
+        """
+        Merges the buffered hashes into the sorted array of the unique hashes.
+
+        :return: None
+        """
+        if self._buffer:
+            self._hashes = np.unique(
+                np.concatenate([self._hashes] + self._buffer))
+            self._buffer = list()
+            self._buffer_size = 0
+
+    def update(self, hashes):
+        """
+        Adds the hashes to the counter.
+
+        :param hashes: 64 bit hashes of the data
+        :type hashes: numpy.ndarray[numpy.uint64]
+        :return: None
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if not len(hashes):
+            return
+        hashes = np.unique(hashes)
+        self._buffer.append(hashes)
+        self._buffer_size += len(hashes)
+        # the array is sorted again once the buffer is as large, hence each
+        # hash is sorted an amortized constant number of times
+        if self._buffer_size > len(self._hashes):
+            self._merge_buffer()
+
+
+class HyperLogLog(object):
+
+    # the registers are indexed by at most 18 bits of the hashes, hence the
+    # standard error of 1.04 / sqrt(num_registers) is at least 1.04 / 2 ** 9
+    _max_precision = 18
+    min_error_rate = 1.04 / math.sqrt(2 ** _max_precision)
+
+    def __init__(self, error_rate=0.01):
+        """
+        Estimates the number of unique 64 bit hashes in fixed memory with the
+        HyperLogLog algorithm. The number of registers is chosen such that the
+        standard error of the estimate is at most `error_rate`, which must be
+        at least `HyperLogLog.min_error_rate` (about 0.002).
+
+        :param error_rate: max relative standard error of the estimate
+        :type error_rate: float
+        """
+        if not isinstance(error_rate, (int, float)) \
+                or isinstance(error_rate, bool) \
+                or not self.min_error_rate <= error_rate < 1:
+            raise ValueError('`error_rate` must be a float between {} and 1.'
+                             .format(self.min_error_rate))
+        self.error_rate = error_rate
+
+        # standard error of HyperLogLog is 1.04 / sqrt(num_registers)
+        self._precision = max(
+            int(math.ceil(math.log2((1.04 / error_rate) ** 2))), 4)
+        self._registers = np.zeros(2 ** self._precision, dtype=np.uint8)
+
+    def __add__(self, other):
+        """
+        Merges two HyperLogLog sketches together overriding the `+` operator.
+
+        :param other: sketch being added to this one.
+        :type other: HyperLogLog
+        :return: merger of the two sketches
+        :rtype: HyperLogLog
+        """
+        if type(other) is not type(self):
+            raise TypeError('`{}` and `{}` are not of the same counter type.'.
+                            format(type(self).__name__, type(other).__name__))
+        elif self._precision != other._precision:
+            raise ValueError('HyperLogLog sketches with different error rates '
+                             'cannot be added together.')
+        merged_counter = HyperLogLog(self.error_rate)
+        merged_counter._registers = np.maximum(self._registers,
+                                               other._registers)
+        return merged_counter
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def count(self):
+        """Estimated number of unique hashes."""
+        num_registers = len(self._registers)
+        if num_registers == 16:
+            alpha = 0.673
+        elif num_registers == 32:
+            alpha = 0.697
+        elif num_registers == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / num_registers)
+        estimate = alpha * num_registers ** 2 / np.sum(
+            np.ldexp(1., -self._registers.astype(np.int64)))
+
+        # small range correction with linear counting
+        num_zero_registers = np.count_nonzero(self._registers == 0)
+        if estimate <= 2.5 * num_registers and num_zero_registers:
+            estimate = num_registers * math.log(
+                num_registers / num_zero_registers)
+        return int(round(estimate))
+
+    def update(self, hashes):
+        """
+        Adds the hashes to the sketch.
+
+        :param hashes: 64 bit hashes of the data
+        :type hashes: numpy.ndarray[numpy.uint64]
+        :return: None
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if not len(hashes):
+            return
+        precision = np.uint64(self._precision)
+        register_inds = (hashes >> (np.uint64(64) - precision)).astype(np.intp)
+
+        # position of the first set bit after the register bits, bounded by
+        # a sentinel bit in case all the remaining bits are 0
+        remaining_bits = (hashes << precision) \
+            | (np.uint64(1) << (precision - np.uint64(1)))
+        ranks = (65 - _uint64_bit_length(remaining_bits)).astype(np.uint8)
+        np.maximum.at(self._registers, register_inds, ranks)
+
+
+class KLLSketch(object):
+
+    # ratio of the capacities of consecutive levels of the sketch
+    _capacity_ratio = 2. / 3.
+
+    def __init__(self, error_rate=0.01, seed=None):
+        """
+        Estimates the quantiles of a stream of numbers in fixed memory with
+        the KLL algorithm. The sketch holds levels of sorted compactors, where
+        each item of level h represents 2 ** h items of the stream. Each
+        compaction promotes either the odd or the even items of a level at
+        random. The size `k` of the top level is chosen such that the
+        normalized rank error of the estimated quantiles is at most
+        `error_rate` with a probability of 99%.
+
+        :param error_rate: max normalized rank error of the estimates
+        :type error_rate: float
+        :param seed: seed of the random compactions, if None, the seed is
+            drawn from the global numpy random state
+        :type seed: Union[None, int]
+        """
+        if not isinstance(error_rate, (int, float)) \
+                or isinstance(error_rate, bool) or not 0 < error_rate < 1:
+            raise ValueError('`error_rate` must be a float between 0 and 1.')
+        self.error_rate = error_rate
+
+        # the max normalized rank error over the quantiles of KLL is at most
+        # 2.446 / k ** 0.9433 with a probability of 99%, as measured for the
+        # KLL sketch of Apache DataSketches
+        self._k = max(int(math.ceil(
+            (2.446 / error_rate) ** (1 / 0.9433))), 8)
+        self._levels = [np.array([], dtype=float)]
+        self._random_generator = np.random.default_rng(
+            sampling.get_seed(seed))
+        self.count = 0
+
+    def __add__(self, other):
+        """
+        Merges two KLL sketches together overriding the `+` operator.
+
+        :param other: sketch being added to this one.
+        :type other: KLLSketch
+        :return: merger of the two sketches
+        :rtype: KLLSketch
+        """
+        if type(other) is not type(self):
+            raise TypeError('`{}` and `{}` are not of the same sketch type.'.
+                            format(type(self).__name__, type(other).__name__))
+        elif self._k != other._k:
+            raise ValueError('KLL sketches with different error rates cannot '
+                             'be added together.')
+        merged_sketch = KLLSketch(
+            self.error_rate,
+            seed=int(self._random_generator.integers(2 ** 63 - 1)))
+        num_levels = max(len(self._levels), len(other._levels))
+        merged_sketch._levels = [
+            np.concatenate([sketch._levels[h] for sketch in (self, other)
+                            if h < len(sketch._levels)])
+            for h in range(num_levels)]
+        merged_sketch.count = self.count + other.count
+        merged_sketch._compress()
+        return merged_sketch
+
+    def __len__(self):
+        return self.count
+
+    def __getstate__(self):
+        # the random generator is pickled as its state, such that the saved
+        # profiles don't reference the internals of numpy
+        state = self.__dict__.copy()
+        state['_random_generator'] = sampling.get_generator_state(
+            self._random_generator)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._random_generator = sampling.create_generator(
+            self._random_generator)
+
+    def _get_capacity(self, level):
+        """
+        Calculates the max number of items of a level, which decreases
+        geometrically from `k` at the top level.
+
+        :param level: level of the sketch
+        :type level: int
+        :return: max number of items of the level
+        :rtype: int
+        """
+        depth = len(self._levels) - level - 1
+        return max(int(math.ceil(
+            self._k * self._capacity_ratio ** depth)), 2)
+
+    def _compress(self):
+        """
+        Compacts the levels of the sketch which exceed their capacity, from
+        the bottom level up, until each level is within its capacity. A
+        compaction sorts the level and promotes every other item to the next
+        level, such that the promoted items represent twice as many items of
+        the stream.
+
+        :return: None
+        """
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) <= self._get_capacity(level):
+                level += 1
+                continue
+            if level + 1 == len(self._levels):
+                self._levels.append(np.array([], dtype=float))
+            items = np.sort(items)
+            # an odd item out stays at the level
+            num_compacted = len(items) - len(items) % 2
+            offset = int(self._random_generator.integers(2))
+            self._levels[level + 1] = np.concatenate(
+                [self._levels[level + 1], items[offset:num_compacted:2]])
+            self._levels[level] = items[num_compacted:]
+            # the capacity of the lower levels decreases once a level is added
+            level = 0
+
+    def update(self, values):
+        """
+        Adds the values to the sketch.
+
+        :param values: numbers of the stream
+        :type values: numpy.ndarray
+        :return: None
+        """
+        values = np.asarray(values, dtype=float)
+        if not len(values):
+            return
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self.count += len(values)
+        self._compress()
+
+    def get_quantiles(self, quantiles):
+        """
+        Estimates the values at the given quantiles of the stream, i.e. the
+        smallest retained value whose estimated rank is at least the quantile.
+
+        :param quantiles: quantiles to estimate, each between 0 and 1
+        :type quantiles: Union[list(float), numpy.ndarray]
+        :return: estimated value at each quantile, None if the sketch is empty
+        :rtype: Union[None, numpy.ndarray]
+        """
+        if not self.count:
+            return None
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(len(level_items), 2 ** level, dtype=np.int64)
+            for level, level_items in enumerate(self._levels)])
+        sort_inds = np.argsort(items, kind='mergesort')
+        cumulative_weights = np.cumsum(weights[sort_inds])
+        ranks = np.asarray(quantiles, dtype=float) * cumulative_weights[-1]
+        inds = np.searchsorted(cumulative_weights, ranks, side='left')
+        return items[sort_inds][np.minimum(inds, len(items) - 1)]
+
+
+class MisraGries(object):
+
+    def __init__(self, num_counters=1000):
+        """
+        Finds the most frequent values of a stream in fixed memory with the
+        Misra-Gries algorithm, which keeps at most `num_counters` counters.
+        Each chunk of the stream is counted exactly and merged into the
+        counters, such that the count of each value is underestimated by at
+        most count / (num_counters + 1), where count is the number of values
+        of the stream. The bound holds for merged sketches as well.
+
+        :param num_counters: max number of counters of the sketch
+        :type num_counters: int
+        """
+        if not isinstance(num_counters, int) or isinstance(num_counters, bool) \
+                or num_counters < 1:
+            raise ValueError('`num_counters` must be a positive integer.')
+        self.num_counters = num_counters
+        self._counts = pd.Series([], dtype=np.int64)
+        # total decrement of the counters, i.e. the max error of the counts
+        self.max_error = 0
+        self.count = 0
+
+    def __add__(self, other):
+        """
+        Merges two Misra-Gries sketches together overriding the `+` operator.
+
+        :param other: sketch being added to this one.
+        :type other: MisraGries
+        :return: merger of the two sketches
+        :rtype: MisraGries
+        """
+        if type(other) is not type(self):
+            raise TypeError('`{}` and `{}` are not of the same sketch type.'.
+                            format(type(self).__name__, type(other).__name__))
+        elif self.num_counters != other.num_counters:
+            raise ValueError('Misra-Gries sketches with different numbers of '
+                             'counters cannot be added together.')
+        merged_sketch = MisraGries(self.num_counters)
+        merged_sketch._counts = self._counts
+        merged_sketch.max_error = self.max_error
+        merged_sketch.count = self.count
+        merged_sketch._merge_counts(other._counts, other.count, other.max_error)
+        return merged_sketch
+
+    def __len__(self):
+        return self.count
+
+    def __getstate__(self):
+        # the counts are pickled as numpy arrays, such that the saved
+        # profiles don't reference the internals of pandas
+        state = self.__dict__.copy()
+        state['_counts'] = (self._counts.index.values, self._counts.values)
+        return state
+
+    def __setstate__(self, state):
+        values, counts = state.pop('_counts')
+        self.__dict__.update(state)
+        self._counts = pd.Series(counts, index=values)
+
+    def _merge_counts(self, counts, count, max_error=0):
+        """
+        Adds the counts of the values to the counters. If more than
+        `num_counters` counters remain, all the counters are decremented by
+        the count of the counter after the largest `num_counters` ones, such
+        that only the largest counters remain.
+
+        :param counts: counts of the values indexed by the values
+        :type counts: pandas.Series
+        :param count: number of values which were counted
+        :type count: int
+        :param max_error: max error of the counts
+        :type max_error: int
+        :return: None
+        """
+        counts = pd.concat([self._counts, counts]) \
+            .groupby(level=0, sort=False, dropna=False).sum()
+        if len(counts) > self.num_counters:
+            decrement = np.partition(
+                counts.values, -(self.num_counters + 1))[-(self.num_counters + 1)]
+            counts = counts[counts.values > decrement] - decrement
+            max_error += decrement
+        self._counts = counts
+        self.max_error += int(max_error)
+        self.count += int(count)
+
+    def update(self, values):
+        """
+        Adds the values to the sketch.
+
+        :param values: values of the stream
+        :type values: pandas.Series
+        :return: None
+        """
+        if not len(values):
+            return
+        self._merge_counts(
+            values.value_counts(dropna=False, sort=False), len(values))
+
+    def get_most_frequent(self, num_values):
+        """
+        Estimates the most frequent values of the stream and their counts,
+        which are at most `max_error` less than the true counts.
+
+        :param num_values: max number of values to return
+        :type num_values: int
+        :return: estimated counts of the most frequent values, by count
+        :rtype: dict
+        """
+        most_frequent = self._counts.sort_values(
+            ascending=False, kind='mergesort')[:num_values]
+        return {value: int(count) for value, count in most_frequent.items()}
@@ -1,6 +1,11 @@
+import time
+
+import numpy as np
+
 from .numerical_column_stats import NumericStatsMixin
 from .base_column_profilers import BaseColumnProfiler, \
     BaseColumnPrimitiveTypeProfiler
+from .column_view import ColumnView
 from .profiler_options import TextOptions
 
 
@@ -25,7 +30,8 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             self.options = options
         NumericStatsMixin.__init__(self, options)
         BaseColumnPrimitiveTypeProfiler.__init__(self, name)
-        self.vocab = list()
+        # counts of the characters in the order they were first seen
+        self._vocab_counts = dict()
         self.__calculations = {
             "vocab": TextColumn._update_vocab
         }
@@ -45,10 +51,18 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             raise TypeError("Unsupported operand type(s) for +: "
                             "'TextColumn' and '{}'".format(other.__class__.__name__))
         merged_profile = TextColumn(None)
-        merged_profile.vocab = self.vocab.copy()
-        merged_profile._update_vocab([other.vocab])
+        start_time = time.time()
+        merged_profile._vocab_counts = self._vocab_counts.copy()
+        merged_profile._merge_vocab_counts(other._vocab_counts)
+        merged_profile.times['vocab'] += time.time() - start_time
         NumericStatsMixin._add_helper(merged_profile, self, other)
         BaseColumnPrimitiveTypeProfiler._add_helper(merged_profile, self, other)
+        if merged_profile.max:
+            merged_profile.col_type = \
+                'string' if merged_profile.max <= 255 else 'text'
+        # the options are kept such that the reported vocab and the frozen
+        # histogram selection of the merged profile persist
+        merged_profile.options = self.options or other.options
         return merged_profile
 
     @property
@@ -69,13 +83,33 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             median=None,
             variance=self.variance,
             stddev=self.stddev,
+            skewness=self.skewness,
+            kurtosis=self.kurtosis,
             histogram=self.histogram_methods[histogram_method]['histogram'],
             quantiles=self.quantiles,
             vocab=self.vocab,
             times=self.times
         )
+        if self.options and self.options.vocab_count.is_enabled:
+            profile["vocab_count"] = self.vocab_count
         return profile
 
+    @property
+    def vocab(self):
+        """
+        Property for vocab. Returns the unique characters of the column in the
+        order they were first seen.
+        """
+        return list(self._vocab_counts)
+
+    @property
+    def vocab_count(self):
+        """
+        Property for vocab_count. Returns the number of occurrences of each
+        character of the vocab.
+        """
+        return self._vocab_counts.copy()
+
     @property
     def data_type_ratio(self):
         """
@@ -92,10 +126,12 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
     def _update_vocab(self, data, prev_dependent_properties=None,
                       subset_properties=None):
         """
-        Finds the unique vocabulary used in the text column.
+        Finds the unique vocabulary used in the text column and counts the
+        occurrences of each character. The characters of all the rows are
+        counted at once as the code points of their UTF-32 encoding.
 
-        :param data: list or array of data from which to extract vocab
-        :type data: Union[list, numpy.array, pandas.DataFrame]
+        :param data: list or array of strings from which to extract vocab
+        :type data: Union[list, numpy.array, pandas.Series]
         :param prev_dependent_properties: Contains all the previous properties
             that the calculations depend on.
         :type prev_dependent_properties: dict
@@ -104,11 +140,30 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         :type subset_properties: dict
         :return: None
         """
-        vocab = []
-        for row in data:
-            row = list(row)
-            vocab = TextColumn._combine_unique_sets(vocab, row)
-        self.vocab = self._combine_unique_sets(self.vocab, vocab)
+        text = ''.join(data)
+        if not text:
+            return
+        code_points = np.frombuffer(
+            text.encode('utf-32-le', errors='surrogatepass'), dtype=np.uint32)
+        unique_code_points, first_indices, counts = np.unique(
+            code_points, return_index=True, return_counts=True)
+        # the unique code points are added in the order they were first seen
+        order = np.argsort(first_indices)
+        for code_point, count in zip(unique_code_points[order].tolist(),
+                                     counts[order].tolist()):
+            char = chr(code_point)
+            self._vocab_counts[char] = self._vocab_counts.get(char, 0) + count
+
+    def _merge_vocab_counts(self, vocab_counts):
+        """
+        Adds the counts of the characters of another vocab to the vocab.
+
+        :param vocab_counts: number of occurrences of each character
+        :type vocab_counts: dict
+        :return: None
+        """
+        for char, count in vocab_counts.items():
+            self._vocab_counts[char] = self._vocab_counts.get(char, 0) + count
 
     def _update_helper(self, df_series_clean, profile):
         """
@@ -116,13 +171,13 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         dataset and the known null parameters of the dataset.
         
         :param df_series_clean: df series with nulls removed
-        :type df_series_clean: pandas.core.series.Series
+        :type df_series_clean: Union[pandas.core.series.Series, ColumnView]
         :param profile: text profile dictionary
         :type profile: dict
         :return: None
         """
         if self._NumericStatsMixin__calculations:
-            text_lengths = df_series_clean.str.len()
+            text_lengths = ColumnView.create(df_series_clean).str_lengths
             NumericStatsMixin._update_helper(self, text_lengths, profile)
         self._update_column_base_properties(profile)
         if self.max:
@@ -133,7 +188,7 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         Updates the column profile.
         
         :param df_series: df series
-        :type df_series: pandas.core.series.Series
+        :type df_series: Union[pandas.core.series.Series, ColumnView]
         :return: None
         """
         len_df = len(df_series)
@@ -141,8 +196,9 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             return
         profile = dict(match_count=len_df, sample_size=len_df)
 
+        column_view = ColumnView.create(df_series)
         BaseColumnProfiler._perform_property_calcs(
-            self, self.__calculations, df_series=df_series,
+            self, self.__calculations, df_series=column_view.series,
             prev_dependent_properties={}, subset_properties=profile)
 
-        self._update_helper(df_series, profile)
+        self._update_helper(column_view, profile)
@@ -14,8 +14,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import collections
-import random
-import math
+
+from . import sampling
 
 
 def dict_merge(dct, merge_dct):
@@ -36,48 +36,14 @@ def dict_merge(dct, merge_dct):
             dct[k] = merge_dct[k]
 
 
-class KeyDict(collections.defaultdict):
-    """
-    Helper class for sample_in_chunks. Allows keys that are missing to become
-    the values for that key.
-    From:
-    https://www.drmaciver.com/2018/01/lazy-fisher-yates-shuffling-for-precise-rejection-sampling/
-    """
-    def __missing__(self, key):
-        return key
-
-
 def shuffle_in_chunks(data_length, chunk_size):
     """
     A generator for creating shuffled indexes in chunks. This reduces the cost
     of having to create all indexes, but only of that what is needed.
-    Initial Code idea from:
-    https://www.drmaciver.com/2018/01/lazy-fisher-yates-shuffling-for-precise-rejection-sampling/
-    
+    The shuffle is vectorized, see `sampling.shuffle_in_chunks`.
+
     :param data_length: length of data to be shuffled
     :param chunk_size: size of shuffled chunks
-    :return: list of shuffled indices of chunk size
+    :return: shuffled indices of chunk size
     """
-    indices = KeyDict()
-    j = 0
-    # loop through all chunks
-    for chunk_ind in range(max(math.ceil(data_length / chunk_size), 1)):
-
-        # determine the chunk size and preallocate an array
-        true_chunk_size = min(chunk_size, data_length - chunk_size * chunk_ind)
-        values = [-1] * true_chunk_size
-
-        # shuffle the indexes
-        for count in range(true_chunk_size):
-
-            # get a random index to swap and swap it with j
-            k = random.randrange(j, data_length)
-            indices[j], indices[k] = indices[k], indices[j]
-
-            # set the swapped value to the output
-            values[count] = indices[j]
-
-            # increment so as not to include values already swapped
-            j += 1
-            
-        yield values
+    return sampling.shuffle_in_chunks(data_length, chunk_size)
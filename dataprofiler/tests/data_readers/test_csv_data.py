@@ -176,6 +176,30 @@ class TestCSVDataClass(unittest.TestCase):
             self.assertEqual(input_data_obj.data_type, 'csv')
             self.assertEqual(input_data_obj.delimiter, input_file['delimiter'])
 
+    def test_iter_chunks(self):
+        """
+        Determine if the csv file can be read in chunks
+        """
+        import pandas as pd
+        test_dir = os.path.join(test_root_path, 'data')
+        for filename in ['csv/diamonds.csv', 'csv/iris-utf-16.csv',
+                         'csv/all-strings-skip-header.csv']:
+            file_path = os.path.join(test_dir, filename)
+            input_data_obj = Data(file_path)
+            chunks = list(input_data_obj.iter_chunks(chunk_size=1000))
+            self.assertTrue(all(len(chunk) <= 1000 for chunk in chunks))
+            self.assertTrue(pd.concat(chunks).equals(Data(file_path).data))
+
+        # in memory data is sliced into chunks
+        input_data_obj = Data(data=pd.DataFrame({'a': [1, 3, 5]}),
+                              data_type='csv')
+        chunks = list(input_data_obj.iter_chunks(chunk_size=2))
+        self.assertEqual([2, 1], [len(chunk) for chunk in chunks])
+
+        with self.assertRaisesRegex(ValueError, '`chunk_size` must be a '
+                                                'positive integer.'):
+            list(input_data_obj.iter_chunks(chunk_size=0))
+
     def test_allowed_data_formats(self):
         """
         Determine if the csv file data_formats can be used
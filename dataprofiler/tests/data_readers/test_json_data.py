@@ -70,6 +70,18 @@ class TestJSONDataClass(unittest.TestCase):
             input_data_obj.reload(input_file["path"])
             self.assertEqual(input_data_obj.data_type, 'json')
 
+    def test_iter_chunks(self):
+        """
+        Determine if the json file can be read in chunks
+        """
+        import pandas as pd
+        for input_file in self.input_file_names[:3]:
+            input_data_obj = Data(input_file['path'])
+            chunks = list(input_data_obj.iter_chunks(chunk_size=4))
+            self.assertTrue(all(len(chunk) <= 4 for chunk in chunks))
+            self.assertTrue(pd.concat(chunks).equals(
+                Data(input_file['path']).data))
+
     def test_json_from_string(self):
         """
         Determine if the json file can be loaded with manual data_type setting
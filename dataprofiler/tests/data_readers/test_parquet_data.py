@@ -73,6 +73,18 @@ class TestParquetDataClass(unittest.TestCase):
                     self.assertIsInstance(data, list)
                     self.assertIsInstance(data[0], str)
 
+    def test_iter_chunks(self):
+        """
+        Determine if the parquet file can be read in chunks
+        """
+        import pandas as pd
+        for input_file in self.input_file_names:
+            input_data_obj = Data(input_file['path'])
+            chunks = list(input_data_obj.iter_chunks(chunk_size=10))
+            self.assertTrue(all(len(chunk) <= 10 for chunk in chunks))
+            self.assertTrue(pd.concat(chunks).equals(
+                Data(input_file['path']).data))
+
     def test_mixed_string_col(self):
         """
         Determine if parquet can handle mixed string column types.
@@ -11,6 +11,7 @@ from . import utils as test_utils
 
 from dataprofiler.profilers import CategoricalColumn
 from dataprofiler.profilers.profile_builder import StructuredDataProfile
+from dataprofiler.profilers.profiler_options import CategoricalOptions
 
 
 test_root_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
@@ -163,13 +164,17 @@ class TestCategoricalColumn(unittest.TestCase):
         self.assertTrue(report["categorical"])
         six.assertCountEqual(
             self,
-            ['unique_count', 'unique_ratio', 'categories'], report['statistics']
+            ['unique_count', 'unique_ratio', 'categories', 'categorical_count'],
+            report['statistics']
         )
         self.assertEqual(3, report["statistics"]["unique_count"])
         self.assertEqual(0.25, report["statistics"]["unique_ratio"])
         self.assertListEqual(
             ["a", "b", "c"], report["statistics"]["categories"]
         )
+        self.assertDictEqual(
+            {"a": 3, "b": 4, "c": 5}, report["statistics"]["categorical_count"]
+        )
 
     def test_false_categorical_report(self):
         df_non_categorical = pd.Series(list(map(str, range(0, 20))))
@@ -225,6 +230,89 @@ class TestCategoricalColumn(unittest.TestCase):
         self.assertEqual(profile3.is_match, True)
         self.assertEqual(profile3.unique_ratio, 16 / 1000)
 
+    def test_categorical_count(self):
+        df1 = pd.Series(["a", "b", "a", np.nan, "c", "a"])
+        df2 = pd.Series(["b", "d", np.nan, "a"])
+
+        profile = CategoricalColumn("Name")
+        profile.update(df1)
+        profile.update(df2)
+        self.assertListEqual(["a", "b", np.nan, "c", "d"], profile.categories)
+        self.assertDictEqual({"a": 4, "b": 2, np.nan: 2, "c": 1, "d": 1},
+                             profile.categorical_count)
+
+        profile2 = CategoricalColumn("Name")
+        profile2.update(df2)
+        profile3 = profile + profile2
+        self.assertDictEqual({"a": 5, "b": 3, np.nan: 3, "c": 1, "d": 2},
+                             profile3.categorical_count)
+
+    def test_max_categories(self):
+        options = CategoricalOptions(max_categories=15)
+        df = pd.Series(list(map(str, range(10))) * 3)
+
+        profile = CategoricalColumn("Name", options=options)
+        profile.update(df)
+        self.assertTrue(profile.is_match)
+        self.assertEqual(10, profile.unique_count)
+
+        # exceeding the max number of categories drops the categories and
+        # counts the unique values approximately
+        profile.update(pd.Series(list(map(str, range(5, 1005)))))
+        self.assertFalse(profile.is_match)
+        self.assertListEqual([], profile.categories)
+        self.assertDictEqual({}, profile.categorical_count)
+        self.assertAlmostEqual(1005, profile.unique_count, delta=20)
+        self.assertCountEqual(['unique_count', 'unique_ratio'],
+                              profile.profile['statistics'])
+
+        profile.update(df)
+        self.assertFalse(profile.is_match)
+        self.assertAlmostEqual(1005, profile.unique_count, delta=20)
+
+        # merges with a profile of categories stay approximate
+        profile2 = CategoricalColumn("Name", options=options)
+        profile2.update(pd.Series(list(map(str, range(1000, 1010)))))
+        self.assertTrue(profile2.is_match)
+        for profile3 in [profile + profile2, profile2 + profile]:
+            self.assertFalse(profile3.is_match)
+            self.assertAlmostEqual(1010, profile3.unique_count, delta=20)
+            self.assertEqual(
+                profile.sample_size + profile2.sample_size,
+                profile3.sample_size)
+
+        # merging two profiles of categories can exceed the max as well
+        profile4 = CategoricalColumn("Name", options=options)
+        profile4.update(df)
+        profile5 = CategoricalColumn("Name", options=options)
+        profile5.update(pd.Series(list(map(str, range(10, 20)))))
+        profile6 = profile4 + profile5
+        self.assertFalse(profile6.is_match)
+        self.assertEqual(20, profile6.unique_count)
+
+    def test_max_categories_keeps_categorical_columns(self):
+        # a max below the max unique values of a categorical column doesn't
+        # change whether the column is categorical
+        options = CategoricalOptions(max_categories=3)
+        profile = CategoricalColumn("Name", options=options)
+        profile.update(pd.Series(['a', 'b', 'c', 'd'] * 1000))
+        self.assertTrue(profile.is_match)
+        self.assertDictEqual({'a': 1000, 'b': 1000, 'c': 1000, 'd': 1000},
+                             profile.categorical_count)
+
+        # nor does a max below the unique values of a column whose unique
+        # ratio is within the categorical threshold
+        options = CategoricalOptions(max_categories=15)
+        profile = CategoricalColumn("Name", options=options)
+        profile.update(pd.Series(list(map(str, range(20))) * 10))
+        self.assertTrue(profile.is_match)
+        self.assertEqual(20, len(profile.categories))
+
+        # the categories are dropped once the column is no longer categorical
+        profile.update(pd.Series(list(map(str, range(20, 1020)))))
+        self.assertFalse(profile.is_match)
+        self.assertListEqual([], profile.categories)
+
 
 class TestCategoricalSentence(unittest.TestCase):
 
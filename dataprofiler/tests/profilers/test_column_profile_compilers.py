@@ -4,8 +4,11 @@ import six
 import unittest
 from unittest import mock
 
+import pandas as pd
+
 from dataprofiler.profilers import column_profile_compilers as \
     col_pro_compilers
+from dataprofiler.profilers.profiler_options import StructuredOptions
 
 
 class TestBaseColumnProfileCompilerClass(unittest.TestCase):
@@ -84,5 +87,39 @@ class TestBaseColumnProfileCompilerClass(unittest.TestCase):
         )
 
 
+
+class TestColumnPrimitiveTypeProfileCompiler(unittest.TestCase):
+
+    def test_skipped_stats(self):
+        data = pd.Series(['1', '2.5', 'a'])
+        compiler = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(data)
+        self.assertNotIn('skipped_stats', compiler.profile['statistics'])
+
+        options = StructuredOptions()
+        options.set({'early_elimination.is_enabled': True})
+        compiler = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+            data, options)
+        compiler.update_profile(pd.Series(['3']))
+        profile = compiler.profile
+        self.assertEqual('string', profile['data_type'])
+        self.assertListEqual(['int', 'float'],
+                             list(profile['statistics']['skipped_stats']))
+        self.assertIn('precision',
+                      profile['statistics']['skipped_stats']['float'])
+
+
+class TestColumnStatsProfileCompiler(unittest.TestCase):
+
+    def test_profile_statistics(self):
+        data = pd.Series(['b', 'a', 'b', 'c', 'b', 'a'])
+        compiler = col_pro_compilers.ColumnStatsProfileCompiler(data)
+        profile = compiler.profile
+        self.assertTrue(profile['categorical'])
+        self.assertEqual('random', profile['order'])
+        self.assertEqual(3, profile['statistics']['unique_count'])
+        self.assertDictEqual({'b': 3, 'a': 2, 'c': 1},
+                             profile['statistics']['heavy_hitters'])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from dataprofiler.profilers.column_view import ColumnView
+from dataprofiler.profilers.column_profile_compilers import \
+    ColumnPrimitiveTypeProfileCompiler
+from dataprofiler.profilers.numerical_column_stats import NumericStatsMixin
+
+
+class TestColumnView(unittest.TestCase):
+    """
+    Validates the ColumnView is properly working.
+    """
+
+    def test_create(self):
+        data = pd.Series([1, 2.5, None], name='test')
+        column_view = ColumnView.create(data)
+        self.assertIs(data, column_view.native_series)
+        self.assertEqual('float', column_view.native_kind)
+        self.assertEqual('test', column_view.name)
+        self.assertEqual(3, len(column_view))
+
+        # views are not recreated
+        self.assertIs(column_view, ColumnView.create(column_view,
+                                                     convert_to_str=True))
+
+        column_view = ColumnView.create(data, convert_to_str=True)
+        self.assertListEqual(['1.0', '2.5', 'nan'],
+                             column_view.series.tolist())
+
+        # strings are not native
+        column_view = ColumnView.create(data.apply(str))
+        self.assertIsNone(column_view.native_kind)
+        self.assertIsNone(column_view.native_series)
+
+    def test_float_and_int_parsing(self):
+        values = ['1', '1.0', '1.5', '-2e3', 'nan', 'inf', '1e400', 'a', '',
+                  ' 3 ', '0x1', '99999999999999999999', '1.0.0']
+        column_view = ColumnView(pd.Series(values))
+
+        # the masks match the python parsing of the values
+        np.testing.assert_array_equal(
+            [NumericStatsMixin.is_float(value) for value in values],
+            column_view.is_float)
+        np.testing.assert_array_equal(
+            [NumericStatsMixin.is_int(value) for value in values],
+            column_view.is_int)
+        np.testing.assert_array_equal(
+            [1., 1., 1.5, -2000., np.nan, np.inf, np.inf, np.nan, np.nan, 3.,
+             np.nan, 1e20, np.nan],
+            column_view.float_values)
+        pd.testing.assert_series_equal(
+            pd.Series([1.5]),
+            column_view.get_float_series(
+                column_view.is_float & ~column_view.is_int
+                & np.isfinite(column_view.float_values)))
+
+    def test_parse_floats(self):
+        values = ['1', '2.5', 'a', '1_000', '3', 'inf', None, '4', 'nan',
+                  '1e400', '0.1', '54.362499146542284']
+        expected_float_values = [1., 2.5, np.nan, 1000., 3., np.inf, np.nan,
+                                 4., np.nan, np.inf, 0.1, 54.362499146542284]
+        expected_is_float = [True, True, False, True, True, True, False,
+                             True, True, True, True, True]
+        # the values are parsed exactly as `float` parses them
+        column_view = ColumnView(pd.Series(values))
+        np.testing.assert_array_equal(expected_float_values,
+                                      column_view.float_values)
+        np.testing.assert_array_equal(expected_is_float,
+                                      column_view.is_float)
+
+        # values which can't be converted at once are parsed one at a time
+        column_view = ColumnView(
+            pd.Series([10 ** 400, 2, 'a', [1]], dtype=object))
+        np.testing.assert_array_equal([np.nan, 2., np.nan, np.nan],
+                                      column_view.float_values)
+        np.testing.assert_array_equal([False, True, False, False],
+                                      column_view.is_float)
+
+    def test_native_values(self):
+        self.assertEqual('int', ColumnView.get_native_kind(np.dtype('uint8')))
+        self.assertEqual('float',
+                         ColumnView.get_native_kind(np.dtype('float64')))
+        self.assertEqual('datetime',
+                         ColumnView.get_native_kind(np.dtype('datetime64[ns]')))
+        for dtype in [np.dtype('float32'), np.dtype(bool), np.dtype(object),
+                      pd.CategoricalDtype(), pd.DatetimeTZDtype(tz='UTC')]:
+            self.assertIsNone(ColumnView.get_native_kind(dtype))
+
+        # native values are parsed as their strings are, without the strings
+        values = [1, 2.5, -0.0, 1e20, np.inf, 123456789.123]
+        str_view = ColumnView(pd.Series(values).apply(str))
+        str_view.is_int
+        native_view = ColumnView(pd.Series(values))
+        for attr in ['float_values', 'is_float', 'is_int']:
+            np.testing.assert_array_equal(getattr(str_view, attr),
+                                          getattr(native_view, attr))
+        self.assertIsNone(native_view._series)
+        self.assertListEqual(str_view.series.tolist(),
+                             native_view.series.tolist())
+
+        # native datetimes are not floats
+        native_view = ColumnView(pd.Series(pd.to_datetime(['2013-03-05'])))
+        self.assertListEqual([False], native_view.is_float.tolist())
+        self.assertListEqual(['2013-03-05 00:00:00'],
+                             native_view.series.tolist())
+
+    def test_str_lengths(self):
+        column_view = ColumnView(pd.Series(['', 'a', 'abc']))
+        pd.testing.assert_series_equal(pd.Series([0, 1, 3]),
+                                       column_view.str_lengths)
+
+    def test_derived_forms_are_calculated_once(self):
+        column_view = ColumnView(pd.Series(['1', '2.5', 'a']))
+        with mock.patch.object(ColumnView, '_parse_floats',
+                               wraps=column_view._parse_floats) as parse_mock:
+            column_view.is_float
+            column_view.is_int
+            column_view.float_values
+            self.assertEqual(1, parse_mock.call_count)
+
+    def test_compiler_converts_to_str_once(self):
+        data = pd.Series([1, 2, 3], name='test')
+        with mock.patch.object(pd.Series, 'apply', autospec=True,
+                               side_effect=pd.Series.apply) as apply_mock:
+            compiler = ColumnPrimitiveTypeProfileCompiler(data)
+        str_calls = [call for call in apply_mock.call_args_list
+                     if call[0][1] is str]
+        self.assertEqual(1, len(str_calls))
+        self.assertEqual('int', compiler.profile['data_type'])
+
+
+if __name__ == '__main__':
+    unittest.main()
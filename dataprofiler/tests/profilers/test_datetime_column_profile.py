@@ -269,6 +269,135 @@ class TestDateTimeColumnProfiler(unittest.TestCase):
             expected = defaultdict(float, {'datetime': 2.0})
             self.assertEqual(expected, profiler.profile['times'])
 
+    def test_dates_are_parsed_as_strptime(self):
+        # dates outside of the bounds of pd.Timestamp, invalid days of the
+        # month and values which only pandas would parse as dates
+        data = pd.Series(['1500-01-02', '2013-02-30', '9999-12-31',
+                          '2013-03-05', '2013/03/05', '2013-03-05 1:2'])
+        profile = DateTimeColumn._get_datetime_profile(data)
+        self.assertEqual(3, profile['match_count'])
+        self.assertListEqual(['%Y-%m-%d'], profile['date_formats'])
+        self.assertEqual('1500-01-02', profile['min'])
+        self.assertEqual('9999-12-31', profile['max'])
+        self.assertEqual(datetime.datetime(1500, 1, 2), profile['min_obj'])
+        self.assertEqual(datetime.datetime(9999, 12, 31), profile['max_obj'])
+
+        # the regexes of the date formats match the values strptime parses
+        values = ['2013-03-05 1:02:03', '2013-3-5t01:02:03.5Z', '3/5/13 1:2',
+                  'MAR 05, 2013', 'march  5, 2013', '05mar13', ' 5', '1:2:3.4',
+                  '2013-03-05 24:00:00', 'Mar. 5, 2013', '20130305T0102O3']
+        for date_format in DateTimeColumn._date_formats:
+            regex = DateTimeColumn._get_date_format_regex(date_format)
+            for value in values:
+                self.assertEqual(
+                    not pd.isnull(DateTimeColumn._validate_datetime(
+                        value, date_format)),
+                    bool(regex.fullmatch(value)), (value, date_format))
+
+    def test_date_formats_are_checked_in_order(self):
+        # the format of each value is the first format which matches it, even
+        # if a sample of the values only matches a later format
+        data = pd.Series(['Mar 11, 2013'] + ['May 1, 2013'] * 3000)
+        profiler = DateTimeColumn(data.name)
+        profiler.update(data)
+        self.assertListEqual(['%b %d, %Y'], profiler.date_formats)
+        self.assertEqual(3001, profiler.match_count)
+
+    def test_caches_are_cleared_when_the_locale_changes(self):
+        DateTimeColumn._get_datetime_profile(pd.Series(['Mar 11, 2013']))
+        self.assertIn('%b %d, %Y', DateTimeColumn._date_format_regexes)
+        self.assertTrue(DateTimeColumn._shape_date_formats)
+
+        with mock.patch('locale.setlocale', return_value='other_locale'):
+            DateTimeColumn._get_datetime_profile(pd.Series([], dtype=object))
+        self.assertEqual('other_locale', DateTimeColumn._cache_locale)
+        self.assertDictEqual({}, DateTimeColumn._date_format_regexes)
+        self.assertDictEqual({}, DateTimeColumn._shape_date_formats)
+        DateTimeColumn._check_locale()
+
+    def test_shape_date_formats(self):
+        DateTimeColumn._shape_date_formats.clear()
+        self.assertSetEqual(
+            {'%Y-%m-%d'}, DateTimeColumn._get_shape_date_formats('dddd-dd-dd'))
+        self.assertSetEqual(
+            {'%b %d, %Y', '%B %d, %Y'},
+            DateTimeColumn._get_shape_date_formats('aaa  d, dddd'))
+        self.assertSetEqual(
+            set(), DateTimeColumn._get_shape_date_formats('aaaa aaaaa'))
+        # non-ascii characters can be unicode digits
+        self.assertSetEqual(
+            set(DateTimeColumn._date_formats),
+            DateTimeColumn._get_shape_date_formats('\u0662dd-dd-dd'))
+
+        # the date formats of a shape are memoized
+        with mock.patch.object(
+                DateTimeColumn, '_get_date_format_shape_regex') as regex_mock:
+            DateTimeColumn._get_shape_date_formats('dddd-dd-dd')
+        regex_mock.assert_not_called()
+
+        # the memo is cleared once it is full
+        with mock.patch.object(DateTimeColumn, '_max_shapes', 4):
+            DateTimeColumn._get_shape_date_formats('dd')
+        self.assertListEqual(['dd'],
+                             list(DateTimeColumn._shape_date_formats))
+
+    def test_shape_index(self):
+        data = pd.Series(['2013-03-05', 'Mar 5, 2013', 'text', '5'])
+        shape_index = DateTimeColumn._get_shape_index(
+            data, ['%Y-%m-%d', '%b %d, %Y', '%m%d%Y'])
+        np.testing.assert_array_equal([True, False, False, False],
+                                      shape_index['%Y-%m-%d'])
+        np.testing.assert_array_equal([False, True, False, False],
+                                      shape_index['%b %d, %Y'])
+        np.testing.assert_array_equal([False, False, False, False],
+                                      shape_index['%m%d%Y'])
+
+        # the values are classified by shape, hence only the date formats
+        # which can match a value are parsed
+        data = pd.Series(['2013-03-05', 'text', 'Mar 5, 2013', '03/05/2013'])
+        with mock.patch.object(DateTimeColumn, '_get_date_format_regex',
+                               wraps=DateTimeColumn._get_date_format_regex) \
+                as regex_mock:
+            profile = DateTimeColumn._get_datetime_profile(data)
+        self.assertEqual(3, profile['match_count'])
+        self.assertListEqual(
+            ['%Y-%m-%d', '%m/%d/%Y', '%b %d, %Y'],
+            [call[0][0] for call in regex_mock.call_args_list])
+
+    def test_non_date_column_is_rejected_after_sample(self):
+        data = pd.Series(['text {}'.format(i) for i in range(1000)])
+        profiler = DateTimeColumn(data.name)
+        with mock.patch.object(DateTimeColumn, '_get_datetime_profile',
+                               wraps=DateTimeColumn._get_datetime_profile) \
+                as profile_mock:
+            profiler.update(data)
+        self.assertEqual(1, profile_mock.call_count)
+        self.assertEqual(50, len(profile_mock.call_args[0][0]))
+        self.assertEqual(0, profiler.match_count)
+
+    def test_native_datetimes(self):
+        data = pd.Series(pd.to_datetime(
+            [datetime.datetime(2013, 3, 5, 15, 43, 30), None,
+             datetime.datetime(2012, 1, 31),
+             datetime.datetime(2014, 7, 1, 0, 0, 0, 500000),
+             datetime.datetime(2013, 12, 25)]))
+
+        # native datetimes are profiled as their strings are, without parsing
+        str_profiler = DateTimeColumn(data.name)
+        str_profiler.update(data.apply(str))
+        profiler = DateTimeColumn(data.name)
+        with mock.patch.object(DateTimeColumn, '_parse_dates') as parse_mock:
+            profiler.update(data)
+            parse_mock.assert_not_called()
+        self.assertEqual(3, profiler.match_count)
+        self.assertEqual(5, profiler.sample_size)
+        self.assertEqual('2012-01-31 00:00:00', profiler.min)
+        self.assertEqual('2013-12-25 00:00:00', profiler.max)
+        for attr in ['match_count', 'sample_size', 'date_formats', 'min',
+                     'max', '_dt_obj_min', '_dt_obj_max']:
+            self.assertEqual(getattr(str_profiler, attr),
+                             getattr(profiler, attr))
+
     def test_warning_for_bad_dates(self):
 
         df = pd.Series(['03/10/2013 15:43'])
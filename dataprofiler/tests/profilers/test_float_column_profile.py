@@ -8,6 +8,7 @@ import numpy as np
 
 from dataprofiler.profilers import FloatColumn
 from dataprofiler.profilers.profiler_options import FloatOptions
+from dataprofiler.tests.profilers import utils as test_utils
 
 
 test_root_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
@@ -74,6 +75,50 @@ class TestFloatColumn(unittest.TestCase):
         float_profiler.update(df_mix)
         self.assertEqual(5, float_profiler.precision)
 
+    def test_profiled_precision_stats(self):
+        df = pd.Series(['0.5', '-0.00120', '12', '1.5e-05', '0.0', 'nan',
+                        ' 3.50 ', '1e400'])
+        expected_decimal_places = [1, 5, 0, 5, 1, 0, 3, 0]
+        expected_significant_digits = [1, 3, 2, 2, 1, 3, 1]
+
+        # the values are parsed alike in chunks of any size
+        for chunk_size in [1, 3, 100]:
+            with mock.patch.object(FloatColumn, '_precision_chunk_size',
+                                   chunk_size):
+                precision_stats = FloatColumn._get_float_precision(df)
+            self.assertDictEqual(
+                dict(min=0, max=5, sum=sum(expected_decimal_places),
+                     sample_size=8),
+                precision_stats['decimal_places'])
+            self.assertDictEqual(
+                dict(min=1, max=3, sum=sum(expected_significant_digits),
+                     sample_size=7),
+                precision_stats['significant_digits'])
+
+        # non-ascii values are compared by their unicode code points
+        precision_stats = FloatColumn._get_float_precision(
+            pd.Series(['1.25', '\u00a03.5']))
+        self.assertEqual(2, precision_stats['decimal_places']['max'])
+        self.assertEqual(3, precision_stats['significant_digits']['max'])
+
+        profiler = FloatColumn(df.name)
+        profiler.update(df)
+        self.assertEqual(5, profiler.precision)
+        self.assertDictEqual(
+            {'decimal_places': dict(min=0, max=5, mean=15/8),
+             'significant_digits': dict(min=1, max=3, mean=13/7)},
+            profiler.profile['precision_stats'])
+
+        # the precision stats are merged
+        profiler2 = FloatColumn(df.name)
+        profiler2.update(pd.Series(['1.1234567']))
+        merged_profile = profiler + profiler2
+        self.assertEqual(7, merged_profile.precision)
+        self.assertDictEqual(
+            {'decimal_places': dict(min=0, max=7, mean=22/9),
+             'significant_digits': dict(min=1, max=8, mean=21/8)},
+            merged_profile.profile['precision_stats'])
+
     def test_profiled_min(self):
         # test with multiple values
         data = np.linspace(-5, 5, 11)
@@ -229,6 +274,66 @@ class TestFloatColumn(unittest.TestCase):
         self.assertEqual(variance, num_profiler.variance)
         self.assertEqual(np.sqrt(variance), num_profiler.stddev)
 
+    def test_skewness_and_kurtosis(self):
+        # too few values
+        profiler = FloatColumn('test')
+        profiler.update(pd.Series(['1.5', '2.5']))
+        self.assertTrue(np.isnan(profiler.skewness))
+        self.assertTrue(np.isnan(profiler.kurtosis))
+
+        # constant values
+        profiler = FloatColumn('test')
+        profiler.update(pd.Series(['1.5'] * 5))
+        self.assertEqual(0, profiler.skewness)
+        self.assertEqual(0, profiler.kurtosis)
+
+        # chunked updates and merges match pandas
+        data = np.random.RandomState(0).exponential(3, size=500).round(4)
+        df = pd.Series(data)
+        profiler1 = FloatColumn('test')
+        for chunk in np.array_split(data[:300], 7):
+            profiler1.update(pd.Series(chunk).apply(str))
+        self.assertAlmostEqual(df[:300].skew(), profiler1.skewness)
+        self.assertAlmostEqual(df[:300].kurt(), profiler1.kurtosis)
+
+        profiler2 = FloatColumn('test')
+        profiler2.update(pd.Series(data[300:]).apply(str))
+        profiler3 = profiler1 + profiler2
+        self.assertAlmostEqual(df.skew(), profiler3.skewness)
+        self.assertAlmostEqual(df.kurt(), profiler3.kurtosis)
+
+        # disabled with the variance
+        options = FloatOptions()
+        options.variance.is_enabled = False
+        profiler = FloatColumn('test', options=options)
+        profiler.update(df.apply(str))
+        self.assertTrue(np.isnan(profiler.skewness))
+        self.assertTrue(np.isnan(profiler.kurtosis))
+
+    def test_stats_exclude_nan_values(self):
+        # "nan" matches a float, but the stats are reduced without it
+        data = pd.Series(['1', 'nan', '3', '4', '9', 'nan'])
+        values = pd.Series([1., 3., 4., 9.])
+        profiler = FloatColumn('test')
+        profiler.update(data[:3])
+        profiler.update(data[3:])
+        self.assertEqual(6, profiler.match_count)
+        self.assertEqual(values.mean(), profiler.mean)
+        self.assertAlmostEqual(values.var(), profiler.variance)
+        self.assertAlmostEqual(values.skew(), profiler.skewness)
+        self.assertAlmostEqual(values.kurt(), profiler.kurtosis)
+
+        # merged profiles are weighted by the number of reduced values
+        profiler1 = FloatColumn('test')
+        profiler1.update(data[:3])
+        profiler2 = FloatColumn('test')
+        profiler2.update(data[3:])
+        profiler3 = profiler1 + profiler2
+        self.assertEqual(values.mean(), profiler3.mean)
+        self.assertAlmostEqual(values.var(), profiler3.variance)
+        self.assertAlmostEqual(values.skew(), profiler3.skewness)
+        self.assertAlmostEqual(values.kurt(), profiler3.kurtosis)
+
     def test_null_values_for_histogram(self):
         data = pd.Series(['-inf', 'inf'])
         profiler = FloatColumn(data.name)
@@ -350,6 +455,122 @@ class TestFloatColumn(unittest.TestCase):
         num_bins = len(profiler2.profile['histogram']['bin_counts'])
         self.assertEqual(num_bins, 10000)
 
+    def test_get_histogram(self):
+        profiler = FloatColumn("Float")
+        rng = np.random.RandomState(0)
+        values = np.concatenate([rng.lognormal(size=1000), [0., 5., 5.]])
+
+        # the histogram of each method matches np.histogram
+        for method in profiler.histogram_bin_method_names:
+            bin_counts, bin_edges = profiler._get_histogram(values, method)
+            expected_counts, expected_edges = np.histogram(
+                values, bins=len(bin_counts))
+            np.testing.assert_array_equal(expected_counts, bin_counts)
+            np.testing.assert_array_equal(expected_edges, bin_edges)
+        np.testing.assert_array_equal(
+            np.histogram_bin_edges(values, bins='fd'),
+            profiler._get_histogram(values, 'fd')[1])
+
+        # a single unique value is a single bin of zero width
+        bin_counts, bin_edges = profiler._get_histogram(
+            np.array([2., 2.]), 'auto')
+        np.testing.assert_array_equal([2], bin_counts)
+        np.testing.assert_array_equal([2., 2.], bin_edges)
+
+    def test_freeze_histogram_selection(self):
+        options = FloatOptions()
+        options.freeze_histogram_selection.is_enabled = True
+        profiler = FloatColumn("Float", options=options)
+        df = pd.Series(np.random.RandomState(0).normal(size=100)).apply(str)
+        for _ in range(profiler._histogram_freeze_updates + 1):
+            profiler.update(df)
+        self.assertTrue(profiler._is_histogram_selection_frozen())
+        selected_method = profiler.histogram_selection
+        total_losses = {
+            method: profiler.histogram_methods[method]['total_loss']
+            for method in profiler.histogram_bin_method_names}
+
+        # once frozen, the histograms are updated without their losses
+        with mock.patch.object(FloatColumn, '_total_histogram_bin_variance') \
+                as mock_variance:
+            profiler.update(df)
+            mock_variance.assert_not_called()
+        self.assertEqual(selected_method, profiler.histogram_selection)
+        self.assertDictEqual(total_losses, {
+            method: profiler.histogram_methods[method]['total_loss']
+            for method in profiler.histogram_bin_method_names})
+        for method in profiler.histogram_bin_method_names:
+            self.assertEqual(500, profiler.histogram_methods[method][
+                'histogram']['bin_counts'].sum())
+            self.assertIn('histogram_method_{}'.format(method),
+                          profiler.times)
+
+        # the selection is never frozen when disabled
+        profiler = FloatColumn("Float")
+        for _ in range(profiler._histogram_freeze_updates + 1):
+            profiler.update(df)
+        self.assertFalse(profiler._is_histogram_selection_frozen())
+
+    def test_merge_frozen_histogram_selection(self):
+        options = FloatOptions()
+        options.freeze_histogram_selection.is_enabled = True
+        df = pd.Series(np.random.RandomState(0).normal(size=100)).apply(str)
+        profiler1 = FloatColumn("Float", options=options)
+        profiler2 = FloatColumn("Float", options=options)
+        for _ in range(profiler1._histogram_freeze_updates + 1):
+            profiler1.update(df)
+            profiler2.update(df)
+        self.assertTrue(profiler1._is_histogram_selection_frozen())
+        self.assertTrue(profiler2._is_histogram_selection_frozen())
+        self.assertEqual(profiler1.histogram_selection,
+                         profiler2.histogram_selection)
+
+        # the merge of two profiles which froze the same method is frozen
+        merged_profile = profiler1 + profiler2
+        self.assertTrue(merged_profile._is_histogram_selection_frozen())
+        self.assertEqual(profiler1.histogram_selection,
+                         merged_profile.histogram_selection)
+        with mock.patch.object(FloatColumn, '_total_histogram_bin_variance') \
+                as mock_variance:
+            merged_profile.update(df)
+            mock_variance.assert_not_called()
+
+        # the merge is not frozen unless both profiles are frozen
+        profiler3 = FloatColumn("Float", options=options)
+        profiler3.update(df)
+        self.assertFalse(profiler3._is_histogram_selection_frozen())
+        merged_profile = profiler1 + profiler3
+        self.assertFalse(merged_profile._is_histogram_selection_frozen())
+
+        # the merge with a profile without histograms keeps the freeze
+        merged_profile = profiler1 + FloatColumn("Float", options=options)
+        self.assertTrue(merged_profile._is_histogram_selection_frozen())
+
+    def test_histogram_run_time_excludes_loss(self):
+        profiler = FloatColumn("Float")
+        df = pd.Series(np.random.RandomState(0).normal(size=100))
+
+        # the clock only advances while the losses are calculated, hence the
+        # run time of binning, on which the selection is based, is zero
+        clock = [0.0]
+
+        def total_bin_variance(*args, **kwargs):
+            clock[0] += 1.0
+            return 0.0
+
+        with mock.patch('time.time', side_effect=lambda: clock[0]), \
+                mock.patch.object(FloatColumn, '_total_histogram_bin_variance',
+                                  side_effect=total_bin_variance), \
+                mock.patch.object(FloatColumn, '_select_method_for_histogram',
+                                  return_value='auto') as mock_select:
+            profiler._update_histogram(df)
+        run_times = mock_select.call_args[0][3]
+        np.testing.assert_array_equal(
+            np.zeros(len(profiler.histogram_bin_method_names)), run_times)
+        for method in profiler.histogram_bin_method_names:
+            self.assertEqual(
+                0, profiler.times['histogram_method_{}'.format(method)])
+
     def test_estimate_stats_from_histogram(self):
         data = pd.Series([], dtype=object)
         profiler = FloatColumn(data.name)
@@ -451,9 +672,41 @@ class TestFloatColumn(unittest.TestCase):
             np.array([3, 2, 1])
         profiler.histogram_methods['auto']['histogram']['bin_edges'] = \
             np.array([1.0, 3.0, 5.0, 7.0])
-        array_from_histogram = profiler._histogram_to_array('auto')
-        expected_array = [1.0, 1.0, 1.0, 3.0, 3.0, 7.0]
-        self.assertCountEqual(array_from_histogram, expected_array)
+
+        # the histogram is merged by its counts instead of being expanded to
+        # an array of values, hence histograms with the same bins add up
+        profiler._merge_histogram(np.array([3, 2, 1]),
+                                  np.array([1.0, 3.0, 5.0, 7.0]), 'auto')
+        histogram = profiler.histogram_methods['auto']['histogram']
+        np.testing.assert_array_equal([6, 4, 2], histogram['bin_counts'])
+        np.testing.assert_array_equal([1.0, 3.0, 5.0, 7.0],
+                                      histogram['bin_edges'])
+
+    def test_rebin_histogram(self):
+        bin_counts = np.array([3, 2, 1])
+        bin_edges = np.array([1.0, 3.0, 5.0, 7.0])
+
+        # the bins are split in proportion to their overlap with the new bins
+        np.testing.assert_array_equal(
+            [4, 2],
+            FloatColumn._rebin_histogram(bin_counts, bin_edges,
+                                         np.array([1.0, 4.0, 7.0])))
+        np.testing.assert_array_equal(
+            [0, 3, 2, 1, 0],
+            FloatColumn._rebin_histogram(bin_counts, bin_edges,
+                                         np.array([-1., 1., 3., 5., 7., 9.])))
+
+        # the total count is conserved by the largest remainders
+        new_bin_edges = np.linspace(1.0, 7.0, 8)
+        new_bin_counts = FloatColumn._rebin_histogram(
+            bin_counts, bin_edges, new_bin_edges)
+        self.assertEqual(6, new_bin_counts.sum())
+        np.testing.assert_array_equal([1, 1, 1, 1, 1, 1, 0], new_bin_counts)
+
+        # the values of a single valued histogram are kept in their bin
+        np.testing.assert_array_equal(
+            [0, 4], FloatColumn._rebin_histogram(
+                [4], np.array([7.0, 7.0]), np.array([1.0, 4.0, 7.0])))
 
     def test_merge_histogram(self):
         data = pd.Series([], dtype=object)
@@ -463,18 +716,28 @@ class TestFloatColumn(unittest.TestCase):
             np.array([3, 2])
         profiler.histogram_methods['sqrt']['histogram']['bin_edges'] = \
             np.array([1.0, 3.0, 5.0])
-        input_array = [0.5, 1.0, 2.0, 5.0]
+        bin_counts, bin_edges = profiler._get_histogram(
+            np.array([0.5, 1.0, 2.0, 5.0]), 'sqrt')
 
-        profiler._merge_histogram(input_array, 'sqrt')
+        profiler._merge_histogram(bin_counts, bin_edges, 'sqrt')
         merged_bin_counts = \
             profiler.histogram_methods['sqrt']['histogram']['bin_counts']
         merged_bin_edges = \
             profiler.histogram_methods['sqrt']['histogram']['bin_edges']
         expected_bin_counts, expected_bin_edges = \
-            [5, 2, 2], [0.5, 2.0, 3.5, 5.0]
+            [6, 3], [0.5, 2.75, 5.0]
         self.assertCountEqual(merged_bin_counts, expected_bin_counts)
         self.assertCountEqual(merged_bin_edges, expected_bin_edges)
 
+        # the size of the histogram and the cost of merging are bounded by the
+        # number of bins rather than the number of values
+        bin_counts = np.array([10 ** 9, 10 ** 9])
+        profiler._merge_histogram(bin_counts, bin_edges, 'sqrt')
+        merged_bin_counts = \
+            profiler.histogram_methods['sqrt']['histogram']['bin_counts']
+        self.assertEqual(2, len(merged_bin_counts))
+        self.assertEqual(2 * 10 ** 9 + 9, merged_bin_counts.sum())
+
     def test_profiled_quantiles(self):
         """
         Checks the quantiles of profiled numerical columns.
@@ -490,7 +753,9 @@ class TestFloatColumn(unittest.TestCase):
         profiler.update(df)
         profile = profiler.profile
 
+        # the quantiles are calculated lazily, once accessed
         est_quartiles = profile['quantiles']
+        self.assertIs(est_quartiles, profiler.quantiles)
         est_Q1 = est_quartiles[249]
         est_Q2 = est_quartiles[499]
         est_Q3 = est_quartiles[749]
@@ -516,6 +781,45 @@ class TestFloatColumn(unittest.TestCase):
         profiler.update(df)
         self.assertEqual(profiler.data_type_ratio, 0.8)
 
+    def test_get_percentiles(self):
+        profiler = FloatColumn("Float")
+        self.assertListEqual([None, None], profiler._get_percentiles([25, 50]))
+
+        # an even number of edges takes the middle of the bins
+        profiler.histogram_selection = 'auto'
+        profiler.histogram_methods['auto']['histogram'] = {
+            'bin_counts': np.array([1, 1, 2]),
+            'bin_edges': np.array([0., 1., 2., 3.])}
+        self.assertListEqual(
+            [0.5, 0.5, 1.5, 1.5, 3.],
+            profiler._get_percentiles([25, 30, 50, 60, 100]))
+
+        # an odd number of edges takes the edges of the bins
+        profiler.histogram_methods['auto']['histogram'] = {
+            'bin_counts': np.array([1, 1]),
+            'bin_edges': np.array([0., 1., 2.])}
+        self.assertListEqual(
+            [0.5, 1., 1., 2.], profiler._get_percentiles([25, 50, 75, 100]))
+
+    def test_lazy_quantiles(self):
+        profiler = FloatColumn("Float")
+        profiler.update(pd.Series(['1.5', '2.5', '3.5']))
+        self.assertIsNone(profiler._quantiles)
+
+        # the quantiles are calculated once accessed and cached until the
+        # next update
+        with mock.patch.object(FloatColumn, '_get_percentiles',
+                               wraps=profiler._get_percentiles) as mock_get:
+            quantiles = profiler.quantiles
+            self.assertIs(quantiles, profiler.quantiles)
+            self.assertEqual(1, mock_get.call_count)
+        self.assertEqual(1000, len(quantiles))
+        self.assertIsNone(quantiles[999])
+
+        profiler.update(pd.Series(['10.5']))
+        self.assertIsNone(profiler._quantiles)
+        self.assertGreater(profiler.quantiles[998], quantiles[998])
+
     def test_profile(self):
         data = [2.5, 12.5, 'not a float', 5, 'not a float']
         df = pd.Series(data).apply(str)
@@ -529,6 +833,8 @@ class TestFloatColumn(unittest.TestCase):
             median=None,
             variance=27 + 1/12.0,
             stddev=np.sqrt(27+1/12.0),
+            skewness=35/13*np.sqrt(3/13),
+            kurtosis=np.nan,
             histogram={
                 'bin_counts': np.array([1, 1, 0, 1]),
                 'bin_edges': np.array([2.5, 5.0, 7.5, 10.0, 12.5]),
@@ -539,10 +845,17 @@ class TestFloatColumn(unittest.TestCase):
                 2: 10.0
             },
             times=defaultdict(float, {'histogram_and_quantiles': 15.0,\
-                                      'precision': 1.0, 'max': 1.0, 'min': 1.0,\
-                                      'sum': 1.0, 'variance': 1.0}),
-            precision=1.0
+                                      'precision': 1.0,\
+                                      'min': 0.25, 'max': 0.25, 'sum': 0.25,\
+                                      'variance': 0.25}),
+            precision=1.0,
+            precision_stats={
+                'decimal_places': dict(min=0, max=1, mean=2/3.0),
+                'significant_digits': dict(min=1, max=3, mean=2.0),
+            }
         )
+        expected_profile['times'].update(
+            test_utils.get_histogram_method_times(1.0))
         time_array = [float(i) for i in range(100, 0, -1)]
         with mock.patch('time.time', side_effect=lambda: time_array.pop()):
             # Validate that the times dictionary is empty
@@ -557,6 +870,8 @@ class TestFloatColumn(unittest.TestCase):
             quantiles = profile.pop('quantiles')
             expected_quantiles = expected_profile.pop('quantiles')
             actual_quartiles = {0: quantiles[249], 1: quantiles[499], 2: quantiles[749]}
+            self.assertAlmostEqual(expected_profile.pop('skewness'),
+                                   profile.pop('skewness'))
 
             self.assertDictEqual(expected_profile, profile)
             self.assertEqual(expected_profile['precision'], 1.0)
@@ -569,9 +884,10 @@ class TestFloatColumn(unittest.TestCase):
 
             # Validate time in datetime class has expected time after second update
             profiler.update(df)
-            expected = defaultdict(float, {'min': 2.0, 'max': 2.0, 'sum': 2.0,\
-                                           'variance': 2.0, 'precision': 2.0,\
+            expected = defaultdict(float, {'min': 0.5, 'max': 0.5, 'sum': 0.5, 'variance': 0.5,\
+                                           'precision': 2.0,\
                                            'histogram_and_quantiles': 30.0})
+            expected.update(test_utils.get_histogram_method_times(2.0))
             self.assertEqual(expected, profiler.profile['times'])
 
     def test_option_timing(self):
@@ -592,16 +908,18 @@ class TestFloatColumn(unittest.TestCase):
             # Validate the time in the datetime class has the expected time.
             profile = profiler.profile
 
-            expected = defaultdict(float, {'max': 1.0, 'sum': 1.0,\
-                                           'variance': 1.0, 'precision': 1.0,\
+            expected = defaultdict(float, {'max': 1/3, 'sum': 1/3, 'variance': 1/3,\
+                                           'precision': 1.0,\
                                            'histogram_and_quantiles': 15.0})
+            expected.update(test_utils.get_histogram_method_times(1.0))
             self.assertEqual(expected, profile['times'])
 
             # Validate time in datetime class has expected time after second update
             profiler.update(df)
-            expected = defaultdict(float, {'max': 2.0, 'sum': 2.0,\
-                                           'variance': 2.0, 'precision': 2.0,\
+            expected = defaultdict(float, {'max': 2/3, 'sum': 2/3, 'variance': 2/3,\
+                                           'precision': 2.0,\
                                            'histogram_and_quantiles': 30.0})
+            expected.update(test_utils.get_histogram_method_times(2.0))
             self.assertEqual(expected, profiler.profile['times'])
 
     def test_profile_merge(self):
@@ -621,9 +939,10 @@ class TestFloatColumn(unittest.TestCase):
             mean=8.25,
             variance=30.916666666666668,
             stddev=np.sqrt(30.916),
+            # the counts of the histograms are rebinned
             histogram={
-                'bin_counts': np.array([1, 1, 1, 1]),
-                'bin_edges': np.array([2.,5.25,8.5,11.75,15.])
+                'bin_counts': np.array([2, 0, 2]),
+                'bin_edges': np.linspace(2., 15., 4)
             },
         )
 
@@ -652,6 +971,7 @@ class TestFloatColumn(unittest.TestCase):
         profiler1 = FloatColumn("Float")
         profiler1.update(df)
         profiler1.match_count = 0
+        profiler1._stats_count = 0
 
         data2 = [10.0, 'not a float', 15.0, 'not a float']
         df2 = pd.Series(data2).apply(str)
@@ -697,6 +1017,7 @@ class TestFloatColumn(unittest.TestCase):
         profiler1 = FloatColumn("Float")
         profiler1.update(df)
         profiler1.match_count = 0
+        profiler1._stats_count = 0
 
         data2 = [10.0, 'not a float', 15.0, 'not a float']
         df2 = pd.Series(data2).apply(str)
@@ -711,3 +1032,69 @@ class TestFloatColumn(unittest.TestCase):
                                     'Profiles have no overlapping bin methods '
                                     'and therefore cannot be added together.'):
             profiler1 + profiler2
+
+    def test_early_elimination(self):
+        options = FloatOptions()
+        options.early_elimination.is_enabled = True
+        profiler = FloatColumn("Float", options=options)
+        profiler.update(pd.Series(['1.5', '2.5']))
+        self.assertEqual(2.0, profiler.mean)
+        self.assertEqual(1, profiler.precision)
+        self.assertListEqual([], profiler._skipped_stats)
+
+        # once a value is not a float, only the counts are updated
+        with mock.patch.object(FloatColumn, '_update_helper') as update_mock:
+            profiler.update(pd.Series(['a', '3.25']))
+            profiler.update(pd.Series(['4.5']))
+            update_mock.assert_not_called()
+        self.assertEqual(4, profiler.match_count)
+        self.assertEqual(5, profiler.sample_size)
+        self.assertIsNone(profiler.min)
+        self.assertEqual(0, profiler.sum)
+        self.assertEqual(0, profiler.precision)
+        self.assertListEqual(['min', 'max', 'sum', 'variance',
+                              'histogram_and_quantiles', 'precision'],
+                             profiler._skipped_stats)
+
+        # the elimination persists when merged
+        profiler2 = FloatColumn("Float")
+        profiler2.update(pd.Series(['1.5']))
+        merged_profile = profiler + profiler2
+        self.assertListEqual(profiler._skipped_stats,
+                             merged_profile._skipped_stats)
+
+        # the stats are calculated when disabled
+        profiler = FloatColumn("Float")
+        profiler.update(pd.Series(['1.5', 'a', '2.5']))
+        self.assertEqual(2.0, profiler.mean)
+        self.assertListEqual([], profiler._skipped_stats)
+
+    def test_quantile_sketch(self):
+        options = FloatOptions()
+        options.quantile_sketch.is_enabled = True
+        options.quantile_sketch.error_rate = 0.01
+        rng = np.random.RandomState(0)
+        values = rng.lognormal(size=20000)
+
+        profiler = FloatColumn("Float", options=options)
+        profiler.update(pd.Series(values[:5000]).apply(str))
+        profiler2 = FloatColumn("Float", options=options)
+        profiler2.update(pd.Series(values[5000:]).apply(str))
+        merged_profile = profiler + profiler2
+        self.assertEqual(20000, merged_profile._quantile_sketch.count)
+
+        # the quantiles are estimated from the sketch within its error rate
+        quantiles = merged_profile.profile['quantiles']
+        estimates = np.array([quantiles[i] for i in range(999)])
+        ranks = np.searchsorted(np.sort(values), estimates) / len(values)
+        self.assertLessEqual(
+            np.abs(ranks - np.arange(1, 1000) / 1000).max(), 0.015)
+        self.assertIsNone(quantiles[999])
+
+        # profiles without a sketch estimate the quantiles from the histogram
+        profiler = FloatColumn("Float")
+        profiler.update(pd.Series(['1.5', '2.5']))
+        self.assertIsNone(profiler._quantile_sketch)
+        merged_profile = profiler2 + profiler
+        self.assertIsNone(merged_profile._quantile_sketch)
+        self.assertIsNotNone(merged_profile.quantiles[0])
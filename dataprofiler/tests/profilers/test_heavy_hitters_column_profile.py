@@ -0,0 +1,81 @@
+import unittest
+from unittest import mock
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from dataprofiler.profilers import HeavyHittersColumn
+from dataprofiler.profilers.profiler_options import HeavyHittersOptions
+
+
+class TestHeavyHittersColumn(unittest.TestCase):
+
+    def test_base_case(self):
+        data = pd.Series([], dtype=object)
+        profiler = HeavyHittersColumn(data.name)
+        profiler.update(data)
+
+        self.assertEqual(profiler.sample_size, 0)
+        self.assertDictEqual({}, profiler.heavy_hitters)
+
+    def test_profile(self):
+        data = pd.Series(["b", "a", "b", "c", "b", "a", "d"])
+        profiler = HeavyHittersColumn(data.name)
+
+        time_array = [float(i) for i in range(4, 0, -1)]
+        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+            profiler.update(data)
+            expected_profile = dict(
+                statistics=dict(heavy_hitters={"b": 3, "a": 2, "c": 1,
+                                               "d": 1}),
+                times=defaultdict(float, {'heavy_hitters': 1.0})
+            )
+            self.assertDictEqual(expected_profile, profiler.profile)
+
+            profiler.update(data)
+            self.assertDictEqual({"b": 6, "a": 4, "c": 2, "d": 2},
+                                 profiler.heavy_hitters)
+            self.assertEqual(14, profiler.sample_size)
+            self.assertDictEqual(defaultdict(float, {'heavy_hitters': 2.0}),
+                                 profiler.profile["times"])
+
+    def test_options(self):
+        options = HeavyHittersOptions(top_k=2, num_counters=10)
+        data = pd.Series((np.arange(1000) % 50 // 10).astype(str))
+        data = pd.concat([pd.Series(["4"] * 100), data])
+        profiler = HeavyHittersColumn(data.name, options=options)
+        profiler.update(data)
+        self.assertEqual(2, profiler.top_k)
+        self.assertListEqual(["4", "0"], list(profiler.heavy_hitters))
+
+        options.is_enabled = False
+        profiler = HeavyHittersColumn(data.name, options=options)
+        profiler.update(data)
+        self.assertDictEqual({}, profiler.heavy_hitters)
+        self.assertEqual(1100, profiler.sample_size)
+
+    def test_profile_merge(self):
+        options = HeavyHittersOptions(top_k=3, num_counters=20)
+        rng = np.random.RandomState(0)
+        data = pd.Series(rng.zipf(1.5, size=10000) % 500).astype(str)
+
+        profiler1 = HeavyHittersColumn("test", options=options)
+        profiler1.update(data[:3000])
+        profiler2 = HeavyHittersColumn("test", options=options)
+        profiler2.update(data[3000:])
+        profiler3 = profiler1 + profiler2
+
+        self.assertEqual(10000, profiler3.sample_size)
+        self.assertEqual(3, profiler3.top_k)
+        true_counts = data.value_counts()
+        self.assertListEqual(true_counts.index[:3].tolist(),
+                             list(profiler3.heavy_hitters))
+        for value, count in profiler3.heavy_hitters.items():
+            self.assertLessEqual(count, true_counts[value])
+            self.assertGreaterEqual(count + 10000 / 21, true_counts[value])
+
+        with self.assertRaisesRegex(TypeError,
+                                    "Unsupported operand type\\(s\\) for \\+: "
+                                    "'HeavyHittersColumn' and 'int'"):
+            profiler1 + 3
@@ -8,6 +8,7 @@ import numpy as np
 
 from dataprofiler.profilers import IntColumn
 from dataprofiler.profilers.profiler_options import IntOptions
+from dataprofiler.tests.profilers import utils as test_utils
 
 
 test_root_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
@@ -273,6 +274,8 @@ class TestIntColumn(unittest.TestCase):
             median=None,
             variance=8.0,
             stddev=np.sqrt(8.0),
+            skewness=np.nan,
+            kurtosis=np.nan,
             histogram={
                 'bin_counts': np.array([1, 0, 1]),
                 'bin_edges': np.array([2.0, 10.0/3.0, 14.0/3.0, 6.0])
@@ -283,10 +286,12 @@ class TestIntColumn(unittest.TestCase):
                 2: 4.0
             },
             times=defaultdict(
-                float, {'histogram_and_quantiles': 15.0, 'max': 1.0, 'min': 1.0,
-                        'sum': 1.0, 'variance': 1.0})
+                float, {'histogram_and_quantiles': 15.0, 'max': 0.25, 'min': 0.25,
+                        'sum': 0.25, 'variance': 0.25})
             
         )
+        expected_profile['times'].update(
+            test_utils.get_histogram_method_times(1.0))
         time_array = [float(i) for i in range(100, 0, -1)]
         with mock.patch('time.time', side_effect=lambda: time_array.pop()):
             # Validate that the times dictionary is empty
@@ -315,14 +320,16 @@ class TestIntColumn(unittest.TestCase):
             self.assertEqual(round(expected_quartiles[2], 12),
                              round(quartiles[724], 12))
 
-            expected = defaultdict(float, {'min': 1.0, 'max': 1.0, 'sum': 1.0, 'variance': 1.0, \
+            expected = defaultdict(float, {'min': 0.25, 'max': 0.25, 'sum': 0.25, 'variance': 0.25, \
                                            'histogram_and_quantiles': 15.0})
+            expected.update(test_utils.get_histogram_method_times(1.0))
             self.assertEqual(expected, profile['times'])
 
             # Validate time in datetime class has expected time after second update
             profiler.update(df)
-            expected = defaultdict(float, {'min': 2.0, 'max': 2.0, 'sum': 2.0, 'variance': 2.0, \
+            expected = defaultdict(float, {'min': 0.5, 'max': 0.5, 'sum': 0.5, 'variance': 0.5, \
                                            'histogram_and_quantiles': 30.0})
+            expected.update(test_utils.get_histogram_method_times(2.0))
             self.assertEqual(expected, profiler.profile['times'])
 
     def test_option_timing(self):
@@ -343,16 +350,26 @@ class TestIntColumn(unittest.TestCase):
             # Validate the time in the datetime class has the expected time.
             profile = profiler.profile
 
-            expected = defaultdict(float, {'max': 1.0, 'sum': 1.0, 'variance': 1.0, \
+            expected = defaultdict(float, {'max': 1/3, 'sum': 1/3, 'variance': 1/3, \
                                            'histogram_and_quantiles': 15.0})
+            expected.update(test_utils.get_histogram_method_times(1.0))
             self.assertEqual(expected, profile['times'])
 
             # Validate time in datetime class has expected time after second update
             profiler.update(df)
-            expected = defaultdict(float, {'max': 2.0, 'sum': 2.0, 'variance': 2.0, \
+            expected = defaultdict(float, {'max': 2/3, 'sum': 2/3, 'variance': 2/3, \
                                            'histogram_and_quantiles': 30.0})
+            expected.update(test_utils.get_histogram_method_times(2.0))
             self.assertEqual(expected, profiler.profile['times'])
 
+        # the stats which are disabled are not timed
+        options.set({"max.is_enabled": False, "sum.is_enabled": False,
+                     "variance.is_enabled": False})
+        profiler = IntColumn(df.name, options=options)
+        profiler.update(df)
+        for stat in ['min', 'max', 'sum', 'variance']:
+            self.assertNotIn(stat, profiler.profile['times'])
+
     def test_profile_merge(self):
         data = [2.0, 12.5, 'not an int', 6.0, 'not an int']
         df = pd.Series(data).apply(str)
@@ -370,9 +387,10 @@ class TestIntColumn(unittest.TestCase):
             mean=8.25,
             variance=30.916666666666668,
             stddev=np.sqrt(30.916),
+            # the counts of the histograms are rebinned
             histogram={
-                'bin_counts': np.array([1, 1, 1, 1]),
-                'bin_edges': np.array([2.,5.25,8.5,11.75,15.])
+                'bin_counts': np.array([2, 0, 2]),
+                'bin_edges': np.linspace(2., 15., 4)
             },
         )
 
@@ -401,6 +419,7 @@ class TestIntColumn(unittest.TestCase):
         profiler1 = IntColumn(name="Int")
         profiler1.update(df)
         profiler1.match_count = 0
+        profiler1._stats_count = 0
 
         data2 = [10.0, 3.5, 'not a float', 15.0, 'not a float']
         df2 = pd.Series(data2).apply(str)
@@ -447,6 +466,7 @@ class TestIntColumn(unittest.TestCase):
         profiler1 = IntColumn("Int")
         profiler1.update(df)
         profiler1.match_count = 0
+        profiler1._stats_count = 0
 
         data2 = [10, 'not an int', 15, 'not an int']
         df2 = pd.Series(data2).apply(str)
@@ -473,6 +493,7 @@ class TestIntColumn(unittest.TestCase):
         profiler1 = IntColumn("Int", options=options)
         profiler1.update(df)
         profiler1.match_count = 0
+        profiler1._stats_count = 0
 
         # Creating second profiler with separate options
         options = IntOptions()
@@ -496,3 +517,23 @@ class TestIntColumn(unittest.TestCase):
         # Assert that these features are not calculated
         self.assertIsNone(profiler3.max)
         self.assertIsNone(profiler3.min)
+
+    def test_early_elimination(self):
+        options = IntOptions()
+        options.early_elimination.is_enabled = True
+        profiler = IntColumn("Int", options=options)
+        profiler.update(pd.Series(['1', '3']))
+        self.assertEqual(2, profiler.mean)
+        self.assertListEqual([], profiler._skipped_stats)
+
+        # once a value is not an int, only the counts are updated
+        with mock.patch.object(IntColumn, '_update_helper') as update_mock:
+            profiler.update(pd.Series(['1.5', '5']))
+            update_mock.assert_not_called()
+        self.assertEqual(3, profiler.match_count)
+        self.assertEqual(4, profiler.sample_size)
+        self.assertIsNone(profiler.max)
+        self.assertEqual(0, profiler.mean)
+        self.assertListEqual(['min', 'max', 'sum', 'variance',
+                              'histogram_and_quantiles'],
+                             profiler._skipped_stats)
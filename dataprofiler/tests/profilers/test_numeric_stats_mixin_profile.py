@@ -7,6 +7,7 @@ import pandas as pd
 import numpy as np
 
 from dataprofiler.profilers import NumericStatsMixin
+from dataprofiler.tests.profilers import utils as test_utils
 
 
 test_root_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
@@ -77,7 +78,7 @@ class TestNumericStatsMixin(unittest.TestCase):
         num_profiler.variance = num_profiler._update_variance(
             mean1, var1, count1)
         self.assertEqual(var1, num_profiler.variance)
-        num_profiler.match_count = count1
+        num_profiler._stats_count = count1
         num_profiler.sum = sum(data1)
 
         # test streaming update variance with new data
@@ -147,7 +148,7 @@ class TestNumericStatsMixin(unittest.TestCase):
         num_profiler.variance = num_profiler._update_variance(
             mean1, var1, count1)
         self.assertEqual(var1, num_profiler.variance)
-        num_profiler.match_count = count1
+        num_profiler._stats_count = count1
         num_profiler.sum = sum(data1)
 
         # test adding data which would not have anything
@@ -213,40 +214,53 @@ class TestNumericStatsMixin(unittest.TestCase):
             # Validate that the times dictionary is empty
             self.assertEqual(defaultdict(float), num_profiler.times)
 
-            # Validate _get_min is timed.
-            expected = defaultdict(float, {'min': 1.0})
-            num_profiler._get_min(
-                df_series,
-                prev_dependent_properties,
-                subset_properties)
+            # Validate the stats are reduced in one pass, whose time is divided
+            # among the stats.
+            expected = defaultdict(float, {'min': 0.25, 'max': 0.25,
+                                           'sum': 0.25, 'variance': 0.25})
+            num_profiler._get_batch_stats(data.astype(float),
+                                          subset_properties)
             self.assertEqual(expected, num_profiler.times)
 
-            # Validate _get_max is timed.
-            expected['max'] = 1.0
-            num_profiler._get_max(
-                df_series,
-                prev_dependent_properties,
-                subset_properties)
-            self.assertEqual(expected, num_profiler.times)
-
-            # Validate _get_sum is timed.
-            expected['sum'] = 1.0
-            num_profiler._get_sum(
-                df_series,
-                prev_dependent_properties,
-                subset_properties)
-            self.assertEqual(expected, num_profiler.times)
-
-            # Validate _get_variance is timed.
-            expected['variance'] = 1.0
-            num_profiler._get_variance(
-                df_series,
-                prev_dependent_properties,
-                subset_properties)
+            # Validate the reduced stats are merged without being timed again.
+            for calculation in [num_profiler._get_min, num_profiler._get_max,
+                                num_profiler._get_sum,
+                                num_profiler._get_variance]:
+                calculation(df_series, prev_dependent_properties,
+                            subset_properties)
             self.assertEqual(expected, num_profiler.times)
 
             # Validate _get_histogram_and_quantiles is timed.
             expected['histogram_and_quantiles'] = 15.0
+            expected.update(test_utils.get_histogram_method_times(1.0))
             num_profiler._get_histogram_and_quantiles(
                 df_series, prev_dependent_properties, subset_properties)
             self.assertEqual(expected, num_profiler.times)
+
+    def test_get_batch_stats_times(self):
+        """
+        Checks the time of the one pass reduction of the stats is divided
+        among the enabled stats.
+        :return:
+        """
+        num_profiler = TestColumn()
+        data = np.array([1., 2., 3., 4.])
+
+        # the reduction takes 4 seconds, divided among the 4 stats
+        time_array = [4.0, 0.0]
+        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+            num_profiler._get_batch_stats(data, {})
+        expected = defaultdict(float, {'min': 1.0, 'max': 1.0, 'sum': 1.0,
+                                       'variance': 1.0})
+        self.assertEqual(expected, num_profiler.times)
+        self.assertEqual(4.0, sum(num_profiler.times.values()))
+
+        # the disabled stats are not timed
+        calculations = num_profiler._NumericStatsMixin__calculations
+        calculations.pop('sum')
+        calculations.pop('variance')
+        time_array = [4.0, 0.0]
+        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+            num_profiler._get_batch_stats(data, {})
+        expected.update({'min': 3.0, 'max': 3.0})
+        self.assertEqual(expected, num_profiler.times)
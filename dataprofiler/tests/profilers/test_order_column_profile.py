@@ -68,6 +68,33 @@ class TestOrderColumn(unittest.TestCase):
         order = self._update_order(data)
         self.assertEqual(order, 'random')
 
+    def test_get_data_order(self):
+        profiler = OrderColumn(None)
+        test_cases = [
+            (['b'], ('constant value', 'b', 'b')),
+            (['b', 'b', 'b'], ('constant value', 'b', 'b')),
+            (['b', 'b', 'c', 'c', 'd'], ('ascending', 'b', 'd')),
+            (['3', '2', '2', '1.5'], ('descending', 3., 1.5)),
+            # the last value of a random order is the value before the first
+            # change in the opposite direction
+            (['1', '1', '11', '12', '4', '20'], ('random', 1., 12.)),
+            (['c', 'b', 'b', 'd', 'a'], ('random', 'c', 'b')),
+            # values are compared as strings unless all of them are floats
+            (['2', '10', 'a'], ('random', '2', '10')),
+        ]
+        for data, expected in test_cases:
+            order, first_value, last_value = profiler._get_data_order(
+                pd.Series(data))
+            self.assertEqual(expected, (order, first_value, last_value), data)
+            self.assertIsInstance(first_value, type(expected[1]))
+
+        # nan is neither less nor greater than its neighboring values
+        order, first_value, last_value = profiler._get_data_order(
+            pd.Series(['1', 'nan', '0', '0', '3']))
+        self.assertEqual('ascending', order)
+        self.assertEqual(1., first_value)
+        self.assertEqual(3., last_value)
+
     def test_batch_updates(self):
         data = ['a', 'a', 'a']
         df = pd.Series(data)
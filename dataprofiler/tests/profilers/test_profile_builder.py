@@ -1,19 +1,26 @@
 from __future__ import print_function
 
 
+import copy
+import datetime
+import functools
+import operator
+import pickle
 import unittest
 from unittest import mock
-import random
 import six
 import os
 import re
+import tempfile
 
 import numpy as np
 import pandas as pd
+from dask import dataframe as dd
 
 from . import utils as test_utils
 
 import dataprofiler as dp
+from dataprofiler.profilers import serialization
 from dataprofiler.profilers.profile_builder import StructuredDataProfile
 from dataprofiler.profilers.profiler_options import ProfilerOptions, \
     StructuredOptions
@@ -84,7 +91,7 @@ class TestProfiler(unittest.TestCase):
             "<class 'pandas.core.frame.DataFrame'>", merged_profile.file_type)
         self.assertEqual(2, merged_profile.null_in_row_count)
         self.assertEqual(6, merged_profile.rows_ingested)
-        self.assertEqual(5, len(merged_profile.hashed_row_dict))
+        self.assertEqual(5, len(merged_profile.hashed_row_counter))
 
         # test success if drawn from multiple files
         profile2.encoding = 'test'
@@ -94,20 +101,51 @@ class TestProfiler(unittest.TestCase):
         self.assertEqual('multiple files', merged_profile.file_type)
 
     def test_correct_unique_row_ratio_test(self):
-        self.assertEqual(2999, len(self.trained_schema.hashed_row_dict))
+        self.assertEqual(2999, len(self.trained_schema.hashed_row_counter))
         self.assertEqual(2999, self.trained_schema.rows_ingested)
         self.assertEqual(1.0, self.trained_schema._get_unique_row_ratio())
 
     def test_correct_rows_ingested(self):
         self.assertEqual(2999, self.trained_schema.rows_ingested)
 
+    def test_approximate_unique_row_count(self):
+        data = pd.DataFrame({'a': list(range(1000)) * 2,
+                             'b': ['x', 'y'] * 1000})
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False,
+                     'row_statistics.unique_count_method': 'approximate'})
+        profile1 = dp.Profiler(data[:1500], profiler_options=options)
+        profile2 = dp.Profiler(data[1500:], profiler_options=options)
+        self.assertAlmostEqual(1000, len(profile1.hashed_row_counter),
+                               delta=20)
+
+        merged_profile = profile1 + profile2
+        self.assertEqual(2000, merged_profile.rows_ingested)
+        self.assertAlmostEqual(1000, merged_profile._get_duplicate_row_count(),
+                               delta=20)
+        self.assertAlmostEqual(0.5, merged_profile._get_unique_row_ratio(),
+                               delta=0.01)
+
+        # updates accumulate the row statistics
+        profile1.update_profile(data[1500:])
+        self.assertEqual(2000, profile1.rows_ingested)
+        self.assertEqual(len(merged_profile.hashed_row_counter),
+                         len(profile1.hashed_row_counter))
+
+        # profiles must count unique rows with the same method to be merged
+        profile3 = dp.Profiler(data[1500:], profiler_options=ProfilerOptions())
+        with self.assertRaisesRegex(ValueError,
+                                    'The two profilers were not setup with the '
+                                    'same options'):
+            profile1 + profile3
+
     def test_correct_null_row_ratio_test(self):
         self.assertEqual(2999, self.trained_schema.null_in_row_count)
         self.assertEqual(2999, self.trained_schema.rows_ingested)
         self.assertEqual(1.0, self.trained_schema._get_null_row_ratio())
 
     def test_correct_duplicate_row_count_test(self):
-        self.assertEqual(2999, len(self.trained_schema.hashed_row_dict))
+        self.assertEqual(2999, len(self.trained_schema.hashed_row_counter))
         self.assertEqual(2999, self.trained_schema.rows_ingested)
         self.assertEqual(0.0, self.trained_schema._get_duplicate_row_count())
 
@@ -197,6 +235,20 @@ class TestProfiler(unittest.TestCase):
             2: report2_1000_quant[749],
         })
 
+        # quantiles can be requested at arbitrary points
+        report3 = self.trained_schema.report(
+            report_options={"quantile_points": [0.25, 0.5, 0.999]})
+        self.assertEqual({
+            0.25: report_quantiles[0],
+            0.5: report_quantiles[1],
+            0.999: report2_1000_quant[998],
+        }, report3["data_stats"]["int_col"]["statistics"]["quantiles"])
+        with self.assertRaisesRegex(ValueError, '`quantile_points` must be a '
+                                                'list of floats between 0 '
+                                                'and 1.'):
+            self.trained_schema.report(
+                report_options={"quantile_points": [0.5, 1.5]})
+
     def test_profile_key_name_without_space(self):
 
         def recursive_test_helper(report, prev_key=None):
@@ -204,10 +256,12 @@ class TestProfiler(unittest.TestCase):
                 # do not test keys in 'data_stats' as they contain column names
                 # neither for 'ave_predictions' and 'data_label_representation'
                 # as they contain label names
-                # same for 'null_types_index'
+                # same for 'null_types_index', 'categorical_count' and
+                # 'heavy_hitters' as they contain values of the data
                 if prev_key not in ['data_stats', 'avg_predictions',
                                     'data_label_representation',
-                                    'null_types_index']:
+                                    'null_types_index', 'categorical_count',
+                                    'heavy_hitters']:
                     # key names should contain only alphanumeric letters or '_'
                     self.assertIsNotNone(re.match('^[a-zA-Z0-9_]+$', str(key)))
                 if isinstance(report[key], dict):
@@ -248,6 +302,393 @@ class TestProfiler(unittest.TestCase):
                                     ' names.'):
             profile = dp.Profiler(invalid_data)
 
+    def test_executor_methods_match_serial(self):
+        # more rows than the min sample size, such that the updates sample a
+        # subset of the rows
+        data = pd.DataFrame({
+            'a': [1, 2, 3, None, 5] * 300,
+            'b': ['x', 'y', 'z', 'x', None] * 300,
+            'c': [1.5, 2.5, None, 4.5, 5.5] * 300,
+            'd': ['2021-01-01', '2021-01-02', None, '2021-01-04',
+                  '2021-01-05'] * 300,
+        })
+        update_data = pd.DataFrame({
+            'a': [6, 7, None, 9, 10] * 300,
+            'b': ['u', None, 'w', 'u', 'v'] * 300,
+            'c': [6.5, None, 8.5, 9.5, 10.5] * 300,
+            'd': ['2021-02-01', None, '2021-02-03', '2021-02-04',
+                  '2021-02-05'] * 300,
+        })
+
+        def get_report(method):
+            options = ProfilerOptions()
+            options.set({'data_labeler.is_enabled': False,
+                         'executor.method': method,
+                         'executor.max_workers': 2,
+                         'sampling.seed': 0})
+            profile = dp.Profiler(data, profiler_options=options)
+            self.assertEqual(500, profile.profile['a'].sample_size)
+            profile.update_profile(update_data)
+            self.assertEqual(2000, profile.profile['a'].sample_size)
+            self.assertListEqual(list(data.columns), list(profile.profile))
+            report = profile.report(
+                report_options={'output_format': 'serializable'})
+            for column in report['data_stats'].values():
+                column.pop('samples')
+                column['statistics'].pop('times', None)
+            return report['data_stats']
+
+        serial_report = get_report('serial')
+        self.assertDictEqual(serial_report, get_report('thread'))
+        self.assertDictEqual(serial_report, get_report('process'))
+
+    def test_process_executor_with_data_labeler(self):
+        data = pd.DataFrame({
+            'a': [1, 2, 3, None, 5],
+            'b': ['x', 'y', 'z', 'x', None],
+        })
+        options = ProfilerOptions()
+        options.set({'executor.method': 'process',
+                     'executor.max_workers': 2})
+
+        # the data labeler can't be sent to the processes, hence it is run
+        # in this process on the same rows as the other profiles
+        profile = dp.Profiler(data, profiler_options=options)
+        profile.update_profile(data)
+        for col in data.columns:
+            column_profile = profile.profile[col]
+            self.assertEqual(10, column_profile.sample_size)
+            self.assertEqual(2, column_profile.null_count)
+            data_labeler_profile = column_profile.profiles[
+                'data_label_profile']._profiles['data_labeler']
+            self.assertEqual(8, data_labeler_profile.sample_size)
+            self.assertIsNotNone(data_labeler_profile.data_label)
+
+    def test_from_stream(self):
+        data = pd.DataFrame({'a': [1, 2, None, 4, 2, 1, 2, None, 4, 2],
+                             'b': ['x', 'y', 'z', 'x', 'y',
+                                   'x', 'y', 'z', 'x', 'y']})
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False})
+
+        chunks = [data.iloc[i:i + 3] for i in range(0, len(data), 3)]
+        profile = dp.Profiler.from_stream(chunks, profiler_options=options)
+        self.assertEqual(10, profile.rows_ingested)
+        self.assertEqual(2, profile.null_in_row_count)
+        self.assertEqual(4, len(profile.hashed_row_counter))
+        self.assertEqual(10, profile.profile['a'].sample_size)
+        self.assertEqual(2, profile.profile['a'].null_count)
+        self.assertEqual(
+            (1 + 2 + 4 + 2 + 1 + 2 + 4 + 2) / 8,
+            profile.report()['data_stats']['a']['statistics']['mean'])
+
+        # data readers are streamed in chunks
+        csv_data = dp.Data(data=data, data_type='csv')
+        profile = dp.Profiler.from_stream(csv_data, chunk_size=3,
+                                          profiler_options=options)
+        self.assertEqual(10, profile.rows_ingested)
+        self.assertEqual('csv', profile.file_type)
+
+        with self.assertRaisesRegex(ValueError, 'Each chunk of the streamed '
+                                                'data must be a pd.DataFrame.'):
+            dp.Profiler.from_stream([[1, 2]], profiler_options=options)
+
+    def test_from_stream_reuses_executor(self):
+        data = pd.DataFrame({'a': [1, 2, None, 4, 2, 1, 2, None, 4, 2],
+                             'b': ['x', 'y', 'z', 'x', 'y',
+                                   'x', 'y', 'z', 'x', 'y']})
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False,
+                     'executor.method': 'thread',
+                     'executor.max_workers': 2})
+
+        # a single pool of workers profiles all the chunks
+        chunks = [data.iloc[i:i + 3] for i in range(0, len(data), 3)]
+        create_executor = dp.Profiler._create_executor
+        with mock.patch.object(dp.Profiler, '_create_executor',
+                               side_effect=create_executor) as mock_create:
+            profile = dp.Profiler.from_stream(chunks,
+                                              profiler_options=options)
+        # one pool for the empty profile and one for the stream
+        self.assertEqual(2, mock_create.call_count)
+        self.assertEqual(10, profile.profile['a'].sample_size)
+        self.assertEqual(2, profile.profile['a'].null_count)
+
+    def test_sampling_seed(self):
+        data = pd.DataFrame({'a': np.arange(1000),
+                             'b': np.arange(1000).astype(str)})
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False, 'sampling.seed': 5})
+
+        # the sampled rows are reproducible with the seed
+        profile1 = dp.Profiler(data, samples_per_update=100,
+                               profiler_options=options)
+        profile2 = dp.Profiler(data, samples_per_update=100,
+                               profiler_options=options)
+        self.assertListEqual(profile1.profile['a'].sample,
+                             profile2.profile['a'].sample)
+        self.assertEqual(100, profile1.profile['a'].sample_size)
+
+        # all the columns sample the same rows
+        self.assertListEqual(profile1.profile['a'].sample,
+                             profile1.profile['b'].sample)
+
+    def test_adaptive_sampling(self):
+        np.random.seed(0)
+        data = pd.DataFrame({'a': np.random.randint(0, 5, 20000),
+                             'b': np.random.randn(20000)})
+        data.loc[::10, 'b'] = None
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False, 'sampling.seed': 0,
+                     'adaptive': True, 'initial_batch_size': 500,
+                     'convergence_tolerance': 0.05})
+
+        profile = dp.Profiler(data, profiler_options=options)
+        for col in data.columns:
+            column_profile = profile.profile[col]
+            convergence = \
+                column_profile.profile['statistics']['convergence']
+            # the column stops being profiled once its estimates converge
+            self.assertTrue(convergence['converged'])
+            self.assertLessEqual(convergence['max_change'], 0.05)
+            self.assertLess(column_profile.sample_size, len(data))
+            self.assertEqual(
+                500 * 2 ** (convergence['batches'] - 1),
+                column_profile.sample_size)
+        self.assertEqual('int', profile.profile['a'].profile['data_type'])
+        self.assertAlmostEqual(
+            0.1, profile.profile['b'].null_count
+            / profile.profile['b'].sample_size, delta=0.02)
+
+        # a tolerance of 0 profiles all the rows unless nothing changes
+        options.set({'convergence_tolerance': 0.})
+        profile = dp.Profiler(data, samples_per_update=5000,
+                              profiler_options=options)
+        self.assertEqual(5000, profile.profile['b'].sample_size)
+        self.assertFalse(profile.profile['b'].profile['statistics']
+                         ['convergence']['converged'])
+
+        # the convergence is merged with the profiles
+        merged_profile = profile + profile
+        self.assertEqual(
+            2 * profile.profile['b']._convergence['batches'],
+            merged_profile.profile['b']._convergence['batches'])
+
+        # the convergence is not reported unless the sampling is adaptive
+        options.set({'adaptive': False})
+        profile = dp.Profiler(data[:100], profiler_options=options)
+        self.assertNotIn('convergence',
+                         profile.profile['a'].profile['statistics'])
+
+    def test_merge(self):
+        data = pd.DataFrame({'a': [1, 2, None, 4, 2, 1, 7, None, 4, 2, 3],
+                             'b': ['x', 'y', 'z', 'x', 'y', 'x',
+                                   'y', None, 'x', 'y', 'w']})
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False})
+        profiles = [dp.Profiler(data.iloc[i:i + 2], profiler_options=options)
+                    for i in range(0, len(data), 2)]
+
+        def round_floats(value):
+            if isinstance(value, float):
+                return round(value, 10)
+            elif isinstance(value, dict):
+                return {key: round_floats(val) for key, val in value.items()}
+            elif isinstance(value, list):
+                return [round_floats(val) for val in value]
+            return value
+
+        def get_report(profile):
+            report = profile.report(
+                report_options={'output_format': 'serializable'})
+            for column in report['data_stats'].values():
+                column.pop('samples')
+                column['statistics'].pop('times', None)
+            return round_floats(report)
+
+        def pop_histogram_counts(report):
+            # the counts of the histograms are rebinned in the order of the
+            # merges, hence only their totals match
+            statistics = report['data_stats']['a']['statistics']
+            statistics.pop('quantiles')
+            bin_counts = statistics['histogram'].pop('bin_counts')
+            return sum(bin_counts)
+
+        # the tree reduction matches the left fold of an odd number of profiles
+        # up to the rounding of the floats and the rebinning of the histograms
+        expected_report = get_report(functools.reduce(operator.add, profiles))
+        expected_count = pop_histogram_counts(expected_report)
+        for n_jobs in [None, 1, 3]:
+            merged_profile = dp.Profiler.merge(profiles, n_jobs=n_jobs)
+            report = get_report(merged_profile)
+            self.assertEqual(expected_count, pop_histogram_counts(report))
+            self.assertDictEqual(expected_report, report)
+        self.assertEqual(11, merged_profile.rows_ingested)
+        self.assertEqual(
+            {'nan': [2, 7]},
+            merged_profile.profile['a'].null_types_index)
+
+        self.assertIs(profiles[0], dp.Profiler.merge(profiles[:1]))
+        with self.assertRaisesRegex(ValueError, 'At least one profile is '
+                                                'required to merge.'):
+            dp.Profiler.merge([])
+        with self.assertRaisesRegex(TypeError, '`Profiler` and `int` are not '
+                                               'of the same profiler type.'):
+            dp.Profiler.merge(profiles + [1])
+        with self.assertRaisesRegex(ValueError, '`n_jobs` must be a positive '
+                                                'integer or None.'):
+            dp.Profiler.merge(profiles, n_jobs=0)
+
+    def test_from_partitions(self):
+        data = pd.DataFrame({'a': [1, 2, None, 4, 2, 1, 7, None, 4, 2, 3],
+                             'b': ['x', 'y', 'z', 'x', 'y', 'x',
+                                   'y', None, 'x', 'y', 'w']})
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False})
+        expected_profile = dp.Profiler(data, profiler_options=options)
+
+        def assert_profile_equal(profile):
+            self.assertEqual(11, profile.rows_ingested)
+            self.assertEqual(2, profile.null_in_row_count)
+            self.assertEqual(expected_profile._get_unique_row_count(),
+                             profile._get_unique_row_count())
+            for col in ['a', 'b']:
+                expected_report = \
+                    expected_profile.report()['data_stats'][col]['statistics']
+                report = profile.report()['data_stats'][col]['statistics']
+                for stat in ['null_count', 'sample_size', 'unique_count']:
+                    self.assertEqual(expected_report[stat], report[stat])
+            self.assertAlmostEqual(
+                expected_profile.profile['a'].profiles['data_type_profile']
+                ._profiles['int'].mean,
+                profile.profile['a'].profiles['data_type_profile']
+                ._profiles['int'].mean)
+
+        dask_data = dd.from_pandas(data, npartitions=3)
+        for method in ['serial', 'thread', 'process']:
+            options.set({'executor.method': method})
+            assert_profile_equal(dp.Profiler(dask_data,
+                                             profiler_options=options))
+
+        # any iterable of partitions can be profiled
+        options.set({'executor.method': 'thread'})
+        partitions = (data.iloc[i:i + 4] for i in range(0, len(data), 4))
+        profile = dp.Profiler.from_partitions(partitions,
+                                              profiler_options=options)
+        assert_profile_equal(profile)
+
+        # partitions update an existing profile
+        profile = dp.Profiler(data.iloc[:4], profiler_options=options)
+        profile.update_profile(dd.from_pandas(data.iloc[4:], npartitions=2))
+        assert_profile_equal(profile)
+
+        # missing values of string extension columns are null
+        partitions = [data.iloc[i:i + 4].astype({'b': 'string'})
+                      for i in range(0, len(data), 4)]
+        profile = dp.Profiler.from_partitions(partitions,
+                                              profiler_options=options)
+        assert_profile_equal(profile)
+
+        with self.assertRaisesRegex(ValueError, 'Each partition of the data '
+                                                'must be a pd.DataFrame.'):
+            dp.Profiler.from_partitions([[1, 2]], profiler_options=options)
+
+    def test_save_and_load(self):
+        data = pd.DataFrame({'a': [1, 2, None, 4, 5] * 20,
+                             'b': ['x', 'y', 'z', None, 'x'] * 20,
+                             'c': [1.5, 2.5, 3.5, 4.5, None] * 20})
+        options = ProfilerOptions()
+        options.set({'data_labeler.is_enabled': False})
+        profile = dp.Profiler(data, profiler_options=options)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, 'profile.dpp')
+            profile.save(filepath)
+
+            for mmap_mode in ['c', None]:
+                loaded_profile = dp.Profiler.load(filepath, mmap_mode=mmap_mode)
+                self.assertDictEqual(
+                    profile.report(
+                        report_options={'output_format': 'serializable'}),
+                    loaded_profile.report(
+                        report_options={'output_format': 'serializable'}))
+
+                # the loaded profile samples the next updates like the profile
+                self.assertEqual(
+                    copy.deepcopy(profile)._get_sampling_seed(),
+                    loaded_profile._get_sampling_seed())
+
+                # loaded profiles can be updated and merged
+                loaded_profile.update_profile(data)
+                merged_profile = loaded_profile + profile
+                self.assertEqual(300, merged_profile.rows_ingested)
+
+            # a loaded profile can be saved to the file it was loaded from
+            loaded_profile = dp.Profiler.load(filepath)
+            loaded_profile.update_profile(data)
+            loaded_profile.save(filepath)
+            self.assertEqual(200, dp.Profiler.load(filepath).rows_ingested)
+
+            # the format version must match
+            with open(filepath, 'r+b') as profile_file:
+                profile_file.seek(8)
+                profile_file.write(np.uint32(100).tobytes())
+            with self.assertRaisesRegex(ValueError, 'The saved profile format '
+                                                    'version 100 is not '
+                                                    'supported'):
+                dp.Profiler.load(filepath)
+
+            with open(filepath, 'wb') as profile_file:
+                profile_file.write(b'not a profile')
+            with self.assertRaisesRegex(ValueError, 'is not a saved profile.'):
+                dp.Profiler.load(filepath)
+
+    def test_load_only_allows_profile_globals(self):
+        class Exploit(object):
+            def __init__(self, filepath):
+                self.filepath = filepath
+
+            def __reduce__(self):
+                return os.remove, (self.filepath,)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, 'profile.dpp')
+            with open(filepath, 'wb') as profile_file:
+                serialization._write_profile(Exploit(filepath), profile_file)
+            with self.assertRaisesRegex(pickle.UnpicklingError,
+                                        'is not allowed in a saved profile.'):
+                dp.Profiler.load(filepath)
+            self.assertTrue(os.path.exists(filepath))
+
+    @mock.patch('dataprofiler.profilers.data_labeler_column_profile.'
+                'DataLabelerColumn.update', return_value=None)
+    @mock.patch('dataprofiler.profilers.data_labeler_column_profile.'
+                'DataLabeler')
+    def test_save_and_load_data_labeler_by_reference(self, data_labeler_mock,
+                                                     *mocks):
+        data = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+        options = ProfilerOptions()
+        options.set({'data_labeler_dirpath': 'test_dirpath'})
+        profile = dp.Profiler(data, profiler_options=options)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, 'profile.dpp')
+            profile.save(filepath)
+            data_labeler_mock.reset_mock()
+            loaded_profile = dp.Profiler.load(filepath)
+
+        # the data labeler is loaded once and shared by the columns
+        data_labeler_mock.assert_called_once_with(
+            labeler_type='structured', dirpath='test_dirpath',
+            load_options=None)
+        labelers = [
+            column.profiles['data_label_profile']._profiles['data_labeler']
+            for column in loaded_profile.profile.values()]
+        self.assertIs(data_labeler_mock.return_value,
+                      labelers[0].data_labeler)
+        self.assertIs(labelers[0].data_labeler, labelers[1].data_labeler)
+        self.assertEqual('test_dirpath', labelers[0]._data_labeler_dirpath)
+
     def test_text_data_raises_error(self):
         text_file_path = os.path.join(
             test_root_path, 'data', 'txt/sentence-10x.txt'
@@ -285,7 +726,7 @@ class TestStructuredDataProfileClass(unittest.TestCase):
             list(src_profile.profiles['data_type_profile']._profiles.keys())
         )
 
-        stats_types = ['category', 'order']
+        stats_types = ['category', 'order', 'heavy_hitters']
         six.assertCountEqual(
             self, stats_types,
             list(src_profile.profiles['data_stats_profile']._profiles.keys())
@@ -347,7 +788,7 @@ class TestStructuredDataProfileClass(unittest.TestCase):
         profile2.profiles = dict(test=2)
         merged_profile = profile1 + profile2
         self.assertEqual(3, merged_profile.profiles['test'])
-        self.assertEqual(['4.0', '5.0', '1.0', '3.0'], merged_profile.sample)
+        self.assertEqual(['4.0', '1.0', '3.0', '5.0'], merged_profile.sample)
         self.assertEqual(6, merged_profile.sample_size)
         self.assertEqual(2, merged_profile.null_count)
         self.assertListEqual(['nan'], merged_profile.null_types)
@@ -392,12 +833,73 @@ class TestStructuredDataProfileClass(unittest.TestCase):
                 self=None, df_series=data[1:], sample_size=6,
                 min_true_samples=0)
         # note data above is a subset `df_series=data[1:]`, 1.0 will not exist
-        self.assertTrue(np.issubdtype(np.object_, df_series.dtype))
+        # and the native floats are not converted to strings
+        self.assertEqual(np.float64, df_series.dtype)
+        self.assertListEqual(['6.0', '3.0', '4.0'],
+                             base_stats.pop('sample').samples)
         self.assertDictEqual(
-            {'sample': ['4.0', '6.0', '3.0'], 'sample_size': 5, 'null_count': 2,
+            {'sample_size': 5, 'null_count': 2,
              'null_types': dict(nan=['e', 'b'])},
             base_stats)
 
+    def test_native_dtypes(self):
+        data = pd.DataFrame({
+            'int': [3, -1, 12345678, 0, 7, 7],
+            'float': [1.5, np.nan, -2.25, 1e20, np.nan, 0.125],
+            'datetime': pd.to_datetime([
+                datetime.datetime(2013, 3, 5), None,
+                datetime.datetime(2012, 1, 31), datetime.datetime(2014, 7, 1),
+                datetime.datetime(2013, 12, 25),
+                datetime.datetime(2013, 12, 25, 12)])})
+        options = StructuredOptions()
+        options.set({'data_labeler.is_enabled': False})
+
+        # the native columns are profiled as their strings are
+        for column in data:
+            test_utils.set_seed(0)
+            str_profile = StructuredDataProfile(
+                data[column].astype(object), options=options).profile
+            test_utils.set_seed(0)
+            profile = StructuredDataProfile(
+                data[column], options=options).profile
+            str_profile['statistics'].pop('times')
+            profile['statistics'].pop('times')
+            self.assertEqual(str(str_profile), str(profile))
+
+    def test_null_values_option(self):
+        data = pd.Series(['1', 'N/A', '3', 'missing', 'nan', 'n/a', '7', ''])
+
+        # default null values
+        options = StructuredOptions()
+        options.set({'data_labeler.is_enabled': False})
+        profile = StructuredDataProfile(data, options=options)
+        self.assertEqual(2, profile.null_count)
+        self.assertDictEqual({'nan': [4], '': [7]}, profile.null_types_index)
+
+        # user added null values are detected along with the defaults
+        options.set({'null_values.values': {'n/a': re.IGNORECASE,
+                                            'missing': 0}})
+        profile = StructuredDataProfile(data, options=options)
+        self.assertEqual(5, profile.null_count)
+        self.assertDictEqual(
+            {'nan': [4], '': [7], 'N/A': [1], 'n/a': [5], 'missing': [3]},
+            profile.null_types_index)
+        self.assertListEqual(['', 'nan', 'n/a', 'N/A', 'missing'],
+                             profile.null_types)
+
+        # the added null values may have non-capturing groups
+        options.set({'null_values.values': {'(?:n/a|missing)': re.IGNORECASE}})
+        profile = StructuredDataProfile(data, options=options)
+        self.assertEqual(5, profile.null_count)
+        self.assertDictEqual(
+            {'nan': [4], '': [7], 'N/A': [1], 'n/a': [5], 'missing': [3]},
+            profile.null_types_index)
+
+        # the added null values can be disabled
+        options.set({'null_values.is_enabled': False})
+        profile = StructuredDataProfile(data, options=options)
+        self.assertEqual(2, profile.null_count)
+
     def test_update_match_are_abstract(self):
         six.assertCountEqual(
             self,
@@ -421,9 +923,9 @@ class TestStructuredDataProfileClass(unittest.TestCase):
         column = pd.Series([1, float('nan')] * 10)
 
         # test null_count when subset of full sample size
-        random.seed(0)
+        np.random.seed(0)
         profile = StructuredDataProfile(column, sample_size=10)
-        self.assertEqual(6, profile.null_count)
+        self.assertEqual(5, profile.null_count)
 
         # test null_count when full sample size
         profile = StructuredDataProfile(column, sample_size=len(column))
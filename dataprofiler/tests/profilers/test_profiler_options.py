@@ -1,4 +1,5 @@
 import os
+import re
 import unittest
 from unittest import mock
 
@@ -101,6 +102,7 @@ class TestProfilerOptions(unittest.TestCase):
         options.structured_options.datetime.is_enabled = False
         options.structured_options.order.is_enabled = False
         options.structured_options.category.is_enabled = False
+        options.structured_options.heavy_hitters.is_enabled = False
         options.structured_options.data_labeler.is_enabled = False
         profile = Profiler(self.data, profiler_options=options)
         for column_name in profile.profile.keys():
@@ -180,6 +182,206 @@ class TestProfilerOptions(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, expected_error):
             profile = Profiler(self.data, profiler_options=options)
                 
+    def test_validate_executor(self, *mocks):
+        options = ProfilerOptions()
+        options.set({"executor.method": "thread",
+                     "executor.max_workers": 2})
+        self.assertIsNone(options.validate(raise_error=False))
+
+        options.executor.method = "Invalid"
+        options.executor.max_workers = 0
+        expected_error = (
+            r"ProfilerOptions.executor.method must be one of the following: "
+            r"\['serial', 'thread', 'process'\].\n"
+            r"ProfilerOptions.executor.max_workers must be None or a positive "
+            r"integer.")
+        with self.assertRaisesRegex(ValueError, expected_error):
+            profile = Profiler(self.data, profiler_options=options)
+
+    def test_validate_row_statistics(self, *mocks):
+        options = ProfilerOptions()
+        options.set({"unique_count_method": "approximate",
+                     "unique_count_error_rate": 0.05})
+        self.assertIsNone(options.validate(raise_error=False))
+
+        options.row_statistics.unique_count_method = "Invalid"
+        options.row_statistics.unique_count_error_rate = 1.5
+        expected_error = (
+            r"ProfilerOptions.row_statistics.unique_count_method must be one "
+            r"of the following: \['exact', 'approximate'\].\n"
+            r"ProfilerOptions.row_statistics.unique_count_error_rate must be a "
+            r"float between 0.00203125 and 1.")
+        with self.assertRaisesRegex(ValueError, expected_error):
+            options.validate()
+
+        # the error rate can't be below the min error rate of the HyperLogLog
+        # sketch
+        options.row_statistics.unique_count_method = "approximate"
+        options.row_statistics.unique_count_error_rate = 0.001
+        with self.assertRaisesRegex(
+                ValueError, r"ProfilerOptions.row_statistics."
+                            r"unique_count_error_rate must be a float between "
+                            r"0.00203125 and 1."):
+            options.validate()
+        options.row_statistics.unique_count_error_rate = 0.00203125
+        self.assertIsNone(options.validate(raise_error=False))
+
+    def test_validate_quantile_sketch(self, *mocks):
+        options = ProfilerOptions()
+        options.set({"quantile_sketch.is_enabled": True,
+                     "quantile_sketch.error_rate": 0.05})
+        self.assertIsNone(options.validate(raise_error=False))
+        self.assertTrue(
+            options.structured_options.int.quantile_sketch.is_enabled)
+        self.assertEqual(
+            0.05, options.structured_options.text.quantile_sketch.error_rate)
+
+        options.structured_options.float.quantile_sketch.error_rate = 0
+        expected_error = ("ProfilerOptions.structured_options.float."
+                          "quantile_sketch.error_rate must be a float between "
+                          "0 and 1.")
+        with self.assertRaisesRegex(ValueError, expected_error):
+            options.validate()
+
+    def test_validate_early_elimination(self, *mocks):
+        options = ProfilerOptions()
+        options.set({"early_elimination.is_enabled": True})
+        self.assertIsNone(options.validate(raise_error=False))
+        self.assertTrue(
+            options.structured_options.int.early_elimination.is_enabled)
+        self.assertTrue(
+            options.structured_options.float.early_elimination.is_enabled)
+
+        # a text profile matches all values, hence it has no early elimination
+        self.assertNotIn("early_elimination",
+                         options.structured_options.text.properties)
+
+        options.structured_options.int.early_elimination = True
+        expected_error = ("ProfilerOptions.structured_options.int."
+                          "early_elimination must be a BooleanOption.")
+        with self.assertRaisesRegex(ValueError, expected_error):
+            options.validate()
+
+    def test_validate_max_categories(self, *mocks):
+        options = ProfilerOptions()
+        options.set({"max_categories": 100})
+        self.assertIsNone(options.validate(raise_error=False))
+        self.assertEqual(
+            100, options.structured_options.category.max_categories)
+
+        expected_error = ("ProfilerOptions.structured_options.category."
+                          "max_categories must be None or a positive integer.")
+        for max_categories in [0, 1.5, True, "10"]:
+            options.structured_options.category.max_categories = \
+                max_categories
+            with self.assertRaisesRegex(ValueError, expected_error):
+                options.validate()
+
+    def test_validate_heavy_hitters(self, *mocks):
+        options = ProfilerOptions()
+        options.set({"top_k": 5, "num_counters": 50})
+        self.assertIsNone(options.validate(raise_error=False))
+        self.assertEqual(
+            5, options.structured_options.heavy_hitters.top_k)
+
+        options.structured_options.heavy_hitters.top_k = 0
+        expected_error = ("ProfilerOptions.structured_options.heavy_hitters."
+                          "top_k must be a positive integer.")
+        with self.assertRaisesRegex(ValueError, expected_error):
+            options.validate()
+
+        options.structured_options.heavy_hitters.top_k = 100
+        expected_error = ("ProfilerOptions.structured_options.heavy_hitters."
+                          "num_counters must be an integer greater than or "
+                          "equal to top_k.")
+        with self.assertRaisesRegex(ValueError, expected_error):
+            options.validate()
+
+    def test_validate_vocab_count(self, *mocks):
+        options = ProfilerOptions()
+        options.set({"vocab_count.is_enabled": True})
+        self.assertIsNone(options.validate(raise_error=False))
+        self.assertTrue(options.structured_options.text.vocab_count.is_enabled)
+
+        options.structured_options.text.vocab_count = True
+        expected_error = ("ProfilerOptions.structured_options.text."
+                          "vocab_count must be a BooleanOption.")
+        with self.assertRaisesRegex(ValueError, expected_error):
+            options.validate()
+
+    def test_validate_sampling(self, *mocks):
+        options = ProfilerOptions()
+        options.set({"seed": 0})
+        self.assertIsNone(options.validate(raise_error=False))
+
+        expected_error = ("ProfilerOptions.sampling.seed must be None or a "
+                          "non-negative integer.")
+        for seed in [-1, 1.5, True, "0"]:
+            options.sampling.seed = seed
+            with self.assertRaisesRegex(ValueError, expected_error):
+                options.validate()
+        options.sampling.seed = None
+
+        invalid_options = [
+            ("adaptive", [1, "True"], "ProfilerOptions.sampling.adaptive must "
+                                      "be a Boolean."),
+            ("convergence_tolerance", [-0.1, 1, True, "0.1"],
+             r"ProfilerOptions.sampling.convergence_tolerance must be a float "
+             r"in \[0, 1\)."),
+            ("initial_batch_size", [0, 1.5, True],
+             "ProfilerOptions.sampling.initial_batch_size must be a positive "
+             "integer."),
+            ("batch_growth_factor", [1, 0.5, True, "2"],
+             "ProfilerOptions.sampling.batch_growth_factor must be a number "
+             "greater than 1."),
+        ]
+        for option, values, expected_error in invalid_options:
+            default = getattr(options.sampling, option)
+            for value in values:
+                setattr(options.sampling, option, value)
+                with self.assertRaisesRegex(ValueError, expected_error):
+                    options.validate()
+            setattr(options.sampling, option, default)
+        self.assertIsNone(options.validate(raise_error=False))
+
+    def test_validate_null_values(self, *mocks):
+        options = ProfilerOptions()
+        options.set({"null_values.values": {"n/a": re.IGNORECASE,
+                                            "missing": 0}})
+        self.assertIsNone(options.validate(raise_error=False))
+        self.assertListEqual(
+            ["int", "float", "datetime", "text", "order", "category",
+             "heavy_hitters", "data_labeler"],
+            options.structured_options.enabled_columns)
+
+        expected_error = (
+            "ProfilerOptions.structured_options.null_values.values must be "
+            "either None or a dictionary that contains keys of type str and "
+            "values of type int")
+        for null_values in ["n/a", {"n/a": "Invalid"}, {1: 0},
+                            {"n/a": re.ASCII}, {"n/a": re.MULTILINE}]:
+            options.structured_options.null_values.values = null_values
+            with self.assertRaisesRegex(ValueError, expected_error):
+                options.validate()
+
+        options.structured_options.null_values.values = {"(": 0}
+        with self.assertRaisesRegex(
+                ValueError, "ProfilerOptions.structured_options.null_values."
+                            "values contains an invalid regex: \\("):
+            options.validate()
+
+        # the null values can't have capturing groups, while non-capturing
+        # groups are valid
+        for null_value in ["(n/a)", "(?P<na>n/a)", "(n)/\\1"]:
+            options.structured_options.null_values.values = {null_value: 0}
+            with self.assertRaisesRegex(
+                    ValueError, "ProfilerOptions.structured_options."
+                                "null_values.values contains a regex with "
+                                "capturing groups"):
+                options.validate()
+        options.structured_options.null_values.values = {"(?:n/a|na)": 0}
+        self.assertIsNone(options.validate(raise_error=False))
+
     def test_validate_numeric_stats(self, *mocks):
         options = ProfilerOptions()
         numerical_options = {
@@ -0,0 +1,150 @@
+import pickle
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from dataprofiler.profilers import sampling, serialization
+
+
+class TestRowSample(unittest.TestCase):
+    """
+    Validates sampling.RowSample is properly working.
+    """
+
+    def test_iter_indices(self):
+        row_sample = sampling.RowSample(data_length=100, seed=0)
+
+        all_indices = []
+        num_chunks = 0
+        for indices in row_sample.iter_indices(chunk_size=7):
+            self.assertLessEqual(len(indices), 7)
+            all_indices.extend(indices.tolist())
+            num_chunks += 1
+        self.assertEqual(100 // 7 + 1, num_chunks)
+        self.assertCountEqual(list(range(100)), all_indices)
+
+        # empty data yields a single empty chunk
+        self.assertEqual(
+            [[]], [indices.tolist() for indices in
+                   sampling.RowSample(0, seed=0).iter_indices(5)])
+
+        # the chunks may start after the first rows of the order
+        row_sample = sampling.RowSample(data_length=100, seed=0)
+        np.testing.assert_array_equal(
+            row_sample.get_indices(95, 100),
+            np.concatenate(list(row_sample.iter_indices(3, start=95))))
+
+    def test_seed(self):
+        indices = sampling.RowSample(50, seed=1).get_indices(0, 20)
+        np.testing.assert_array_equal(
+            indices, sampling.RowSample(50, seed=1).get_indices(0, 20))
+        self.assertFalse(np.array_equal(
+            indices, sampling.RowSample(50, seed=2).get_indices(0, 20)))
+
+        # without a seed, the order is seeded from the global numpy state
+        np.random.seed(0)
+        indices = sampling.RowSample(50).get_indices(0, 20)
+        np.random.seed(0)
+        np.testing.assert_array_equal(
+            indices, sampling.RowSample(50).get_indices(0, 20))
+
+    def test_order_is_shared(self):
+        row_sample = sampling.RowSample(50, seed=0)
+        first_indices = row_sample.get_indices(0, 20)
+        keys = row_sample.get_keys(0, 50)
+
+        # previously drawn rows and keys are kept when the order is extended
+        np.testing.assert_array_equal(first_indices,
+                                      row_sample.get_indices(0, 20))
+        np.testing.assert_array_equal(keys[:20], row_sample.get_keys(0, 20))
+        self.assertCountEqual(list(range(50)),
+                              row_sample.get_indices(0, 50).tolist())
+        self.assertTrue(np.all((keys >= 0) & (keys < 1)))
+
+        # the order can be sent to other processes
+        copied_row_sample = pickle.loads(pickle.dumps(row_sample))
+        np.testing.assert_array_equal(row_sample.get_indices(0, 50),
+                                      copied_row_sample.get_indices(0, 50))
+
+
+class TestReservoirSampler(unittest.TestCase):
+    """
+    Validates sampling.ReservoirSampler is properly working.
+    """
+
+    def test_update(self):
+        sampler = sampling.ReservoirSampler(5, seed=0)
+        sampler.update(['a', 'b'])
+        self.assertCountEqual(['a', 'b'], sampler.samples)
+
+        sampler.update(list('cdefghij'))
+        self.assertEqual(10, sampler.count)
+        self.assertEqual(5, len(sampler))
+        self.assertTrue(set(sampler.samples) <= set('abcdefghij'))
+
+        # values with the smallest keys are sampled
+        sampler = sampling.ReservoirSampler(2)
+        sampler.update(['a', 'b', 'c', 'd'], keys=[0.5, 0.1, 0.9, 0.2])
+        self.assertListEqual(['b', 'd'], sampler.samples)
+
+        with self.assertRaisesRegex(ValueError, '`values` and `keys` must be '
+                                                'the same length.'):
+            sampler.update(['a'], keys=[0.1, 0.2])
+
+        # the sampled values can be converted to strings
+        sampler = sampling.ReservoirSampler(2)
+        sampler.update(pd.Series([1.5, 2, 3, 4]), keys=[0.5, 0.1, 0.9, 0.2],
+                       convert_to_str=True)
+        self.assertListEqual(['2.0', '4.0'], sampler.samples)
+
+    def test_uniform(self):
+        # each value is sampled with the same probability across updates
+        counts = np.zeros(20)
+        for seed in range(2000):
+            sampler = sampling.ReservoirSampler(5, seed=seed)
+            sampler.update(np.arange(5))
+            sampler.update(np.arange(5, 20))
+            counts[sampler.samples] += 1
+        np.testing.assert_allclose(counts / 2000, 5 / 20, atol=0.05)
+
+    def test_add(self):
+        sampler1 = sampling.ReservoirSampler(2)
+        sampler1.update(['a', 'b', 'c'], keys=[0.5, 0.1, 0.9])
+        sampler2 = sampling.ReservoirSampler(2)
+        sampler2.update(['d', 'e'], keys=[0.3, 0.05])
+
+        merged_sampler = sampler1 + sampler2
+        self.assertListEqual(['e', 'b'], merged_sampler.samples)
+        self.assertEqual(5, merged_sampler.count)
+
+        with self.assertRaisesRegex(TypeError, '`ReservoirSampler` and `int` '
+                                               'are not of the same sampler '
+                                               'type.'):
+            sampler1 + 1
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+    def test_save_and_load(self):
+        sampler = sampling.ReservoirSampler(5, seed=0)
+        sampler.update(np.arange(10))
+
+        # the key generator is saved as a plain state, hence the saved
+        # sampler doesn't depend on the pickled internals of numpy
+        self.assertIsInstance(sampler.__getstate__()['_key_generator'], dict)
+        loaded_sampler = serialization.loads_profile(
+            serialization.dumps_profile(sampler))
+        self.assertListEqual(sampler.samples, loaded_sampler.samples)
+
+        # the loaded sampler continues with the same keys
+        sampler.update(np.arange(10, 20))
+        loaded_sampler.update(np.arange(10, 20))
+        self.assertListEqual(sampler.samples, loaded_sampler.samples)
+
+        # a sampler which has not drawn any keys is saved without a generator
+        sampler = sampling.ReservoirSampler(5, seed=0)
+        loaded_sampler = serialization.loads_profile(
+            serialization.dumps_profile(sampler))
+        self.assertIsNone(loaded_sampler._key_generator)
@@ -0,0 +1,300 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from dataprofiler.profilers import serialization, sketches
+
+
+def get_hashes(values):
+    return pd.util.hash_pandas_object(pd.Series(values), index=False).values
+
+
+class TestExactUniqueCounter(unittest.TestCase):
+    """
+    Validates sketches.ExactUniqueCounter is properly working.
+    """
+
+    def test_update(self):
+        counter = sketches.ExactUniqueCounter()
+        self.assertEqual(0, counter.count)
+
+        counter.update(get_hashes([1, 2, 2, 3]))
+        self.assertEqual(3, counter.count)
+
+        # previously seen hashes are not counted twice
+        counter.update(get_hashes([3, 4]))
+        counter.update(np.array([], dtype=np.uint64))
+        self.assertEqual(4, counter.count)
+        self.assertEqual(4, len(counter))
+
+    def test_buffered_updates(self):
+        counter = sketches.ExactUniqueCounter()
+        counter.update(get_hashes(np.arange(1000)))
+
+        # small updates are buffered until the count is read
+        for i in range(0, 1500, 100):
+            counter.update(get_hashes(np.arange(i, i + 100) % 1200))
+        self.assertLess(len(counter._hashes), 1200)
+        self.assertEqual(1200, counter.count)
+        self.assertEqual(1200, len(counter._hashes))
+        self.assertListEqual([], counter._buffer)
+
+    def test_add(self):
+        counter1 = sketches.ExactUniqueCounter()
+        counter1.update(get_hashes([1, 2, 3]))
+        counter2 = sketches.ExactUniqueCounter()
+        counter2.update(get_hashes([3, 4]))
+
+        merged_counter = counter1 + counter2
+        self.assertEqual(4, merged_counter.count)
+        self.assertEqual(3, counter1.count)
+
+        with self.assertRaisesRegex(TypeError, '`ExactUniqueCounter` and '
+                                               '`HyperLogLog` are not of the '
+                                               'same counter type.'):
+            counter1 + sketches.HyperLogLog()
+
+
+class TestHyperLogLog(unittest.TestCase):
+    """
+    Validates sketches.HyperLogLog is properly working.
+    """
+
+    def test_uint64_bit_length(self):
+        values = np.array([0, 1, 2, 3, 255, 256, 2 ** 40 + 5, 2 ** 63,
+                           2 ** 64 - 1], dtype=np.uint64)
+        np.testing.assert_array_equal(
+            [int(value).bit_length() for value in values],
+            sketches._uint64_bit_length(values))
+
+    def test_error_rate(self):
+        for error_rate in [0, 0.001, 1]:
+            with self.assertRaisesRegex(ValueError, '`error_rate` must be a '
+                                                    'float between 0.00203125 '
+                                                    'and 1.'):
+                sketches.HyperLogLog(error_rate=error_rate)
+
+        # memory is fixed by the error rate, up to the min error rate
+        self.assertEqual(2 ** 14, len(sketches.HyperLogLog(0.01)._registers))
+        self.assertEqual(2 ** 9, len(sketches.HyperLogLog(0.05)._registers))
+        self.assertEqual(2 ** 18, len(sketches.HyperLogLog(
+            sketches.HyperLogLog.min_error_rate)._registers))
+
+    def test_count(self):
+        sketch = sketches.HyperLogLog(error_rate=0.01)
+        self.assertEqual(0, sketch.count)
+
+        # small counts are exact with linear counting
+        sketch.update(get_hashes(list(range(10)) * 2))
+        self.assertEqual(10, sketch.count)
+
+        sketch = sketches.HyperLogLog(error_rate=0.01)
+        sketch.update(get_hashes(np.arange(200000)))
+        self.assertAlmostEqual(200000, sketch.count, delta=200000 * 0.03)
+
+    def test_add(self):
+        hashes = get_hashes(np.arange(100000))
+        sketch1 = sketches.HyperLogLog(error_rate=0.01)
+        sketch1.update(hashes[:60000])
+        sketch2 = sketches.HyperLogLog(error_rate=0.01)
+        sketch2.update(hashes[40000:])
+        sketch = sketches.HyperLogLog(error_rate=0.01)
+        sketch.update(hashes)
+
+        # merging is lossless compared to a single sketch
+        merged_sketch = sketch1 + sketch2
+        np.testing.assert_array_equal(sketch._registers,
+                                      merged_sketch._registers)
+        self.assertAlmostEqual(100000, merged_sketch.count,
+                               delta=100000 * 0.03)
+
+        with self.assertRaisesRegex(ValueError, 'HyperLogLog sketches with '
+                                                'different error rates cannot '
+                                                'be added together.'):
+            sketch1 + sketches.HyperLogLog(error_rate=0.05)
+
+
+class TestKLLSketch(unittest.TestCase):
+    """
+    Validates sketches.KLLSketch is properly working.
+    """
+
+    @staticmethod
+    def get_rank_errors(sketch, values, quantiles):
+        sorted_values = np.sort(values)
+        estimates = sketch.get_quantiles(quantiles)
+        ranks = np.searchsorted(sorted_values, estimates) / len(values)
+        return np.abs(ranks - quantiles)
+
+    def test_error_rate(self):
+        with self.assertRaisesRegex(ValueError, '`error_rate` must be a float '
+                                                'between 0 and 1.'):
+            sketches.KLLSketch(error_rate=1)
+
+        self.assertEqual(341, sketches.KLLSketch(0.01)._k)
+        self.assertEqual(62, sketches.KLLSketch(0.05)._k)
+
+    def test_get_quantiles(self):
+        sketch = sketches.KLLSketch(error_rate=0.01)
+        self.assertIsNone(sketch.get_quantiles([0.5]))
+
+        # small streams are kept exactly
+        sketch.update([5, 1, 4, 2, 3])
+        self.assertEqual(5, sketch.count)
+        np.testing.assert_array_equal(
+            [1, 2, 3, 5], sketch.get_quantiles([0, 0.25, 0.5, 1]))
+
+        rng = np.random.RandomState(0)
+        values = rng.lognormal(size=200000)
+        sketch = sketches.KLLSketch(error_rate=0.01, seed=0)
+        for chunk in np.array_split(values, 20):
+            sketch.update(chunk)
+        sketch.update(np.array([]))
+        self.assertEqual(200000, sketch.count)
+
+        # memory is fixed by the error rate, while the weights of the
+        # retained values still sum to the number of values
+        num_retained = sum(len(items) for items in sketch._levels)
+        self.assertLessEqual(num_retained, 3 * sketch._k)
+        self.assertEqual(200000, sum(len(items) * 2 ** level for level, items
+                                     in enumerate(sketch._levels)))
+
+        quantiles = np.arange(1, 1000) / 1000
+        self.assertLessEqual(
+            self.get_rank_errors(sketch, values, quantiles).max(),
+            sketch.error_rate)
+
+        # the random compactions are reproducible with the seed
+        sketch2 = sketches.KLLSketch(error_rate=0.01, seed=0)
+        for chunk in np.array_split(values, 20):
+            sketch2.update(chunk)
+        np.testing.assert_array_equal(sketch.get_quantiles(quantiles),
+                                      sketch2.get_quantiles(quantiles))
+
+    def test_error_rate_bound(self):
+        # the error rate holds with a probability of 99%, hence for each seed
+        rng = np.random.RandomState(0)
+        values = rng.normal(size=20000)
+        quantiles = np.arange(1, 100) / 100
+        for error_rate in [0.01, 0.05]:
+            for seed in range(10):
+                sketch = sketches.KLLSketch(error_rate=error_rate, seed=seed)
+                sketch.update(values)
+                self.assertLessEqual(
+                    self.get_rank_errors(sketch, values, quantiles).max(),
+                    error_rate)
+
+    def test_add(self):
+        rng = np.random.RandomState(0)
+        values = rng.normal(size=100000)
+        sketch1 = sketches.KLLSketch(error_rate=0.01, seed=0)
+        sketch1.update(values[:30000])
+        sketch2 = sketches.KLLSketch(error_rate=0.01, seed=1)
+        sketch2.update(values[30000:])
+
+        merged_sketch = sketch1 + sketch2
+        self.assertEqual(100000, merged_sketch.count)
+        self.assertEqual(30000, sketch1.count)
+        num_retained = sum(len(items) for items in merged_sketch._levels)
+        self.assertLessEqual(num_retained, 3 * merged_sketch._k)
+        quantiles = np.arange(1, 100) / 100
+        self.assertLessEqual(
+            self.get_rank_errors(merged_sketch, values, quantiles).max(),
+            merged_sketch.error_rate)
+
+        with self.assertRaisesRegex(TypeError, '`KLLSketch` and `HyperLogLog` '
+                                               'are not of the same sketch '
+                                               'type.'):
+            sketch1 + sketches.HyperLogLog()
+        with self.assertRaisesRegex(ValueError, 'KLL sketches with different '
+                                                'error rates cannot be added '
+                                                'together.'):
+            sketch1 + sketches.KLLSketch(error_rate=0.05)
+
+    def test_save_and_load(self):
+        rng = np.random.RandomState(0)
+        values = rng.normal(size=10000)
+        sketch = sketches.KLLSketch(error_rate=0.05, seed=0)
+        sketch.update(values[:5000])
+
+        self.assertIsInstance(sketch.__getstate__()['_random_generator'], dict)
+        loaded_sketch = serialization.loads_profile(
+            serialization.dumps_profile(sketch))
+
+        # the loaded sketch continues with the same random compactions
+        sketch.update(values[5000:])
+        loaded_sketch.update(values[5000:])
+        self.assertEqual(len(sketch._levels), len(loaded_sketch._levels))
+        for level, loaded_level in zip(sketch._levels, loaded_sketch._levels):
+            np.testing.assert_array_equal(level, loaded_level)
+
+
+class TestMisraGries(unittest.TestCase):
+    """
+    Validates sketches.MisraGries is properly working.
+    """
+
+    def test_num_counters(self):
+        for num_counters in [0, 1.5, True]:
+            with self.assertRaisesRegex(ValueError, '`num_counters` must be a '
+                                                    'positive integer.'):
+                sketches.MisraGries(num_counters=num_counters)
+
+    def test_get_most_frequent(self):
+        sketch = sketches.MisraGries(num_counters=10)
+        self.assertDictEqual({}, sketch.get_most_frequent(3))
+
+        # few unique values are counted exactly
+        sketch.update(pd.Series(['b', 'a', 'b', 'c', 'b', 'a']))
+        sketch.update(pd.Series([], dtype=object))
+        self.assertEqual(6, sketch.count)
+        self.assertEqual(0, sketch.max_error)
+        self.assertDictEqual({'b': 3, 'a': 2},
+                             sketch.get_most_frequent(2))
+
+        rng = np.random.RandomState(0)
+        values = pd.Series(rng.zipf(1.5, size=100000) % 10000)
+        sketch = sketches.MisraGries(num_counters=100)
+        for chunk in np.array_split(values, 20):
+            sketch.update(chunk)
+        self.assertEqual(100000, sketch.count)
+        self.assertLessEqual(len(sketch._counts), 100)
+
+        # the counts are underestimated by at most count / (num_counters + 1)
+        true_counts = values.value_counts()
+        self.assertLessEqual(sketch.max_error, 100000 / 101)
+        most_frequent = sketch.get_most_frequent(5)
+        self.assertListEqual(true_counts.index[:5].tolist(),
+                             list(most_frequent))
+        for value, count in most_frequent.items():
+            self.assertLessEqual(count, true_counts[value])
+            self.assertGreaterEqual(count + sketch.max_error,
+                                    true_counts[value])
+
+    def test_add(self):
+        sketch1 = sketches.MisraGries(num_counters=10)
+        with self.assertRaisesRegex(TypeError, '`MisraGries` and `KLLSketch` '
+                                               'are not of the same sketch '
+                                               'type.'):
+            sketch1 + sketches.KLLSketch()
+        with self.assertRaisesRegex(ValueError, 'Misra-Gries sketches with '
+                                                'different numbers of counters '
+                                                'cannot be added together.'):
+            sketch1 + sketches.MisraGries(num_counters=20)
+
+        rng = np.random.RandomState(0)
+        values = pd.Series(rng.zipf(1.5, size=20000) % 1000)
+        sketch2 = sketches.MisraGries(num_counters=10)
+        sketch1.update(values[:5000])
+        sketch2.update(values[5000:])
+        merged_sketch = sketch1 + sketch2
+        self.assertEqual(20000, merged_sketch.count)
+        self.assertLessEqual(len(merged_sketch._counts), 10)
+        self.assertLessEqual(merged_sketch.max_error, 20000 / 11)
+
+        true_counts = values.value_counts()
+        for value, count in merged_sketch.get_most_frequent(3).items():
+            self.assertLessEqual(count, true_counts[value])
+            self.assertGreaterEqual(count + merged_sketch.max_error,
+                                    true_counts[value])
@@ -54,6 +54,39 @@ class TestTextColumnProfiler(unittest.TestCase):
         unique_vocab = dict.fromkeys(''.join(df.tolist())).keys()
         six.assertCountEqual(self, unique_vocab, text_profiler.vocab)
 
+    def test_profiled_vocab_count(self):
+        df1 = pd.Series(["abca", "", "ba", "é€"])
+        df2 = pd.Series(["\U0001F600a", "\ud800", "€"])
+
+        options = TextOptions()
+        options.vocab_count.is_enabled = True
+        text_profiler = TextColumn(df1.name, options=options)
+        text_profiler.update(df1)
+        self.assertListEqual(['a', 'b', 'c', 'é', '€'], text_profiler.vocab)
+        self.assertDictEqual({'a': 3, 'b': 2, 'c': 1, 'é': 1, '€': 1},
+                             text_profiler.vocab_count)
+
+        # characters beyond the basic multilingual plane and lone surrogates
+        text_profiler.update(df2)
+        self.assertListEqual(['a', 'b', 'c', 'é', '€', '\U0001F600', '\ud800'],
+                             text_profiler.vocab)
+        self.assertDictEqual(
+            {'a': 4, 'b': 2, 'c': 1, 'é': 1, '€': 2, '\U0001F600': 1,
+             '\ud800': 1},
+            text_profiler.profile['vocab_count'])
+
+        text_profiler2 = TextColumn(df2.name)
+        text_profiler2.update(df2)
+        self.assertNotIn('vocab_count', text_profiler2.profile)
+
+        text_profiler3 = text_profiler2 + text_profiler
+        self.assertListEqual(['\U0001F600', 'a', '\ud800', '€', 'b', 'c', 'é'],
+                             text_profiler3.vocab)
+        self.assertDictEqual(
+            {'a': 5, 'b': 2, 'c': 1, 'é': 1, '€': 3, '\U0001F600': 2,
+             '\ud800': 2},
+            text_profiler3.profile['vocab_count'])
+
     def test_profiled_str_numerics(self):
         """
         Checks whether the vocab list for the profiler is correct.
@@ -186,6 +219,8 @@ class TestTextColumnProfiler(unittest.TestCase):
             median=None,
             variance=14.0 / 9.0,
             stddev=np.sqrt(14.0 / 9.0),
+            skewness=45.0 / (14.0 * np.sqrt(14.0)),
+            kurtosis=-1251.0 / 1372.0,
             histogram={
                 'bin_counts': np.array([5, 0, 2, 0, 1, 2]),
                 'bin_edges': np.array([1., 1.5, 2., 2.5, 3., 3.5, 4.])
@@ -193,12 +228,12 @@ class TestTextColumnProfiler(unittest.TestCase):
             quantiles={0: 1.25, 1: 1.5, 2: 3.0},
             vocab=['a', 'b', 'c', 'd', '4', '3', '2', 'f'],
             times=defaultdict(float, {'vocab': 1.0,
-                                      'max': 1.0,
-                                      'min': 1.0,
-                                      'histogram_and_quantiles': 15.0,
-                                      'sum': 1.0,
-                                      'variance': 1.0})
+                                      'min': 0.25, 'max': 0.25, 'sum': 0.25,
+                                      'variance': 0.25,
+                                      'histogram_and_quantiles': 15.0})
         )
+        expected_profile['times'].update(
+            test_utils.get_histogram_method_times(1.0))
         time_array = [float(x) for x in range(30, 0, -1)]
         with mock.patch('time.time', side_effect=lambda: time_array.pop()):
             profiler.update(df)
@@ -207,6 +242,10 @@ class TestTextColumnProfiler(unittest.TestCase):
             expected_quantiles = expected_profile.pop('quantiles')
             quantiles = profile.pop('quantiles')
             histogram = profile.pop('histogram')
+            self.assertAlmostEqual(expected_profile.pop('skewness'),
+                                   profile.pop('skewness'))
+            self.assertAlmostEqual(expected_profile.pop('kurtosis'),
+                                   profile.pop('kurtosis'))
             # key and value populated correctly
             self.assertDictEqual(expected_profile, profile)
             self.assertTrue(np.all(
@@ -238,22 +277,20 @@ class TestTextColumnProfiler(unittest.TestCase):
             profile = profiler.profile
 
             expected = defaultdict(float,
-                                   {'max': 1.0,
-                                    'sum': 1.0,
-                                    'variance': 1.0,
+                                   {'max': 1/3, 'sum': 1/3, 'variance': 1/3,
                                     'histogram_and_quantiles': 15.0,
                                     'vocab': 1.0})
+            expected.update(test_utils.get_histogram_method_times(1.0))
             self.assertEqual(expected, profile['times'])
 
             # Validate time in datetime class has expected time after second
             # update
             profiler.update(df)
             expected = defaultdict(float,
-                                   {'max': 2.0,
-                                    'sum': 2.0,
-                                    'variance': 2.0,
+                                   {'max': 2/3, 'sum': 2/3, 'variance': 2/3,
                                     'histogram_and_quantiles': 30.0,
                                     'vocab': 2.0})
+            expected.update(test_utils.get_histogram_method_times(2.0))
             self.assertEqual(expected, profiler.profile['times'])
 
     def test_merge_profile(self):
@@ -102,3 +102,17 @@ def get_depth(od):
     if isinstance(od, dict):
         return 1 + (max(map(get_depth, od.values())) if od else 0)
     return 0
+
+
+def get_histogram_method_times(run_time):
+    """Function to get the times of each histogram bin method of a profile.
+
+    Parameters:
+        run_time (float): time of each bin method
+
+    Returns:
+        dict: times of the bin methods by their key in the profile times
+    """
+    return {'histogram_method_' + method: run_time
+            for method in ['auto', 'fd', 'doane', 'scott', 'rice', 'sturges',
+                           'sqrt']}